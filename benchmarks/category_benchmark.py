@@ -0,0 +1,81 @@
+"""Benchmark batched job categorization against the notebook's row-wise df.apply(categorize_job)
+
+Rows are drawn from a scrape output (title and job_function) and repeated up to --rows.
+
+Usage:
+    python benchmarks/category_benchmark.py
+    python benchmarks/category_benchmark.py --csv data/linkedin_jobs_20250101_000000.csv --rows 200000 --repeat 5
+"""
+from pathlib import Path
+import argparse
+import sys
+import time
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import pandas as pd  # noqa: E402
+import pyarrow as pa  # noqa: E402
+
+from job_categories import JobCategorizer, categorize_job  # noqa: E402
+
+# Used when the input has no job_function column (e.g. the older linkedin-jobs.csv export)
+SAMPLE_JOB_FUNCTIONS = [
+    "Information Technology", "Engineering and Information Technology", "Other", "Sales and Business Development",
+    "Quality Assurance", "Project Management", "Design, Art/Creative, and Information Technology", "nan"
+]
+
+
+def load_rows(path, rows):
+    """title/job_function DataFrame of `rows` rows, repeating the file's rows as needed"""
+    df = pd.read_csv(path)
+    if 'job_function' not in df.columns:
+        df['job_function'] = [SAMPLE_JOB_FUNCTIONS[i % len(SAMPLE_JOB_FUNCTIONS)] for i in range(len(df))]
+    df = df[['title', 'job_function']].dropna(subset=['title'])
+    df['job_function'] = df['job_function'].astype(object).map(str)
+    repeats = -(-rows // len(df))
+    return pd.concat([df] * repeats, ignore_index=True).head(rows)
+
+
+def _best(fn, repeat):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batched job categorization")
+    parser.add_argument("--csv", default=str(ROOT / 'data' / 'linkedin-jobs.csv'))
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    df = load_rows(args.csv, args.rows)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    categorizer = JobCategorizer()
+    print(f"{len(df)} rows, {len(categorizer.categories)} categories, {len(categorizer.matcher.groups)} keywords")
+
+    baseline, expected = _best(lambda: df.apply(categorize_job, axis=1), 1)
+    runs = {
+        'arrow regex, DataFrame': lambda: categorizer.categorize(df),
+        'arrow regex, Table': lambda: categorizer.categorize(table),
+        'automaton per row': lambda: [categorizer.categorize_text(f"{t} {f}".lower())
+                                      for t, f in zip(df['title'], df['job_function'])],
+    }
+
+    print(f"\ndf.apply(categorize_job)       : {baseline * 1000:8.1f} ms")
+    for name, fn in runs.items():
+        seconds, result = _best(fn, args.repeat)
+        result = result.to_pylist() if isinstance(result, pa.Array) else list(result)
+        mismatches = sum(a != b for a, b in zip(result, expected))
+        print(f"{name:<31}: {seconds * 1000:8.1f} ms  ({baseline / seconds:.1f}x)  mismatches: {mismatches}")
+
+    print(f"\n{expected.value_counts().to_string()}")
+
+
+if __name__ == "__main__":
+    main()
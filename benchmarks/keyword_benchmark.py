@@ -0,0 +1,90 @@
+"""Benchmark the IT keyword matcher against the original per-keyword substring scans
+
+Usage:
+    python benchmarks/keyword_benchmark.py
+    python benchmarks/keyword_benchmark.py --csv data/linkedin-jobs.csv --repeat 5
+"""
+from pathlib import Path
+import argparse
+import csv
+import sys
+import time
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from it_keywords import ALL_IT_KEYWORDS, IT_JOB_CATEGORIES, IT_PROFESSIONS, TECH_KEYWORDS  # noqa: E402
+from keyword_matcher import KeywordMatcher, ahocorasick  # noqa: E402
+
+
+def load_texts(path):
+    """Lower-cased title + description for every row, built the same way is_it_job does"""
+    texts = []
+    with open(path, encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
+            title = row.get('title') or ''
+            description = row.get('description')
+            texts.append(f"{title} {description}".lower() if description else title.lower())
+    return texts
+
+
+def naive_is_it_job(text):
+    """The original is_it_job loop"""
+    for keyword in ALL_IT_KEYWORDS:
+        if keyword in text:
+            return True
+    for profession in IT_PROFESSIONS:
+        if profession in text:
+            return True
+    return False
+
+
+def naive_find(text, keywords):
+    """Every keyword found by scanning the text once per keyword"""
+    return {keyword for keyword in keywords if keyword in text}
+
+
+def _best(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the IT keyword matcher")
+    parser.add_argument("--csv", default=str(ROOT / 'data' / 'linkedin-jobs.csv'))
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    texts = load_texts(args.csv)
+    groups = {**IT_JOB_CATEGORIES, 'tech': TECH_KEYWORDS, 'profession': IT_PROFESSIONS}
+    matchers = {'python': KeywordMatcher(groups, use_native=False)}
+    if ahocorasick is not None:
+        matchers['native'] = KeywordMatcher(groups)
+    all_keywords = set(matchers['python'].groups)
+
+    print(f"{len(texts)} texts, {sum(map(len, texts)) / 1024:.0f} KB, {len(all_keywords)} keywords")
+
+    # Correctness: same keyword sets and same is_it_job verdicts as the substring scans
+    expected = [naive_find(text, all_keywords) for text in texts]
+    for name, matcher in matchers.items():
+        mismatches = sum(matcher.find(text) != keywords for text, keywords in zip(texts, expected))
+        verdicts = sum(matcher.contains_any(text) != naive_is_it_job(text) for text in texts)
+        print(f"  {name:<7} keyword-set mismatches: {mismatches}, is_it_job mismatches: {verdicts}")
+
+    baseline_all = _best(lambda: [naive_find(text, all_keywords) for text in texts], args.repeat)
+    baseline_any = _best(lambda: [naive_is_it_job(text) for text in texts], args.repeat)
+    print(f"\nsubstring scans, all matches : {baseline_all * 1000:8.1f} ms")
+    print(f"substring scans, is_it_job   : {baseline_any * 1000:8.1f} ms")
+    for name, matcher in matchers.items():
+        seconds_all = _best(lambda: [matcher.match(text) for text in texts], args.repeat)
+        seconds_any = _best(lambda: [matcher.contains_any(text) for text in texts], args.repeat)
+        print(f"{name} automaton, all matches : {seconds_all * 1000:8.1f} ms  ({baseline_all / seconds_all:.1f}x)")
+        print(f"{name} automaton, is_it_job   : {seconds_any * 1000:8.1f} ms  ({baseline_any / seconds_any:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
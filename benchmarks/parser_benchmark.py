@@ -0,0 +1,286 @@
+"""Offline benchmark of the card and detail parsers over the captured pages in templates/
+
+Usage:
+    python benchmarks/parser_benchmark.py
+    python benchmarks/parser_benchmark.py --backends bs4 lxml --multiples 1 4 16 --repeat 5 --json bench.json
+
+Peak memory is measured as process RSS in a fresh subprocess per backend and size, since lxml
+builds its trees in libxml2's C heap, which Python-level tracing (tracemalloc) does not see.
+"""
+from pathlib import Path
+import argparse
+import ast
+import json
+import subprocess
+import sys
+import tempfile
+import time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from bs4 import BeautifulSoup  # noqa: E402
+from parsers import PARSERS, lxml  # noqa: E402
+import parsers  # noqa: E402
+
+TEMPLATES_DIR = ROOT / 'templates'
+SEARCH_FIXTURES = ['job_list.html', 'job-list.html']
+DETAIL_FIXTURES = ['job.html']
+
+
+def load_fixture(name):
+    """Read a captured page; some were saved as a Python bytes literal (b'...') rather than raw HTML"""
+    text = (TEMPLATES_DIR / name).read_text(encoding='utf-8')
+    if text.startswith(("b'", 'b"')):
+        text = ast.literal_eval(text).decode('utf-8')
+    return text
+
+
+def synthetic_page(html, multiple):
+    """Scale a page up by repeating its body, so card counts grow with the multiple"""
+    if multiple == 1:
+        return html
+    start = html.find('<body')
+    end = html.rfind('</body>')
+    if start == -1 or end == -1:
+        return html * multiple
+    body = html[start:end]
+    return html[:start] + body * multiple + html[end:]
+
+
+# Field-level extractors per backend, timed one by one over already-parsed trees
+def _soup_tree(html):
+    return BeautifulSoup(html, 'html.parser')
+
+
+def _lxml_tree(html):
+    return lxml.html.fromstring(html)
+
+
+FIELD_EXTRACTORS = {
+    'bs4': {
+        'tree': _soup_tree,
+        'cards': lambda tree: tree.find_all("div", {"class": "base-card"}),
+        'card_fields': {
+            'job_url': lambda card: card.find("a", {"class": "base-card__full-link"}),
+            'title': lambda card: card.find("h3", {"class": "base-search-card__title"}),
+            'company': lambda card: card.find("h4", {"class": "base-search-card__subtitle"}),
+            'location': lambda card: card.find("span", {"class": "job-search-card__location"}),
+            'posted_date': lambda card: card.find("time")
+        },
+        'detail_fields': {
+            'description': lambda tree: tree.find("div", {"class": "show-more-less-html__markup"}),
+            'criteria': lambda tree: tree.find("ul", {"class": "description__job-criteria-list"})
+        }
+    },
+    'lxml': {
+        'tree': _lxml_tree,
+        'cards': lambda tree: tree.xpath(parsers.class_xpath("div", "base-card")),
+        'card_fields': {
+            'job_url': lambda card: parsers.first_by_class(card, "a", "base-card__full-link"),
+            'title': lambda card: parsers.first_by_class(card, "h3", "base-search-card__title"),
+            'company': lambda card: parsers.first_by_class(card, "h4", "base-search-card__subtitle"),
+            'location': lambda card: parsers.first_by_class(card, "span", "job-search-card__location"),
+            'posted_date': lambda card: card.xpath(".//time")
+        },
+        'detail_fields': {
+            'description': lambda tree: parsers.first_by_class(tree, "div", "show-more-less-html__markup"),
+            'criteria': lambda tree: parsers.first_by_class(tree, "ul", "description__job-criteria-list")
+        }
+    }
+}
+
+
+def _timed(fn, repeat):
+    """Run fn repeat times and return (best seconds, last result)"""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _peak_rss():
+    """Peak resident set size of this process in bytes, or None where it cannot be read"""
+    try:
+        # Linux: VmHWM starts afresh at exec, while ru_maxrss keeps the parent's peak
+        with open('/proc/self/status', encoding='ascii') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports kilobytes, macOS bytes
+        return peak if sys.platform == 'darwin' else peak * 1024
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return getattr(psutil.Process().memory_info(), 'peak_wset', None)
+
+
+def measure_rss(backend, pages_dir):
+    """Run in a fresh process: parse every page in pages_dir once and return peak RSS before and during parsing"""
+    pages_dir = Path(pages_dir)
+    search_pages = [path.read_text(encoding='utf-8') for path in sorted(pages_dir.glob('search*.html'))]
+    detail_pages = [path.read_text(encoding='utf-8') for path in sorted(pages_dir.glob('detail*.html'))]
+    parser = PARSERS[backend]()
+    _reset_peak_rss()
+    baseline = _peak_rss()
+    results = (
+        [parser.parse_cards(html, 'bench', 'bench') for html in search_pages],
+        [parser.parse_details(html) for html in detail_pages]
+    )
+    peak = _peak_rss()
+    del results
+    return {'baseline': baseline, 'peak': peak}
+
+
+def _reset_peak_rss():
+    """Lower the recorded peak to the current RSS where the OS allows it (Linux 4.0+)"""
+    try:
+        with open('/proc/self/clear_refs', 'w', encoding='ascii') as f:
+            f.write('5')
+    except OSError:
+        pass
+
+
+def _subprocess_rss(backend, search_pages, detail_pages):
+    """measure_rss() in a new interpreter, so neither backend's earlier allocations raise the high-water mark
+
+    The pages are handed over as plain HTML files: decoding the bytes-literal fixtures would
+    itself set a higher peak than parsing.
+    """
+    with tempfile.TemporaryDirectory() as pages_dir:
+        for prefix, pages in (('search', search_pages), ('detail', detail_pages)):
+            for index, html in enumerate(pages):
+                Path(pages_dir, f"{prefix}{index:03d}.html").write_text(html, encoding='utf-8')
+        completed = subprocess.run(
+            [sys.executable, __file__, '--rss-child', backend, pages_dir],
+            capture_output=True, text=True, check=True
+        )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def bench_backend(backend, search_pages, detail_pages, repeat):
+    """Benchmark one backend over the given pages and return a result dict"""
+    parser = PARSERS[backend]()
+    extractors = FIELD_EXTRACTORS[backend]
+
+    search_seconds, cards = _timed(
+        lambda: [parser.parse_cards(html, 'bench', 'bench') for html in search_pages], repeat
+    )
+    detail_seconds, _ = _timed(lambda: [parser.parse_details(html) for html in detail_pages], repeat)
+    n_cards = sum(len(page_cards) for page_cards in cards)
+
+    # Tree building vs. per-field lookups
+    tree_seconds, trees = _timed(lambda: [extractors['tree'](html) for html in search_pages], repeat)
+    card_nodes = [card for tree in trees for card in extractors['cards'](tree)]
+    field_seconds = {}
+    for field, extract in extractors['card_fields'].items():
+        field_seconds[field], _ = _timed(lambda: [extract(card) for card in card_nodes], repeat)
+    detail_trees = [extractors['tree'](html) for html in detail_pages]
+    for field, extract in extractors['detail_fields'].items():
+        field_seconds[field], _ = _timed(lambda: [extract(tree) for tree in detail_trees], repeat)
+
+    rss = _subprocess_rss(backend, search_pages, detail_pages)
+    megabytes = 1024 * 1024
+
+    return {
+        'backend': backend,
+        'search_pages': len(search_pages),
+        'detail_pages': len(detail_pages),
+        'cards': n_cards,
+        'search_pages_per_sec': len(search_pages) / search_seconds,
+        'cards_per_sec': n_cards / search_seconds,
+        'detail_pages_per_sec': len(detail_pages) / detail_seconds,
+        'tree_build_ms': tree_seconds * 1000,
+        'field_ms': {field: seconds * 1000 for field, seconds in field_seconds.items()},
+        # Peak RSS of a process that parsed every page once, and how much parsing added to its startup peak
+        'peak_rss_mb': rss['peak'] / megabytes if rss['peak'] is not None else None,
+        'parse_rss_mb': (rss['peak'] - rss['baseline']) / megabytes if rss['peak'] is not None else None
+    }
+
+
+def check_parity(backends, search_html, detail_html):
+    """Compare every backend with the BeautifulSoup reference; return the list of mismatches"""
+    reference = PARSERS['bs4']()
+    expected_cards = [reference.parse_cards(html, 'bench', 'bench') for html in search_html]
+    expected_details = [reference.parse_details(html) for html in detail_html]
+    mismatches = []
+    for backend in backends:
+        parser = PARSERS[backend]()
+        for name, html, expected in zip(SEARCH_FIXTURES, search_html, expected_cards):
+            if parser.parse_cards(html, 'bench', 'bench') != expected:
+                mismatches.append(f"{backend}: cards differ on {name}")
+        for name, html, expected in zip(DETAIL_FIXTURES, detail_html, expected_details):
+            if parser.parse_details(html) != expected:
+                mismatches.append(f"{backend}: details differ on {name}")
+    return mismatches
+
+
+def print_result(result, multiple):
+    print(f"\n[{result['backend']}] x{multiple}: {result['search_pages']} search pages, "
+          f"{result['cards']} cards, {result['detail_pages']} detail pages")
+    print(f"  search pages/sec : {result['search_pages_per_sec']:.1f}")
+    print(f"  cards/sec        : {result['cards_per_sec']:.0f}")
+    print(f"  detail pages/sec : {result['detail_pages_per_sec']:.1f}")
+    if result['peak_rss_mb'] is not None:
+        print(f"  peak RSS         : {result['peak_rss_mb']:.1f} MB ({result['parse_rss_mb']:+.1f} MB while parsing)")
+    else:
+        print("  peak RSS         : n/a (needs the resource module or psutil)")
+    print(f"  tree build       : {result['tree_build_ms']:.2f} ms")
+    for field, ms in result['field_ms'].items():
+        print(f"  field {field:<11}: {ms:.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parser backends on the captured LinkedIn pages")
+    parser.add_argument("--backends", nargs='+', default=sorted(PARSERS), choices=sorted(PARSERS))
+    parser.add_argument("--multiples", nargs='+', type=int, default=[1, 4],
+                        help="synthetic size multiples of each fixture")
+    parser.add_argument("--repeat", type=int, default=3, help="timing repeats; the best run is reported")
+    parser.add_argument("--json", help="also write the results to this JSON file")
+    parser.add_argument("--rss-child", nargs=2, metavar=("BACKEND", "PAGES_DIR"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.rss_child:
+        print(json.dumps(measure_rss(*args.rss_child)))
+        return
+
+    backends = [b for b in args.backends if b != 'lxml' or lxml is not None]
+    search_html = [load_fixture(name) for name in SEARCH_FIXTURES]
+    detail_html = [load_fixture(name) for name in DETAIL_FIXTURES]
+
+    mismatches = check_parity(backends, search_html, detail_html)
+    for mismatch in mismatches:
+        print(f"PARITY FAILURE {mismatch}")
+
+    results = []
+    for multiple in args.multiples:
+        search_pages = [synthetic_page(html, multiple) for html in search_html]
+        detail_pages = [synthetic_page(html, multiple) for html in detail_html]
+        for backend in backends:
+            result = bench_backend(backend, search_pages, detail_pages, args.repeat)
+            result['multiple'] = multiple
+            print_result(result, multiple)
+            results.append(result)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
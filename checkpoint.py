@@ -0,0 +1,89 @@
+from pathlib import Path
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT_PATH = Path('data') / 'scrape_checkpoint.json'
+
+
+class Checkpoint:
+    """Durable record of which search pages are done and which rows were written"""
+
+    def __init__(self, path=DEFAULT_CHECKPOINT_PATH, output_file=None, params=None):
+        self.path = Path(path)
+        self.output_file = str(output_file) if output_file else None
+        self.params = params or {}
+        self.finished = False
+        self._done_pages = set()
+        self._written = set()
+        # Rows saved before the run was interrupted; only these are skipped on resume
+        self._written_before_resume = frozenset()
+        # Pages whose rows may still sit in an unsaved batch
+        self._pending_pages = []
+
+    @classmethod
+    def load(cls, path=DEFAULT_CHECKPOINT_PATH):
+        """Load an unfinished checkpoint, or return None if there is nothing to resume"""
+        path = Path(path)
+        if not path.exists():
+            return None
+        try:
+            with open(path, encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error("Could not read checkpoint %s: %s", path, e)
+            return None
+        if state.get("finished"):
+            return None
+
+        checkpoint = cls(path, state.get("output_file"), state.get("params"))
+        checkpoint._done_pages = {tuple(page) for page in state.get("done_pages", [])}
+        checkpoint._written = {tuple(row) for row in state.get("written", [])}
+        checkpoint._written_before_resume = frozenset(checkpoint._written)
+        logger.info(
+            "Resuming from %s: %d pages done, %d rows already in %s",
+            path, len(checkpoint._done_pages), len(checkpoint._written), checkpoint.output_file
+        )
+        return checkpoint
+
+    def is_page_done(self, sort_method, time_filter, start):
+        return (sort_method, time_filter, start) in self._done_pages
+
+    def is_written(self, job_id, sort_method, time_filter):
+        return (job_id, sort_method, time_filter) in self._written_before_resume
+
+    def page_done(self, sort_method, time_filter, start):
+        """Mark a page as scraped; it becomes durable on the next commit()"""
+        self._pending_pages.append((sort_method, time_filter, start))
+
+    def commit(self, saved_rows=()):
+        """Record rows that were just saved, promote pending pages and write the checkpoint"""
+        for row in saved_rows:
+            self._written.add((row["job_id"], row["sort_method"], row["time_filter"]))
+        self._done_pages.update(self._pending_pages)
+        self._pending_pages = []
+        self._save()
+
+    def finish(self):
+        """Mark the run as complete so a later --resume starts afresh"""
+        self.finished = True
+        self.commit()
+
+    def _save(self):
+        state = {
+            "output_file": self.output_file,
+            "params": self.params,
+            "finished": self.finished,
+            "done_pages": sorted(self._done_pages),
+            "written": sorted(self._written)
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file and swap it in so a crash never leaves a half-written checkpoint
+        tmp_path = self.path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,167 @@
+import logging
+import threading
+import time
+
+from metrics import METRICS
+
+logger = logging.getLogger(__name__)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+# Per-endpoint breaker settings. A blocking breaker pauses callers until its probe time (search
+# pagination cannot skip ahead); a non-blocking one fails fast so detail fetches can be retried later.
+BREAKER_SETTINGS = {
+    'search': {'failure_threshold': 5, 'reset_timeout': 60, 'block': True},
+    'detail': {'failure_threshold': 5, 'reset_timeout': 30, 'block': False}
+}
+
+# Upper bound for the open period, which doubles after every failed probe
+MAX_RESET_TIMEOUT = 600
+
+# Times a card is re-queued after transient detail failures before it is saved without details
+DEFAULT_MAX_DETAIL_RETRIES = 3
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while an endpoint's circuit is open"""
+
+
+class CircuitBreaker:
+    """Stops traffic to an endpoint after consecutive failures and lets a single probe test recovery
+
+    closed -> open after failure_threshold consecutive failures; open -> half-open once
+    reset_timeout has passed, letting one probe request through; the probe's result closes the
+    circuit again or reopens it with a doubled timeout.
+    """
+
+    def __init__(self, name, failure_threshold=5, reset_timeout=30, block=False, max_reset_timeout=MAX_RESET_TIMEOUT):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.base_reset_timeout = reset_timeout
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self.block = block
+        self.state = CLOSED
+        self.failures = 0
+        self.times_opened = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_request(self):
+        """Return when a request may be sent; raises CircuitOpenError (or waits, if blocking) while open"""
+        while True:
+            with self._lock:
+                if self.state == CLOSED:
+                    return
+                if not self._probe_in_flight and time.monotonic() >= self._opened_at + self.reset_timeout:
+                    self.state = HALF_OPEN
+                    self._probe_in_flight = True
+                    logger.info("%s circuit half-open, sending a probe request", self.name, extra={"endpoint": self.name})
+                    return
+                wait = max(0.5, self._opened_at + self.reset_timeout - time.monotonic())
+            if not self.block:
+                METRICS.inc("circuit_rejected_total", endpoint=self.name)
+                raise CircuitOpenError(f"{self.name} circuit is open")
+            time.sleep(min(wait, 5))
+
+    def record_success(self):
+        with self._lock:
+            if self.state != CLOSED:
+                logger.info("%s circuit closed", self.name, extra={"endpoint": self.name})
+            self.state = CLOSED
+            self.failures = 0
+            self.reset_timeout = self.base_reset_timeout
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN:
+                # Failed probe: stay away for longer
+                self.reset_timeout = min(self.max_reset_timeout, self.reset_timeout * 2)
+                self._open()
+            elif self.state == CLOSED and self.failures >= self.failure_threshold:
+                self._open()
+
+    def seconds_until_probe(self):
+        with self._lock:
+            if self.state == CLOSED:
+                return 0.0
+            return max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+
+    def _open(self):
+        self.state = OPEN
+        self.times_opened += 1
+        self._opened_at = time.monotonic()
+        self._probe_in_flight = False
+        METRICS.inc("circuit_opened_total", endpoint=self.name)
+        logger.warning(
+            "%s circuit open after %d consecutive failures, pausing for %ds",
+            self.name, self.failures, self.reset_timeout, extra={"endpoint": self.name}
+        )
+
+
+class RetryQueue:
+    """Cards whose detail fetch failed transiently, held back until the detail circuit closes"""
+
+    def __init__(self, max_attempts=DEFAULT_MAX_DETAIL_RETRIES):
+        self.max_attempts = max_attempts
+        self.retrying = True
+        self._lock = threading.Lock()
+        # job_id -> whether the failure cost a request (False when the open circuit turned it away)
+        self._failed = {}
+        self._parked = []
+        self._attempts = {}
+        self.parked_total = 0
+        self.exhausted = 0
+
+    def mark_failed(self, job_id, attempted=True):
+        """Note that job_id's detail fetch just failed with a retryable error"""
+        with self._lock:
+            self._failed[job_id] = attempted
+
+    def park_if_failed(self, job_data):
+        """Queue the card for another detail fetch if its last one failed; False if it did not fail
+        or has used up its retries
+
+        Only failed requests use up retries; fetches turned away by the open circuit do not.
+        """
+        with self._lock:
+            attempted = self._failed.pop(job_data["job_id"], None)
+            if attempted is None:
+                return False
+            attempts = self._attempts.get(job_data["job_id"], 0) + attempted
+            if not self.retrying or attempts > self.max_attempts:
+                self.exhausted += 1
+                return False
+            self._attempts[job_data["job_id"]] = attempts
+            self._parked.append(dict(job_data))
+            self.parked_total += 1
+            return True
+
+    def requeue(self, cards):
+        """Put drained cards back without using up one of their retries"""
+        with self._lock:
+            self._parked.extend(cards)
+
+    def give_up(self):
+        """Stop parking cards; the ones still waiting are saved without details"""
+        with self._lock:
+            self.retrying = False
+
+    def drain(self):
+        """Remove and return every parked card"""
+        with self._lock:
+            parked, self._parked = self._parked, []
+            return parked
+
+    def stats(self):
+        with self._lock:
+            return {"waiting": len(self._parked), "parked": self.parked_total, "exhausted": self.exhausted}
+
+    def __len__(self):
+        with self._lock:
+            return len(self._parked)
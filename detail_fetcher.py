@@ -0,0 +1,57 @@
+from concurrent.futures import ThreadPoolExecutor
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Number of detail pages fetched in parallel for one page of search results
+DEFAULT_DETAIL_WORKERS = 5
+
+
+def fetch_details_concurrently(job_ids, fetch_fn, max_workers=DEFAULT_DETAIL_WORKERS):
+    """Fetch job details for a page of cards in parallel, keeping the input order"""
+    job_ids = list(job_ids)
+    if not job_ids:
+        return []
+
+    max_workers = max(1, min(max_workers, len(job_ids)))
+    if max_workers == 1:
+        return [_safe_fetch(fetch_fn, job_id) for job_id in job_ids]
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="detail") as pool:
+        # map() yields results in submission order, so rows stay aligned with cards
+        return list(pool.map(lambda job_id: _safe_fetch(fetch_fn, job_id), job_ids))
+
+
+def _safe_fetch(fetch_fn, job_id):
+    """Run one detail fetch, turning unexpected errors into an empty result"""
+    try:
+        return fetch_fn(job_id) or {}
+    except Exception as e:
+        logger.error("Error fetching details for job %s: %s", job_id, e, extra={"job_id": job_id})
+        return {}
+
+
+def fetch_page_details(job_ids, fetch_fn, max_workers=DEFAULT_DETAIL_WORKERS, job_index=None):
+    """Fetch details for a page of job_ids, skipping ids already fetched earlier in the run"""
+    job_ids = list(job_ids)
+    if job_index is None:
+        return fetch_details_concurrently(job_ids, fetch_fn, max_workers)
+
+    results = {}
+    to_fetch = []
+    for job_id in job_ids:
+        if job_id in results or job_id in to_fetch:
+            continue
+        details = job_index.get_details(job_id)
+        if details is not None:
+            results[job_id] = details
+        else:
+            to_fetch.append(job_id)
+
+    for job_id, details in zip(to_fetch, fetch_details_concurrently(to_fetch, fetch_fn, max_workers)):
+        # Failed fetches are not cached so a later combination can try again
+        if details:
+            job_index.add(job_id, details)
+        results[job_id] = details
+
+    return [dict(results[job_id]) for job_id in job_ids]
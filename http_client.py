@@ -0,0 +1,110 @@
+import logging
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from metrics import METRICS
+
+logger = logging.getLogger(__name__)
+
+# Connection pool defaults (one pool per host, several sockets per pool)
+DEFAULT_POOL_CONNECTIONS = 4
+DEFAULT_POOL_MAXSIZE = 10
+
+# (connect, read) timeouts in seconds
+DEFAULT_TIMEOUT = (5, 20)
+
+
+class HttpClient:
+    """Shared HTTP client that reuses keep-alive connections across requests"""
+
+    def __init__(self, headers_fn=None, pool_connections=DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize=DEFAULT_POOL_MAXSIZE, timeout=DEFAULT_TIMEOUT):
+        self.headers_fn = headers_fn
+        self.timeout = timeout
+
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._connections_opened = 0
+        self._bytes_received = 0
+
+        self.session = requests.Session()
+        adapter = _CountingAdapter(
+            self._on_new_connection,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=True
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def get(self, url, **kwargs):
+        """Send a GET request with freshly rotated headers over a pooled connection"""
+        headers = self.headers_fn() if self.headers_fn else {}
+        headers.update(kwargs.pop("headers", None) or {})
+        kwargs.setdefault("timeout", self.timeout)
+
+        response = self.session.get(url, headers=headers, **kwargs)
+
+        # raw.tell() counts bytes read off the wire (before decompression)
+        received = response.raw.tell() if response.raw is not None else 0
+        received = received or len(response.content)
+        with self._lock:
+            self._requests += 1
+            self._bytes_received += received
+        METRICS.inc("http_bytes_received_total", received)
+        return response
+
+    def stats(self):
+        """Return connection reuse and traffic counters"""
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "connections_opened": self._connections_opened,
+                "connections_reused": max(0, self._requests - self._connections_opened),
+                "bytes_received": self._bytes_received
+            }
+
+    def log_stats(self):
+        """Log the current connection counters"""
+        stats = self.stats()
+        logger.info(
+            "HTTP: %d requests, %d connections opened, %d reused, %d bytes received",
+            stats['requests'], stats['connections_opened'], stats['connections_reused'], stats['bytes_received']
+        )
+
+    def close(self):
+        """Close all pooled connections"""
+        self.session.close()
+
+    def _on_new_connection(self):
+        with self._lock:
+            self._connections_opened += 1
+
+
+class _CountingAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools report every new socket they open"""
+
+    def __init__(self, on_new_connection, **kwargs):
+        self._on_new_connection = on_new_connection
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _counting_pool(HTTPConnectionPool, self._on_new_connection),
+            "https": _counting_pool(HTTPSConnectionPool, self._on_new_connection)
+        }
+
+
+def _counting_pool(pool_cls, on_new_connection):
+    """Build a connection pool class that calls on_new_connection for each new socket"""
+
+    class CountingPool(pool_cls):
+        def _new_conn(self):
+            on_new_connection()
+            return super()._new_conn()
+
+    return CountingPool
@@ -0,0 +1,59 @@
+from pathlib import Path
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Incremental runs only walk the newest postings: most recent first, posted in the last 24 hours
+INCREMENTAL_SORT = 'recent'
+INCREMENTAL_FILTER = '24h'
+
+# LinkedIn serves at most 40 pages of 25 cards for one search
+DEFAULT_MAX_PAGES = 40
+
+# Every job_id whose details were fetched, including the non-IT ones the store never keeps
+DEFAULT_SEEN_INDEX_PATH = Path('data') / 'seen_job_ids.txt'
+
+PAGE_ALL_KNOWN = 'page made up entirely of known job ids'
+PASSED_HIGH_WATER_MARK = 'passed the stored high-water-mark posted_date'
+
+
+class NewPostingsCursor:
+    """Picks the unseen cards from pages of recent-sorted results and says when to stop paginating"""
+
+    def __init__(self, known_ids=(), high_water_mark=None, job_index=None):
+        self.known_ids = set(known_ids)
+        self.high_water_mark = high_water_mark
+        self.job_index = job_index
+        self.stop_reason = None
+        self.seen_again = []
+
+    @classmethod
+    def from_store(cls, store, job_index=None):
+        """Cursor over everything already in a JobStore (and a persistent JobIndex, if given)"""
+        cursor = cls(store.known_job_ids(), store.max_posted_date(), job_index)
+        logger.info(
+            "Incremental scrape: %s known jobs, high-water mark %s", len(cursor.known_ids), cursor.high_water_mark
+        )
+        return cursor
+
+    def is_known(self, job_id):
+        return job_id in self.known_ids or (self.job_index is not None and self.job_index.is_known(job_id))
+
+    def new_cards(self, cards_data):
+        """Cards not seen before and not older than the high-water mark; sets stop_reason once paging can end"""
+        self.seen_again = [job_data["job_id"] for job_data in cards_data if job_data["job_id"] in self.known_ids]
+        fresh = [job_data for job_data in cards_data if not self.is_known(job_data["job_id"])]
+        if not fresh:
+            self.stop_reason = PAGE_ALL_KNOWN
+            return []
+
+        if self.high_water_mark:
+            # posted_date is an ISO date, so string comparison orders it; same-day postings may still be new
+            older = [job_data for job_data in fresh
+                     if job_data.get("posted_date") and job_data["posted_date"] < self.high_water_mark]
+            if older:
+                self.stop_reason = PASSED_HIGH_WATER_MARK
+                fresh = [job_data for job_data in fresh if job_data not in older]
+
+        self.known_ids.update(job_data["job_id"] for job_data in fresh)
+        return fresh
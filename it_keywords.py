@@ -0,0 +1,205 @@
+from keyword_matcher import KeywordMatcher
+
+# IT job titles and keywords, categorized by job type
+IT_JOB_CATEGORIES = {
+    'software_development': [
+        'software developer', 'software engineer', 'programmer', 'coder', 'full stack', 'frontend',
+        'backend', 'mobile developer', 'ios developer', 'android developer', 'web developer',
+        'javascript developer', 'python developer', 'java developer', 'php developer', 'ruby developer',
+        '.net developer', 'c# developer', 'c++ developer', 'scala developer', 'go developer', 'golang',
+        'react developer', 'angular developer', 'vue developer', 'node.js developer', 'typescript',
+        'flutter developer', 'kotlin developer', 'swift developer', 'rust developer', 'elm developer',
+        'clojure developer', 'haskell developer', 'elixir developer', 'erlang developer'
+    ],
+    'data_science': [
+        'data scientist', 'data analyst', 'business intelligence', 'bi developer', 'machine learning',
+        'ml engineer', 'ai engineer', 'artificial intelligence', 'nlp', 'natural language processing',
+        'computer vision', 'deep learning', 'statistical analyst', 'big data', 'data engineer',
+        'data architect', 'etl developer', 'analytics', 'data mining', 'predictive modeling',
+        'tableau developer', 'power bi developer', 'data visualization', 'statistician', 'r developer'
+    ],
+    'cloud_devops': [
+        'cloud engineer', 'cloud architect', 'devops engineer', 'site reliability engineer', 'sre',
+        'infrastructure engineer', 'aws', 'azure', 'gcp', 'google cloud', 'cloud native', 'kubernetes',
+        'docker', 'containerization', 'ci/cd', 'jenkins', 'terraform', 'ansible', 'chef', 'puppet',
+        'microservices', 'service mesh', 'cloud migration', 'cloud optimization', 'cloud security'
+    ],
+    'cybersecurity': [
+        'security engineer', 'security analyst', 'cybersecurity', 'cyber security', 'information security',
+        'infosec', 'penetration tester', 'pen tester', 'ethical hacker', 'security consultant',
+        'security architect', 'security administrator', 'security operations', 'soc analyst',
+        'threat intelligence', 'vulnerability assessment', 'devsecops', 'security compliance',
+        'security auditor', 'cryptography', 'encryption', 'risk management', 'threat modeling'
+    ],
+    'network_systems': [
+        'network engineer', 'network administrator', 'systems administrator', 'sysadmin', 'systems engineer',
+        'network architect', 'network security', 'cisco', 'juniper', 'ccna', 'ccnp', 'ccie',
+        'telecommunications', 'voip', 'wan', 'lan', 'virtualization', 'vmware', 'hyper-v',
+        'storage administrator', 'backup administrator', 'datacenter'
+    ],
+    'database': [
+        'database administrator', 'dba', 'database developer', 'database architect', 'sql developer',
+        'oracle developer', 'mysql developer', 'postgresql developer', 'mongodb developer', 'nosql',
+        'sql server', 'oracle', 'mysql', 'postgresql', 'mongodb', 'cassandra', 'redis', 'elasticsearch',
+        'database engineer', 'database security', 'data modeling', 'data warehousing'
+    ],
+    'management_analysis': [
+        'it project manager', 'technical project manager', 'it manager', 'scrum master', 'agile coach',
+        'product manager', 'product owner', 'it director', 'vp of engineering', 'cto', 'cio',
+        'technical program manager', 'technology officer', 'it coordinator', 'business analyst',
+        'systems analyst', 'technology analyst', 'it consultant', 'solutions architect', 'enterprise architect'
+    ],
+    'qa_testing': [
+        'qa engineer', 'quality assurance', 'test engineer', 'software tester', 'test analyst',
+        'automation engineer', 'manual tester', 'test lead', 'quality engineer', 'test manager',
+        'performance tester', 'load tester', 'security tester', 'test architect', 'qa analyst',
+        'automation tester', 'selenium', 'appium', 'cypress', 'playwright', 'test automation'
+    ],
+    'support_helpdesk': [
+        'it support', 'technical support', 'help desk', 'helpdesk', 'desktop support', 'service desk',
+        'it technician', 'computer technician', 'support specialist', 'it support specialist',
+        'support analyst', 'it support analyst', 'field technician', 'tier 1 support', 'tier 2 support',
+        'tier 3 support', 'end user support', 'it support engineer'
+    ],
+    'ui_ux': [
+        'ui designer', 'ux designer', 'ui/ux designer', 'user interface', 'user experience',
+        'ux researcher', 'interaction designer', 'visual designer', 'product designer', 'web designer',
+        'mobile designer', 'ui developer', 'frontend designer', 'ux writer', 'information architect',
+        'usability specialist', 'ui architect', 'ux architect', 'ux manager'
+    ],
+    'emerging_tech': [
+        'blockchain developer', 'blockchain engineer', 'ar developer', 'vr developer', 'xr developer',
+        'augmented reality', 'virtual reality', 'game developer', 'unity developer', 'unreal developer',
+        'iot developer', 'internet of things', 'embedded systems', 'firmware engineer', 'robotic engineer',
+        'quantum computing', 'edge computing', '5g', 'crypto', 'metaverse', 'digital twin'
+    ]
+}
+
+# Flatten the categories into a single list of IT keywords
+IT_KEYWORDS = [keyword for category in IT_JOB_CATEGORIES.values() for keyword in category]
+
+# Also include individual tech keywords that might appear in job titles or descriptions
+TECH_KEYWORDS = [
+    'python', 'java', 'javascript', 'js', 'html', 'css', 'sql', 'nosql', 'aws', 'azure', 'gcp',
+    'react', 'angular', 'vue', 'node', 'express', 'django', 'flask', 'spring', 'hibernate',
+    'kubernetes', 'docker', 'jenkins', 'gitlab', 'github', 'git', 'terraform', 'ansible', 'chef',
+    'hadoop', 'spark', 'kafka', 'elasticsearch', 'redis', 'mongodb', 'postgresql', 'mysql', 'oracle',
+    'cybersecurity', 'networking', 'linux', 'unix', 'windows', 'cisco', 'juniper', 'firebase',
+    'serverless', 'microservices', 'api', 'rest', 'graphql', 'oauth', 'saml', 'sso', 'ldap',
+    'active directory', 'jira', 'confluence', 'slack', 'teams', 'sap', 'tableau', 'power bi',
+    'excel', 'sharepoint', 'servicenow', 'salesforce', 'dynamics', 'wordpress', 'drupal', 'magento',
+    'woocommerce', 'shopify', 'analytics', 'seo', 'sem', 'crm', 'erp', 'wasm', 'webassembly',
+    'typescript', 'kotlin', 'swift', 'rust', 'go', 'golang', 'php', 'laravel', 'symfony', 'selenium',
+    'appium', 'cypress', 'jest', 'mocha', 'jasmine', 'junit', 'testng', 'cucumber', 'agile', 'scrum',
+    'kanban', 'devops', 'devsecops', 'ci/cd', 'penetration testing', 'wireshark', 'nmap', 'metasploit',
+    'burp suite', 'kali linux', 'mobile development', 'android', 'ios', 'flutter', 'react native',
+    'xamarin', 'cordova', 'ionic', 'unity', 'unreal engine', 'game development', 'ar', 'vr', 'xr',
+    'blockchain', 'cryptocurrency', 'smart contracts', 'solidity', 'ethereum', 'hyperledger', 'web3',
+    'computer vision', 'nlp', 'neural networks', 'deep learning', 'tensorflow', 'pytorch', 'keras',
+    'scikit-learn', 'pandas', 'numpy', 'matplotlib', 'data visualization', 'data engineering',
+    'etl', 'data warehousing', 'data mining', 'data modeling', 'cloud computing', 'saas', 'paas', 'iaas',
+    'vcenter', 'esxi', 'virtualization', 'vmware', 'hyper-v', 'xen', 'kvm', 'openstack', 'openshift',
+    'low code', 'no code', 'power platform', 'power apps', 'power automate', 'mendix', 'outsystems',
+    'computer networks', 'tcp/ip', 'dns', 'dhcp', 'vpn', 'wan', 'lan', 'mpls', 'sdwan', 'firewalls',
+    'load balancers', 'proxies', 'reverse proxies', 'web servers', 'nginx', 'apache', 'iis',
+    'tomcat', 'websphere', 'weblogic', 'jboss', 'wildfly', 'glassfish', 'database design', 'orm',
+    'jdbc', 'odbc', 'ai', 'machine learning', 'algorithms', 'data structures', 'web services',
+    'soap', 'json', 'xml', 'yaml', 'computer science', 'information systems', 'information technology',
+    'computer engineering', 'software engineering', 'agile methodologies', 'scrum', 'kanban', 'lean',
+    'project management', 'program management', 'pmp', 'prince2', 'itil', 'cobit', 'iso27001',
+    'gdpr', 'hipaa', 'pci-dss', 'sox', 'compliance', 'auditing', 'risk management', 'disaster recovery',
+    'business continuity', 'backup', 'recovery', 'high availability', 'fault tolerance', 'monitoring',
+    'logging', 'alerting', 'observability', 'apm', 'splunk', 'elk', 'grafana', 'prometheus', 'nagios',
+    'zabbix', 'datadog', 'newrelic', 'dynatrace', 'app dynamics', 'siem', 'soar', 'soc', 'threat hunting',
+    'incident response', 'forensics', 'malware analysis', 'cryptography', 'encryption', 'vpn', 'ssl',
+    'tls', 'ssh', 'sftp', 'ftps', 'dns', 'dhcp', 'ddos', 'waf', 'ids', 'ips', 'dlp', 'xdr', 'edr',
+    'mdr', 'sase', 'zero trust', 'ztna', 'casb', 'ciem', 'cnapp', 'cwpp', 'cspm', 'sast', 'dast',
+    'iast', 'rasp', 'appsec', 'devsecops', 'secops', 'shift left', 'supply chain security', 'quantum computing',
+    'quantum cryptography', 'quantum networks', 'quantum communications', 'quantum algorithms', 'quantum ml',
+    'quantum ai', 'quantum internet', 'quantum error correction', 'quantum supremacy', 'quantum advantage',
+    'quantum computing', 'quantum', 'edge computing', 'fog computing', 'distributed computing', 'parallel computing',
+    'grid computing', 'high performance computing', 'hpc', 'supercomputing', 'compute', 'storage', 'networking',
+    'iot', 'internet of things', 'iiot', 'industrial iot', 'smart cities', 'smart homes', 'smart buildings',
+    'smart grid', 'smart meters', 'smart sensors', 'embedded systems', 'firmware', 'microcontrollers',
+    'microprocessors', 'fpga', 'asic', 'gpu', 'tpu', 'vpu', 'npu', 'dpu', 'accelerators', 'hardware',
+    'robotics', 'robotic process automation', 'rpa', 'computer vision', 'image processing', 'image recognition',
+    'facial recognition', 'object detection', 'object recognition', 'object tracking', 'optical character recognition',
+    'ocr', 'document processing', 'document understanding', 'document automation', 'intelligent document processing',
+    'idp', 'intelligent automation', 'hyperautomation', 'digital transformation', 'digitization', 'digitalization',
+    'digital adoption', 'digital strategy', 'digital workplace', 'digital workplace transformation', 'digital workplace strategy',
+    'digital workplace adoption', 'digital workplace experience', 'digital employee experience', 'dex', 'employee experience',
+    'ex', 'user experience', 'ux', 'user interface', 'ui', 'user research', 'user testing', 'usability testing',
+    'accessibility', 'a11y', 'wcag', 'ada', 'section 508', 'aoda', 'eaa', 'aria', 'screen readers', 'voice assistants',
+    'virtual assistants', 'chatbots', 'conversational ai', 'conversational interfaces', 'voice interfaces', 'voice ui',
+    'voice ux', 'voice design', 'voice development', 'voice apps', 'voice skills', 'voice actions', 'voice analytics',
+    'speech recognition', 'speech synthesis', 'speech processing', 'speech analysis', 'speech analytics', 'nlp',
+    'natural language processing', 'natural language understanding', 'nlu', 'natural language generation', 'nlg',
+    'text analysis', 'text analytics', 'text mining', 'sentiment analysis', 'entity recognition', 'ner', 'topic modeling',
+    'text classification', 'text clustering', 'text summarization', 'machine translation', 'neural machine translation',
+    'nmt', 'statistical machine translation', 'smt', 'machine learning', 'ml', 'deep learning', 'dl', 'neural networks',
+    'neural nets', 'artificial neural networks', 'ann', 'convolutional neural networks', 'cnn', 'recurrent neural networks',
+    'rnn', 'long short-term memory', 'lstm', 'gated recurrent units', 'gru', 'transformers', 'attention mechanisms',
+    'sequence to sequence', 'seq2seq', 'generative adversarial networks', 'gan', 'reinforcement learning', 'rl',
+    'deep reinforcement learning', 'drl', 'federated learning', 'transfer learning', 'meta learning', 'one-shot learning',
+    'few-shot learning', 'zero-shot learning', 'self-supervised learning', 'ssl', 'semi-supervised learning', 'active learning',
+    'ensemble learning', 'boosting', 'bagging', 'random forests', 'gradient boosting', 'xgboost', 'lightgbm',
+    'catboost', 'decision trees', 'support vector machines', 'svm', 'naive bayes', 'k-nearest neighbors', 'knn',
+    'clustering', 'k-means', 'hierarchical clustering', 'dbscan', 'dimensionality reduction', 'pca', 'lda', 't-sne',
+    'umap', 'recommender systems', 'collaborative filtering', 'content-based filtering', 'hybrid recommender systems',
+    'matrix factorization', 'svd', 'anomaly detection', 'outlier detection', 'time series analysis', 'time series forecasting',
+    'predictive analytics', 'predictive modeling', 'regression', 'classification', 'feature engineering', 'feature selection',
+    'feature extraction', 'data preprocessing', 'data cleaning', 'data wrangling', 'data preparation', 'data quality',
+    'data governance', 'data management', 'data strategy', 'data ops', 'data lake', 'data lakehouse', 'data warehouse',
+    'data mesh', 'data fabric', 'data virtualization', 'data catalog', 'data lineage', 'data discovery', 'data profiling',
+    'data quality', 'data observability', 'data versioning', 'data pipelines', 'data integration', 'data transformation',
+    'data migration', 'data replication', 'data synchronization', 'data curation', 'data modeling', 'data architecture',
+    'data platform', 'data infrastructure', 'big data', 'small data', 'dark data', 'data analytics', 'business analytics',
+    'business intelligence', 'bi', 'olap', 'oltp', 'etl', 'extract transform load', 'elt', 'extract load transform',
+    'data engineering', 'software engineering', 'computer science', 'cs', 'information technology', 'it', 'information systems',
+    'is', 'information science', 'informatics', 'computational science', 'computational engineering', 'computational linguistics',
+    'computational biology', 'computational chemistry', 'computational physics', 'computational mathematics', 'computational statistics',
+    'computational finance', 'computational economics', 'computational social science', 'computational journalism', 'computational arts',
+    'computational design', 'computational architecture', 'computational engineering', 'computational medicine', 'computational health',
+    'computational healthcare', 'computational neuroscience', 'computational genomics', 'computational proteomics', 'computational metabolomics',
+    'computational systems biology', 'computational drug discovery', 'computational materials science', 'computational fluid dynamics',
+    'computational electromagnetics', 'computational mechanics', 'computational acoustics', 'computational optics', 'computational photonics',
+    'computational thermodynamics', 'computational heat transfer', 'computational mass transfer', 'computational aerodynamics',
+    'computational hydrodynamics', 'computational oceanography', 'computational meteorology', 'computational climatology',
+    'computational geophysics', 'computational seismology', 'computational volcanology', 'computational glaciology',
+    'computational hydrology', 'computational geology', 'computational geochemistry', 'computational geomorphology',
+    'computational paleontology', 'computational archaeology', 'computational anthropology', 'computational sociology',
+    'computational psychology', 'computational psychiatry', 'computational cognitive science', 'computational linguistics',
+    'computational philology', 'computational musicology', 'computational ethnomusicology', 'computational aesthetics',
+    'computational creativity', 'computational poetry', 'computational literature', 'computational humanities', 'digital humanities',
+    'digital scholarship', 'digital archaeology', 'digital anthropology', 'digital sociology', 'digital psychology', 'digital psychiatry',
+    'digital cognitive science', 'digital linguistics', 'digital philology', 'digital musicology', 'digital ethnomusicology',
+    'digital aesthetics', 'digital creativity', 'digital poetry', 'digital literature', 'digital humanities', 'digital scholarship',
+    'digital archaeology', 'digital anthropology', 'digital sociology', 'digital psychology', 'digital psychiatry', 'digital cognitive science',
+    'digital linguistics', 'digital philology', 'digital musicology', 'digital ethnomusicology', 'digital aesthetics', 'digital creativity',
+    'digital poetry', 'digital literature'
+]
+
+# Combine all the keywords into a single set
+ALL_IT_KEYWORDS = set(IT_KEYWORDS + TECH_KEYWORDS)
+
+# Add common IT professions and roles
+IT_PROFESSIONS = [
+    'software', 'developer', 'engineer', 'programmer', 'coder', 'administrator', 'analyst', 'architect',
+    'specialist', 'technician', 'consultant', 'manager', 'director', 'officer', 'lead', 'head', 'chief',
+    'senior', 'junior', 'associate', 'principal', 'staff', 'fellow', 'intern', 'trainee', 'graduate',
+    'expert', 'guru', 'ninja', 'rockstar', 'wizard', 'evangelist', 'advocate', 'champion', 'mentor', 'coach',
+    'trainer', 'instructor', 'educator', 'professor', 'researcher', 'scientist', 'engineer', 'developer',
+    'programmer', 'coder', 'hacker', 'builder', 'maker', 'creator', 'designer', 'artist', 'craftsman',
+    'craftsperson', 'artisan', 'technologist', 'technician', 'specialist', 'professional', 'practitioner',
+    'operator', 'administrator', 'admin', 'support', 'helpdesk', 'service desk', 'support desk', 'technical support',
+    'it support', 'customer support', 'client support', 'user support', 'end user support', 'desktop support',
+    'field support', 'remote support', 'onsite support', 'level 1 support', 'level 2 support', 'level 3 support',
+    'tier 1 support', 'tier 2 support', 'tier 3 support', 'first line support', 'second line support', 'third line support'
+]
+
+# Compiled once: finds every IT keyword and profession in a text in a single pass
+IT_KEYWORD_MATCHER = KeywordMatcher({
+    **IT_JOB_CATEGORIES,
+    'tech': TECH_KEYWORDS,
+    'profession': IT_PROFESSIONS
+})
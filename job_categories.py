@@ -0,0 +1,212 @@
+import re
+
+try:
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pyarrow is optional; without it every row goes through the keyword automaton
+    np = pa = pc = None
+
+from keyword_matcher import KeywordMatcher
+
+# Job categories from the IT industry analysis notebook (categorize_it_job). Order matters: a job
+# gets the first category with a keyword in its title or job function.
+JOB_CATEGORY_KEYWORDS = {
+    'software_development': [
+        'software developer', 'software engineer', 'programmer', 'coder', 'full stack', 'frontend',
+        'backend', 'mobile developer', 'ios developer', 'android developer', 'web developer',
+        'javascript developer', 'python developer', 'java developer', 'php developer', 'ruby developer',
+        '.net developer', 'c# developer', 'c++ developer', 'scala developer', 'go developer', 'golang',
+        'react developer', 'angular developer', 'vue developer', 'node.js developer', 'typescript',
+        'flutter developer', 'kotlin developer', 'swift developer', 'rust developer', 'elm developer',
+        'clojure developer', 'haskell developer', 'elixir developer', 'erlang developer', 'react native',
+        'technical lead', 'lead developer', 'mern stack', 'mean stack', 'laravel developer',
+        'wordpress developer', 'shopify developer', 'senior developer', 'junior developer',
+        'associate software engineer', 'development team lead', 'spring boot', 'asp.net'
+    ],
+    'data_science': [
+        'data scientist', 'data analyst', 'business intelligence', 'bi developer', 'machine learning',
+        'ml engineer', 'ai engineer', 'artificial intelligence', 'nlp', 'natural language processing',
+        'computer vision', 'deep learning', 'statistical analyst', 'big data', 'data engineer',
+        'data architect', 'etl developer', 'analytics', 'data mining', 'predictive modeling',
+        'tableau developer', 'power bi developer', 'data visualization', 'statistician', 'r developer',
+        'time series forecasting', 'llm', 'large language model', 'computer vision engineer',
+        'research scientist', 'data automation', 'data processing', 'data operations', 'database engineer',
+        'risk & data analyst', 'data automation architect', 'fpga engineer', 'neural networks',
+        'reinforcement learning', 'researcher - data science', 'lead data scientist', 'ai engineer',
+        'machine learning engineer', 'deep learning engineer', 'nlp engineer', 'computer vision engineer',
+        'ai research scientist', 'ai developer', 'ml ops', 'ai product manager', 'ai architect',
+        'neural network engineer', 'ml infrastructure', 'ai ethicist', 'conversational ai',
+        'reinforcement learning', 'generative ai', 'prompt engineer', 'llm engineer',
+        'large language model', 'ai designer', 'database administrator', 'dba', 'database engineer',
+        'data engineer', 'sql developer', 'nosql', 'mongodb', 'postgresql', 'mysql', 'oracle dba',
+        'sql server', 'database architect', 'database manager', 'etl developer', 'data warehouse',
+        'data modeling', 'database optimization', 'data migration', 'database security',
+        'database reliability', 'database performance'
+    ],
+    'cloud_devops': [
+        'cloud engineer', 'cloud architect', 'devops engineer', 'site reliability engineer', 'sre',
+        'infrastructure engineer', 'aws', 'azure', 'gcp', 'google cloud', 'cloud native', 'kubernetes',
+        'docker', 'containerization', 'ci/cd', 'jenkins', 'terraform', 'ansible', 'chef', 'puppet',
+        'microservices', 'service mesh', 'cloud migration', 'cloud optimization', 'cloud security',
+        'release engineer', 'infrastructure & platform delivery', 'deployment engineer',
+        'platform engineer', 'build & deployment', 'cloud optimization', 'cloud administrator',
+        'cloud support', 'iaas', 'paas', 'saas', 'gitops', 'argocd', 'helm'
+    ],
+    'cybersecurity': [
+        'security engineer', 'security analyst', 'cybersecurity', 'cyber security', 'information security',
+        'infosec', 'penetration tester', 'pen tester', 'ethical hacker', 'security consultant',
+        'security architect', 'security administrator', 'security operations', 'soc analyst',
+        'threat intelligence', 'vulnerability assessment', 'devsecops', 'security compliance',
+        'security auditor', 'cryptography', 'encryption', 'risk management', 'threat modeling',
+        'security specialist', 'security operations engineer', 'security analyst', 'soc manager',
+        'managed security services', 'security specialist lead', 'it security engineer', 'pam', 'cyberark'
+    ],
+    'network_systems': [
+        'network engineer', 'network administrator', 'systems administrator', 'sysadmin',
+        'systems engineer', 'network architect', 'network security', 'cisco', 'juniper', 'ccna', 'ccnp',
+        'ccie', 'voip', 'wan', 'lan', 'virtualization', 'vmware', 'hyper-v', 'datacenter',
+        'network support engineer', 'network and firewall engineer', 'noc engineer', 'system administrator',
+        'network admin', 'senior network admin', 'engineer - storage', 'data center administrator',
+        'it hardware technician'
+    ],
+    'qa_testing': [
+        'quality assurance', 'qa engineer', 'test engineer', 'software tester', 'qa analyst',
+        'automation tester', 'manual tester', 'test lead', 'qa lead', 'test manager', 'quality analyst',
+        'performance tester', 'test automation', 'selenium', 'appium', 'quality assurance analyst',
+        'quality assurance executive', 'quality engineer', 'quality engineer lead',
+        'senior quality assurance', 'qa automation engineer', 'associate qa lead', 'automation testing',
+        'sdet', 'architect - quality engineering'
+    ],
+    'it_support': [
+        'it support', 'help desk', 'service desk', 'technical support', 'desktop support', 'it helpdesk',
+        'it technician', 'support specialist', 'support engineer', 'it administrator',
+        'technical support specialist', 'support analyst', 'service desk engineer', 'level 1 support',
+        'level 2 support', 'level 3 support', 'application support', 'l1 support', 'l2 support',
+        'l3 support', 'l1 engineer', 'l2 engineer', 'l3 engineer', 'l3/l4 engineer',
+        'product support engineer', 'technical support engineer', 'end user support', 'euc support'
+    ],
+    'project_management': [
+        'project manager', 'program manager', 'scrum master', 'agile coach', 'product owner',
+        'it project manager', 'technical project manager', 'project coordinator', 'pmo specialist',
+        'project management office', 'delivery manager', 'project lead', 'it program manager',
+        'technical program manager', 'sprint master', 'project director', 'associate project manager',
+        'project management intern', 'senior project manager', 'senior program manager', 'project engineer',
+        'software development team lead'
+    ],
+    'ui_ux_design': [
+        'ui designer', 'ux designer', 'ui/ux designer', 'user interface designer',
+        'user experience designer', 'interaction designer', 'visual designer', 'product designer',
+        'web designer', 'mobile designer', 'ux researcher', 'ui/ux engineer', 'ux architect',
+        'ui developer', 'design systems', 'user research', 'usability testing', 'wireframing',
+        'prototyping', 'information architecture', 'associate ui/ux designer', 'ui/ux intern',
+        'senior ui ux designer', 'graphics designer', 'creative designer'
+    ],
+    'technical_writing': [
+        'technical writer', 'documentation specialist', 'api documentation', 'knowledge base writer',
+        'information developer', 'content developer', 'documentation engineer', 'user guide writer',
+        'technical editor', 'documentation manager', 'technical documentation', 'user education specialist',
+        'technical content writer', 'senior technical writer'
+    ],
+    'blockchain_crypto': [
+        'blockchain developer', 'blockchain engineer', 'smart contract developer', 'solidity developer',
+        'ethereum developer', 'web3 developer', 'dapp developer', 'cryptocurrency engineer',
+        'blockchain architect', 'consensus engineer', 'blockchain security engineer', 'crypto analyst',
+        'tokenomics specialist', 'blockchain project manager', 'web3 product manager'
+    ]
+}
+
+OTHER_CATEGORY = 'Other'
+
+
+def categorize_job(row):
+    """Categorizes a job based on keywords found in either title or job_function (the notebook's row-wise version)."""
+    combined_text = (row['title'] + " " + str(row['job_function'])).lower()
+
+    for category, keywords in JOB_CATEGORY_KEYWORDS.items():
+        if any(keyword in combined_text for keyword in keywords):
+            return category
+
+    return OTHER_CATEGORY
+
+
+class JobCategorizer:
+    """Categorizes whole DataFrames or Arrow tables with the same first-match rule as categorize_job
+
+    With pyarrow, each category is one compiled alternation of its keywords, matched by Arrow's
+    regex kernel against the rows no earlier category claimed, so the per-row work runs in C++
+    rather than as a Python loop over every keyword. Without pyarrow, each row is scanned once
+    by the keyword automaton and the highest-priority category found wins.
+    """
+
+    def __init__(self, categories=JOB_CATEGORY_KEYWORDS, default=OTHER_CATEGORY):
+        self.categories = list(categories)
+        self.default = default
+        self.patterns = [
+            "|".join(re.escape(keyword.lower()) for keyword in dict.fromkeys(keywords))
+            for keywords in categories.values()
+        ]
+        self.matcher = KeywordMatcher(categories)
+        priority = {category: index for index, category in enumerate(self.categories)}
+        # keyword -> index of the first category listing it
+        self._keyword_priority = {
+            keyword: min(priority[category] for category in groups) for keyword, groups in self.matcher.groups.items()
+        }
+
+    def categorize_text(self, text):
+        """Category of one lower-cased title + job function text"""
+        best = len(self.categories)
+        for keyword in self.matcher.iter_keywords(text):
+            best = min(best, self._keyword_priority[keyword])
+            if best == 0:
+                break
+        return self.categories[best] if best < len(self.categories) else self.default
+
+    def categorize(self, data):
+        """job_category of every row: a Series for a DataFrame, a dictionary-encoded Array for an Arrow table"""
+        if pa is not None and isinstance(data, pa.Table):
+            # Missing job functions read back from Parquet/SQLite are null; str(None) as in categorize_job
+            text = pc.utf8_lower(pc.binary_join_element_wise(
+                pc.fill_null(data.column('title').cast(pa.string()), "None"),
+                pc.fill_null(data.column('job_function').cast(pa.string()), "None"),
+                " "
+            ))
+            codes = self._category_codes(text.combine_chunks())
+            return pa.DictionaryArray.from_arrays(pa.array(codes, pa.int32()), pa.array(self.categories + [self.default]))
+
+        import pandas as pd
+
+        # Built with str() and str.lower() exactly as categorize_job does, so non-ASCII case folding matches too
+        texts = [
+            f"{title} {job_function}".lower() for title, job_function in zip(data['title'], data['job_function'])
+        ]
+        if pa is None:
+            return pd.Series([self.categorize_text(text) for text in texts], index=data.index, name='job_category')
+        labels = np.array(self.categories + [self.default], dtype=object)
+        codes = self._category_codes(pa.array(texts, pa.string()))
+        return pd.Series(labels[codes], index=data.index, name='job_category')
+
+    def _category_codes(self, texts):
+        """Index into categories (len(categories) for the default) of each text in an Arrow string array"""
+        codes = np.full(len(texts), len(self.categories), dtype=np.int32)
+        remaining = np.arange(len(texts))
+        for index, pattern in enumerate(self.patterns):
+            if not len(remaining):
+                break
+            candidates = texts if len(remaining) == len(texts) else texts.take(pa.array(remaining))
+            matched = pc.match_substring_regex(candidates, pattern).to_numpy(zero_copy_only=False)
+            codes[remaining[matched]] = index
+            remaining = remaining[~matched]
+        return codes
+
+
+def categorize_jobs(df, categorizer=None):
+    """Add the job_category column to a DataFrame or Arrow table (returns the table with the column added)"""
+    categorizer = categorizer or JobCategorizer()
+    categories = categorizer.categorize(df)
+    if pa is not None and isinstance(df, pa.Table):
+        if 'job_category' in df.column_names:
+            df = df.drop_columns(['job_category'])
+        return df.append_column('job_category', categories)
+    df['job_category'] = categories
+    return df
@@ -0,0 +1,341 @@
+from collections import Counter
+from itertools import combinations
+from pathlib import Path
+import argparse
+import json
+import logging
+import sqlite3
+
+from job_categories import JobCategorizer
+from job_store import DEFAULT_STORE_PATH, JobStore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CUBES_PATH = Path('data') / 'job_cubes.sqlite'
+
+# Dimensions the notebook counts and cross-tabulates; every single dimension and every pair
+# of dimensions gets a count cube
+DIMENSIONS = (
+    'industries', 'experience_level', 'employment_type', 'province', 'job_category', 'company',
+    'job_function', 'posted_year', 'posted_month'
+)
+
+# Code of a missing value; rows are left out of every cube over a dimension they lack, as
+# value_counts() and pd.crosstab() drop NaN
+MISSING = -1
+
+SRI_LANKA_PROVINCES = [
+    'Western Province', 'Central Province', 'Southern Province', 'Northern Province', 'Eastern Province',
+    'North Western Province', 'North Central Province', 'Uva Province', 'Sabaragamuwa Province'
+]
+
+# Store columns read to (re)compute the dimensions of a job
+STORE_SOURCE_COLUMNS = [
+    'job_id', 'title', 'company', 'location', 'experience_level', 'employment_type', 'posted_date',
+    'job_function', 'industries', 'last_seen'
+]
+
+
+def extract_province(location):
+    """Province of a location string (the notebook's extract_province_sri_lanka)"""
+    if not isinstance(location, str):
+        return None
+
+    # Special case: If location is exactly "Sri Lanka", return "Unspecified"
+    if location.strip() == "Sri Lanka":
+        return "Unspecified"
+
+    location_parts = [part.strip() for part in location.split(',')]
+    for province in SRI_LANKA_PROVINCES:
+        if province in location:
+            return province
+
+    # If no province found, try to extract from parts
+    if len(location_parts) >= 2:
+        return location_parts[-2]
+    return location_parts[-1] if location_parts else None
+
+
+def dimension_frame(df, categorizer=None, dimensions=DIMENSIONS):
+    """The dimensions of each job as strings (NA when missing)
+
+    province, job_category and posted year/month are derived from location, title/job_function
+    and posted_date unless df already has them (e.g. the notebook's cleaned DataFrame).
+    """
+    import pandas as pd
+
+    dims = pd.DataFrame(index=df.index)
+    for dim in DIMENSIONS:
+        if dim in df.columns:
+            dims[dim] = df[dim]
+    if 'province' not in dims:
+        # Few distinct locations, so each is parsed once
+        locations = df['location'].astype(object)
+        dims['province'] = locations.map({location: extract_province(location) for location in locations.unique()})
+    if 'job_category' not in dims:
+        dims['job_category'] = (categorizer or JobCategorizer()).categorize(df)
+    # Built from the date parts; strftime over every row is several times slower
+    posted = pd.to_datetime(df['posted_date'], errors='coerce')
+    year = posted.dt.year.astype('Int64').astype('string')
+    if 'posted_year' not in dims:
+        dims['posted_year'] = year
+    if 'posted_month' not in dims:
+        dims['posted_month'] = year + '-' + posted.dt.month.astype('Int64').astype('string').str.zfill(2)
+    # Dimensions df has no column for are missing in every row
+    return dims.reindex(columns=list(dimensions)).astype('string')
+
+
+class JobCubes:
+    """Job counts over every dimension and every pair of dimensions, kept up to date incrementally
+
+    Dimension values are dictionary-encoded as small integer codes. The codes of each job are
+    kept too, so a job that comes back with changed fields moves between cells instead of being
+    counted twice. Cubes live in memory and persist to SQLite at path; save() only writes what
+    changed since the last save.
+    """
+
+    def __init__(self, path=DEFAULT_CUBES_PATH, dimensions=DIMENSIONS):
+        self.path = Path(path)
+        self.dimensions = tuple(dimensions)
+        # Each cube is a tuple of one or two dimensions; its cells map value codes to job counts
+        self.cube_dimensions = [(dim,) for dim in self.dimensions] + list(combinations(self.dimensions, 2))
+        self.cubes = {cube: Counter() for cube in self.cube_dimensions}
+        self.labels = {dim: [] for dim in self.dimensions}
+        self.job_codes = {}
+        # Newest last_seen read from the job store, where the next update_from_store() starts
+        self.updated_at = None
+
+        self._codes = {dim: {} for dim in self.dimensions}
+        self._conn = None
+        self._saved_labels = {dim: 0 for dim in self.dimensions}
+        self._dirty_cells = set()
+        self._dirty_jobs = set()
+        if self.path.exists():
+            self._load()
+
+    def update(self, df, categorizer=None):
+        """Count new jobs and move changed ones; returns the number of jobs added or changed
+
+        df needs job_id, title, location, posted_date and job_function plus whichever other
+        dimensions it has; when a job_id appears more than once, the last row wins.
+        """
+        import pandas as pd
+
+        dims = dimension_frame(df, categorizer, self.dimensions)
+        codes = pd.DataFrame({dim: self._encode(dim, dims[dim]) for dim in self.dimensions}, index=dims.index)
+        codes.index = df['job_id'].astype(str)
+        codes = codes[~codes.index.duplicated(keep='last')]
+
+        added, removed = [], []
+        for job_id, key in zip(codes.index, map(tuple, codes.to_numpy().tolist())):
+            old = self.job_codes.get(job_id)
+            if old == key:
+                continue
+            if old is not None:
+                removed.append(old)
+            added.append(key)
+            self.job_codes[job_id] = key
+            self._dirty_jobs.add(job_id)
+
+        if added:
+            deltas = pd.DataFrame(added + removed, columns=self.dimensions)
+            deltas['delta'] = [1] * len(added) + [-1] * len(removed)
+            for cube in self.cube_dimensions:
+                self._apply(cube, deltas)
+        return len(added)
+
+    def update_from_store(self, store_path=DEFAULT_STORE_PATH, categorizer=None):
+        """Count jobs the store saved or saw again since the last update; returns the jobs added or changed"""
+        store = JobStore(store_path)
+        try:
+            if self.updated_at:
+                df = store.to_dataframe("last_seen >= ?", (self.updated_at,), columns=STORE_SOURCE_COLUMNS)
+            else:
+                df = store.to_dataframe(columns=STORE_SOURCE_COLUMNS)
+        finally:
+            store.close()
+        if df.empty:
+            return 0
+        changed = self.update(df, categorizer)
+        self.updated_at = df['last_seen'].max()
+        logger.info("Cubes updated from %s: %s of %s jobs added or changed", store_path, changed, len(df))
+        return changed
+
+    def counts(self, dimension, where=None):
+        """value_counts() of a dimension, optionally within one value of another
+
+        e.g. counts('job_function', where=('province', 'Western Province')) for the notebook's
+        job functions by province.
+        """
+        import pandas as pd
+
+        if where is None:
+            cells = {self.labels[dimension][code]: count for (code,), count in self.cubes[(dimension,)].items()}
+        else:
+            other, value = where
+            other_code = self._codes[other].get(str(value))
+            cells = {
+                self.labels[dimension][code]: count
+                for (code, code_of_other), count in self._pair_cells(dimension, other)
+                if code_of_other == other_code
+            }
+        return pd.Series(cells, name='count', dtype='int64').rename_axis(dimension).sort_values(ascending=False)
+
+    def crosstab(self, index, columns):
+        """pd.crosstab(df[index], df[columns]) from the precomputed pair cube"""
+        import pandas as pd
+
+        cells = {
+            (self.labels[index][row], self.labels[columns][column]): count
+            for (row, column), count in self._pair_cells(index, columns)
+        }
+        if not cells:
+            return pd.DataFrame(dtype='int64').rename_axis(index=index, columns=columns)
+        table = pd.Series(cells, dtype='int64').unstack(fill_value=0)
+        return table.rename_axis(index=index, columns=columns)
+
+    def save(self):
+        """Write labels, job codes and cells changed since the last save in one transaction"""
+        conn = self._connect()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                [("dimensions", json.dumps(self.dimensions)), ("updated_at", self.updated_at)]
+            )
+            for dim, labels in self.labels.items():
+                saved = self._saved_labels[dim]
+                conn.executemany(
+                    "INSERT OR REPLACE INTO labels (dimension, code, value) VALUES (?, ?, ?)",
+                    [(dim, code, labels[code]) for code in range(saved, len(labels))]
+                )
+                self._saved_labels[dim] = len(labels)
+            conn.executemany(
+                f"INSERT OR REPLACE INTO job_codes (job_id, {', '.join(self.dimensions)}) "
+                f"VALUES (?, {', '.join('?' * len(self.dimensions))})",
+                [(job_id,) + self.job_codes[job_id] for job_id in self._dirty_jobs]
+            )
+            cells = [(cube, cell, self.cubes[cube].get(cell, 0)) for cube, cell in self._dirty_cells]
+            conn.executemany(
+                "DELETE FROM cells WHERE cube = ? AND a = ? AND b = ?",
+                [(_cube_name(cube), cell[0], _second(cell)) for cube, cell, count in cells if not count]
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO cells (cube, a, b, count) VALUES (?, ?, ?, ?)",
+                [(_cube_name(cube), cell[0], _second(cell), count) for cube, cell, count in cells if count]
+            )
+        logger.info("Saved %s changed cube cells to %s", len(self._dirty_cells), self.path)
+        self._dirty_jobs.clear()
+        self._dirty_cells.clear()
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _encode(self, dim, values):
+        """Codes of a column of values, adding unseen values to the dimension's labels"""
+        codes, labels = self._codes[dim], self.labels[dim]
+        for value in values.dropna().unique():
+            if value not in codes:
+                codes[value] = len(labels)
+                labels.append(value)
+        return values.map(codes).fillna(MISSING).astype('int64')
+
+    def _apply(self, cube, deltas):
+        positions = list(cube)
+        present = deltas[(deltas[positions] != MISSING).all(axis=1)]
+        if present.empty:
+            return
+        counter = self.cubes[cube]
+        for cell, delta in present.groupby(positions)['delta'].sum().items():
+            if not delta:
+                continue
+            cell = tuple(int(code) for code in cell) if isinstance(cell, tuple) else (int(cell),)
+            counter[cell] += int(delta)
+            if not counter[cell]:
+                del counter[cell]
+            self._dirty_cells.add((cube, cell))
+
+    def _pair_cells(self, first, second):
+        """((code in first, code in second), count) of the pair cube over the two dimensions"""
+        if (first, second) in self.cubes:
+            return self.cubes[(first, second)].items()
+        return (((b, a), count) for (a, b), count in self.cubes[(second, first)].items())
+
+    def _load(self):
+        conn = self._connect()
+        stored = conn.execute("SELECT value FROM meta WHERE key = 'dimensions'").fetchone()
+        if stored is None:
+            return
+        if tuple(json.loads(stored[0])) != self.dimensions:
+            logger.warning("%s was built over other dimensions; rebuilding the cubes from scratch", self.path)
+            with conn:
+                for table in ("meta", "labels", "job_codes", "cells"):
+                    conn.execute(f"DELETE FROM {table}")
+            return
+        self.updated_at = conn.execute("SELECT value FROM meta WHERE key = 'updated_at'").fetchone()[0]
+        for dim, code, value in conn.execute("SELECT dimension, code, value FROM labels ORDER BY dimension, code"):
+            self.labels[dim].append(value)
+            self._codes[dim][value] = code
+        self._saved_labels = {dim: len(labels) for dim, labels in self.labels.items()}
+        for job_id, *key in conn.execute(f"SELECT job_id, {', '.join(self.dimensions)} FROM job_codes"):
+            self.job_codes[job_id] = tuple(key)
+        cubes = {_cube_name(cube): cube for cube in self.cube_dimensions}
+        for name, a, b, count in conn.execute("SELECT cube, a, b, count FROM cells"):
+            cube = cubes[name]
+            self.cubes[cube][(a,) if len(cube) == 1 else (a, b)] = count
+
+    def _connect(self):
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path))
+            with self._conn:
+                self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS labels "
+                    "(dimension TEXT NOT NULL, code INTEGER NOT NULL, value TEXT NOT NULL, PRIMARY KEY (dimension, code))"
+                )
+                self._conn.execute(
+                    f"CREATE TABLE IF NOT EXISTS job_codes "
+                    f"(job_id TEXT PRIMARY KEY, {', '.join(f'{dim} INTEGER NOT NULL' for dim in self.dimensions)})"
+                )
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS cells (cube TEXT NOT NULL, a INTEGER NOT NULL, b INTEGER NOT NULL, "
+                    "count INTEGER NOT NULL, PRIMARY KEY (cube, a, b)) WITHOUT ROWID"
+                )
+        return self._conn
+
+
+def refresh_cubes(store_path=DEFAULT_STORE_PATH, cubes_path=DEFAULT_CUBES_PATH):
+    """Post-scrape step: bring the saved cubes up to date with the job store; returns the jobs added or changed"""
+    cubes = JobCubes(cubes_path)
+    try:
+        changed = cubes.update_from_store(store_path)
+        cubes.save()
+        return changed
+    finally:
+        cubes.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Update the precomputed job count cubes from the job store")
+    parser.add_argument("--store", default=str(DEFAULT_STORE_PATH), help="SQLite job store to read")
+    parser.add_argument("--cubes", default=str(DEFAULT_CUBES_PATH), help="cube file to update")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    changed = refresh_cubes(args.store, args.cubes)
+    print(f"Counted {changed} new or changed jobs into {args.cubes}")
+
+
+def _cube_name(cube):
+    return "*".join(cube)
+
+
+def _second(cell):
+    # One-dimensional cells are stored with MISSING as their second code
+    return cell[1] if len(cell) > 1 else MISSING
+
+
+if __name__ == "__main__":
+    main()
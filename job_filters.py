@@ -0,0 +1,47 @@
+from it_keywords import IT_JOB_CATEGORIES, IT_KEYWORD_MATCHER
+from metrics import METRICS
+
+# Row filters for JobScraper: called with (card data, fetched details), they return the row to
+# save or None to drop the job. They run in the pipeline's worker processes, so they must stay
+# module-level functions.
+
+
+def merge_details(job_data, details):
+    """Merge fetched details into card data"""
+    if details:
+        job_data.update(details)
+    return job_data
+
+@METRICS.timed("classify_seconds", fn="is_it_job")
+def is_it_job(job_title, job_description):
+    """Check if the job is IT-related based on keywords in title and description."""
+    combined_text = f"{job_title} {job_description}".lower() if job_description else job_title.lower()
+    return IT_KEYWORD_MATCHER.contains_any(combined_text)
+
+@METRICS.timed("classify_seconds", fn="match_it_keywords")
+def match_it_keywords(job_title, job_description):
+    """Return the IT keywords and categories found in title and description."""
+    combined_text = f"{job_title} {job_description}".lower() if job_description else job_title.lower()
+    return IT_KEYWORD_MATCHER.match(combined_text)
+
+def primary_it_category(match):
+    """First IT_JOB_CATEGORIES category found in a match, or None for tech/profession-only matches"""
+    for category in IT_JOB_CATEGORIES:
+        if category in match.categories:
+            return category
+    return None
+
+def merge_details_and_filter(job_data, details):
+    """Merge fetched details into card data and keep the job only if it is IT related"""
+    if details:
+        job_data.update(details)
+    else:
+        job_data["description"] = None # Ensure description exists even if get_job_details fails
+
+    # Check if it is an IT job after fetching description
+    match = match_it_keywords(job_data["title"], job_data.get("description", ""))
+    if not match.keywords:
+        return None  # Skip non-IT jobs
+
+    job_data["category"] = primary_it_category(match)
+    return job_data
@@ -0,0 +1,102 @@
+from collections import defaultdict
+from pathlib import Path
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Separators of the combinations column: "recent/24h;relevant/week"
+COMBINATION_SEPARATOR = ";"
+SORT_FILTER_SEPARATOR = "/"
+
+
+class JobIndex:
+    """Index of job_ids already fetched in this run, optionally backed by a file of ids from earlier runs"""
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path else None
+        self._details = {}
+        self._combinations = defaultdict(list)
+        self._known = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+
+        if self.path and self.path.exists():
+            with open(self.path, encoding='utf-8') as f:
+                self._known = {line.strip() for line in f if line.strip()}
+            logger.info("Loaded %s known job ids from %s", len(self._known), self.path)
+        # Ids already in the index file
+        self._persisted = set(self._known)
+
+    def is_known(self, job_id):
+        """True if the job was scraped in an earlier run recorded in the index file"""
+        return job_id in self._known
+
+    def known_ids(self):
+        """Copy of the job_ids loaded from the index file"""
+        return set(self._known)
+
+    def get_details(self, job_id):
+        """Return a copy of the details fetched earlier in this run, or None"""
+        with self._lock:
+            details = self._details.get(job_id)
+            if details is None:
+                return None
+            self.hits += 1
+            return dict(details)
+
+    def add(self, job_id, details):
+        """Remember fetched details for job_id and persist the id if a file is configured"""
+        with self._lock:
+            self._details[job_id] = details
+        self._persist(job_id)
+
+    def mark_seen(self, job_id):
+        """Persist a job_id that was judged without keeping its details (a title prefilter or IT filter reject)
+
+        Later runs then count it as known, so incremental scrapes neither fetch it again nor treat
+        it as a new posting.
+        """
+        self._persist(job_id)
+
+    def record_combination(self, job_id, sort_method, time_filter):
+        """Note that job_id appeared under this sort/filter combination"""
+        with self._lock:
+            combination = (sort_method, time_filter)
+            if combination not in self._combinations[job_id]:
+                self._combinations[job_id].append(combination)
+
+    def combinations(self, job_id):
+        """All (sort_method, time_filter) combinations job_id appeared under, in first-seen order"""
+        with self._lock:
+            return list(self._combinations.get(job_id, []))
+
+    def combinations_text(self, job_id):
+        """The combinations job_id appeared under so far, formatted for the combinations column"""
+        return format_combinations(self.combinations(job_id))
+
+    def __len__(self):
+        return len(self._details)
+
+    def _persist(self, job_id):
+        with self._lock:
+            if job_id in self._persisted:
+                return
+            self._persisted.add(job_id)
+            if self.path:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.write(f"{job_id}\n")
+
+
+def format_combinations(combinations):
+    """Join (sort_method, time_filter) pairs into "sort/filter;sort/filter" text"""
+    return COMBINATION_SEPARATOR.join(f"{sort_method}{SORT_FILTER_SEPARATOR}{time_filter}"
+                                      for sort_method, time_filter in combinations)
+
+
+def parse_combinations(text):
+    """(sort_method, time_filter) pairs of a combinations column value"""
+    if not text:
+        return []
+    return [tuple(entry.split(SORT_FILTER_SEPARATOR, 1)) for entry in text.split(COMBINATION_SEPARATOR) if entry]
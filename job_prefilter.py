@@ -0,0 +1,150 @@
+from collections import Counter
+import logging
+import random
+import re
+import threading
+
+from it_keywords import IT_JOB_CATEGORIES, TECH_KEYWORDS
+from keyword_matcher import KeywordMatcher
+
+logger = logging.getLogger(__name__)
+
+ACCEPT = 'accept'
+REJECT = 'reject'
+NEEDS_DESCRIPTION = 'needs_description'
+
+# IT keywords that, as whole words in a title, usually mean something else (a kitchen chef, an Excel user...)
+AMBIGUOUS_TITLE_TERMS = {
+    'chef', 'puppet', 'excel', 'teams', 'slack', 'lean', 'storage', 'compliance', 'auditing', 'backup',
+    'recovery', 'monitoring', 'logging', 'regression', 'classification', 'clustering', 'boosting', 'bagging',
+    'seo', 'sem', 'crm', 'analytics', 'risk management', 'project management', 'program management',
+    'accessibility', 'ada', 'employee experience', 'digital strategy', 'compute', 'forensics', 'dynamics',
+    'rest', 'express', 'spring', 'unity', 'ionic', 'go', 'swift', 'rust', 'is', 'ex', 'ar', 'rl', 'dl', 'cs',
+    'ann', 'lda', 'pca', 'gan', 'ssl', 'ner', 'ids', 'ips', 'dex', 'eaa', 'aria', 'soc', 'sox', 'apm',
+    'hardware', 'firewalls', 'proxies', 'security compliance', 'encryption', 'wan', 'lan',
+    'quantum', 'chatbots', 'dns', 'kanban', 'agile', 'scrum', 'business continuity'
+}
+
+# Whole-word title terms that mark an IT role on their own
+EXTRA_IT_TITLE_TERMS = ['it', 'ict', 'qa', 'software', 'developer', 'programmer']
+
+# Title words of postings that are clearly outside IT
+NON_IT_TITLE_TERMS = [
+    'baker', 'bakery', 'pastry', 'cook', 'commis', 'kitchen', 'steward', 'waiter', 'waitress', 'bartender',
+    'barista', 'housekeeping', 'housekeeper', 'room attendant', 'laundry', 'front office', 'receptionist',
+    'spa', 'therapist', 'beautician', 'hair', 'salon', 'banquet', 'restaurant', 'f&b', 'food and beverage',
+    'driver', 'rider', 'delivery', 'security guard', 'cleaner', 'janitor', 'gardener', 'nurse', 'caregiver',
+    'pharmacist', 'doctor', 'physician', 'dental', 'teacher', 'tutor', 'preschool', 'sales', 'marketing',
+    'brand', 'merchandiser', 'merchandising', 'cashier', 'teller', 'accountant', 'accounting', 'accounts',
+    'finance', 'audit', 'tax', 'lawyer', 'legal', 'attorney', 'hr', 'human resources', 'recruiter',
+    'talent acquisition', 'civil engineer', 'mechanical engineer', 'electrical engineer', 'quantity surveyor',
+    'sewing', 'machine operator', 'garment', 'textile', 'tailor', 'labourer', 'factory', 'warehouse',
+    'store keeper', 'storekeeper', 'procurement', 'logistics', 'customer service', 'call center', 'call centre',
+    'insurance', 'real estate', 'property', 'tea', 'plantation', 'agriculture', 'fitness', 'trainer'
+]
+
+# Employers whose non-IT-titled postings can be rejected without reading the description
+NON_IT_COMPANY_TERMS = ['hotel', 'hotels', 'resort', 'resorts', 'bakery', 'restaurant', 'spa', 'hospital']
+
+# Share of rejected cards still fetched to measure how often the title stage is wrong
+DEFAULT_AUDIT_RATE = 0.05
+
+
+def normalize_title(text):
+    """Lower-case, turn punctuation into spaces and pad, so ' term ' only matches whole words"""
+    return " " + " ".join(re.sub(r"[^a-z0-9+#&./]+", " ", text.lower()).split()) + " "
+
+
+def _word_matcher(groups):
+    """KeywordMatcher whose patterns only match whole words of a normalize_title() string"""
+    return KeywordMatcher({
+        group: [normalize_title(term) for term in terms if term.strip()]
+        for group, terms in groups.items()
+    })
+
+
+class TitlePrefilter:
+    """Cheap first stage of IT classification that decides from a search card's title and company"""
+
+    def __init__(self, audit_rate=DEFAULT_AUDIT_RATE):
+        it_terms = [keyword for keywords in IT_JOB_CATEGORIES.values() for keyword in keywords] + TECH_KEYWORDS
+        it_terms = [term for term in it_terms if term not in AMBIGUOUS_TITLE_TERMS]
+        self.it_matcher = _word_matcher({'it': it_terms + EXTRA_IT_TITLE_TERMS})
+        # Judges audited rejects; 'it' is left out as a whole word of almost every description
+        self.audit_matcher = _word_matcher({'it': it_terms})
+        self.non_it_matcher = _word_matcher({'non_it': NON_IT_TITLE_TERMS})
+        self.company_matcher = _word_matcher({'non_it_company': NON_IT_COMPANY_TERMS})
+        self.audit_rate = audit_rate
+
+        self._lock = threading.Lock()
+        self.decisions = Counter()
+        self.audited = 0
+        self.fetches_avoided = 0
+        # Audited rejects found to be IT after all, whose rows are kept
+        self.rejects_kept = 0
+        # decision -> Counter of full-classification outcomes (True = IT job)
+        self.outcomes = {ACCEPT: Counter(), REJECT: Counter(), NEEDS_DESCRIPTION: Counter()}
+
+    def decide(self, title, company=None):
+        """Return ACCEPT, REJECT or NEEDS_DESCRIPTION for a card"""
+        title_text = normalize_title(title or "")
+        if self.it_matcher.contains_any(title_text):
+            decision = ACCEPT
+        elif self.non_it_matcher.contains_any(title_text):
+            decision = REJECT
+        elif company and self.company_matcher.contains_any(normalize_title(company)):
+            decision = REJECT
+        else:
+            decision = NEEDS_DESCRIPTION
+        with self._lock:
+            self.decisions[decision] += 1
+        return decision
+
+    def should_fetch(self, decision):
+        """True if the card needs a detail fetch: undecided, accepted, or a sampled reject"""
+        if decision != REJECT:
+            return True
+        with self._lock:
+            if random.random() < self.audit_rate:
+                self.audited += 1
+                return True
+            self.fetches_avoided += 1
+            return False
+
+    def record_outcome(self, decision, row):
+        """Record the full (title + description) classification of a fetched card (its row, or None); returns is_it
+
+        The full classifier matches IT keywords as substrings, so 'it', 'is', 'go' or 'ex' make
+        nearly any description IT. An audited reject therefore only counts as IT if its title or
+        description has an unambiguous IT term as a whole word.
+        """
+        is_it = row is not None
+        if decision == REJECT and is_it:
+            text = normalize_title(f"{row.get('title') or ''} {row.get('description') or ''}")
+            is_it = self.audit_matcher.contains_any(text)
+        with self._lock:
+            self.outcomes[decision][is_it] += 1
+            if decision == REJECT and is_it:
+                self.rejects_kept += 1
+        return is_it
+
+    def stats(self):
+        """Decision counts, fetches avoided and agreement with the full classifier
+
+        accept_precision is the share of accepted cards the full classifier kept; reject_precision
+        the share of audited rejects with no whole-word IT term (see record_outcome()).
+        """
+        with self._lock:
+            accept_checked = sum(self.outcomes[ACCEPT].values())
+            reject_checked = sum(self.outcomes[REJECT].values())
+            return {
+                "decisions": dict(self.decisions),
+                "fetches_avoided": self.fetches_avoided,
+                "audited_rejects": self.audited,
+                "audited_rejects_kept": self.rejects_kept,
+                "accept_precision": self.outcomes[ACCEPT][True] / accept_checked if accept_checked else None,
+                "reject_precision": self.outcomes[REJECT][False] / reject_checked if reject_checked else None
+            }
+
+    def log_stats(self):
+        logger.info("Title pre-filter: %s", self.stats())
@@ -0,0 +1,197 @@
+from datetime import datetime
+from pathlib import Path
+import logging
+import sqlite3
+import threading
+
+from job_index import COMBINATION_SEPARATOR, SORT_FILTER_SEPARATOR, parse_combinations
+from metrics import METRICS
+from sinks import JOB_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+# One store that daily scrapes accumulate into, instead of a new timestamped file per run
+DEFAULT_STORE_PATH = Path('data') / 'linkedin_jobs.sqlite'
+
+STORE_COLUMNS = JOB_COLUMNS + ["description_sentiment"]
+
+# Column types other than TEXT
+COLUMN_TYPES = {"description_sentiment": "REAL"}
+
+# Columns that keep the value a job was first stored with: the combination that first found it.
+# Every combination it showed up under goes to the job_combinations table and the combinations column.
+FIRST_SEEN_COLUMNS = {"sort_method", "time_filter"}
+
+# Columns with an index, for filters pushed down from the analysis side
+INDEXED_COLUMNS = ["posted_date", "company", "category"]
+
+
+class JobStore:
+    """SQLite job store: one row per job_id, upserted in batched transactions"""
+
+    def __init__(self, path=DEFAULT_STORE_PATH):
+        self.path = Path(path)
+        self.rows_written = 0
+        # Called with each batch of rows once its transaction is committed
+        self.on_durable = None
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Planned scrapes write from several partition threads; writes are serialized by the lock.
+        # Distributed workers share the file too, so wait for other processes' transactions.
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.row_factory = sqlite3.Row
+        self._create_schema()
+
+    @METRICS.timed("sink_write_seconds", sink="sqlite")
+    def write(self, rows):
+        """Upsert rows in a single transaction; returns True once committed"""
+        if not rows:
+            return False
+        now = datetime.now().isoformat(timespec='seconds')
+        columns = ", ".join(STORE_COLUMNS)
+        placeholders = ", ".join("?" for _ in STORE_COLUMNS)
+        # A failed detail fetch leaves fields empty; keep what an earlier run stored for them
+        updates = ", ".join(
+            f"{column} = COALESCE(jobs.{column}, excluded.{column})" if column in FIRST_SEEN_COLUMNS
+            else f"{column} = COALESCE(excluded.{column}, jobs.{column})"
+            for column in STORE_COLUMNS if column != "job_id"
+        )
+        sql = (
+            f"INSERT INTO jobs ({columns}, first_seen, last_seen) VALUES ({placeholders}, ?, ?) "
+            f"ON CONFLICT(job_id) DO UPDATE SET {updates}, last_seen = excluded.last_seen"
+        )
+        try:
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    sql, [[_to_text(row.get(column)) for column in STORE_COLUMNS] + [now, now] for row in rows]
+                )
+                self._add_combinations(rows)
+                self.rows_written += len(rows)
+            METRICS.inc("rows_written_total", len(rows), sink="sqlite")
+            logger.info("Data saved/appended to %s", self.path)
+        except Exception as e:
+            logger.error("Error saving data: %s", e)
+            return False
+        if self.on_durable is not None:
+            self.on_durable(rows)
+        return True
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def count(self):
+        return self._conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def has_job(self, job_id):
+        return self._conn.execute("SELECT 1 FROM jobs WHERE job_id = ?", (job_id,)).fetchone() is not None
+
+    def known_job_ids(self):
+        """Every job_id in the store"""
+        return {row[0] for row in self._conn.execute("SELECT job_id FROM jobs")}
+
+    def max_posted_date(self):
+        """Newest posted_date in the store (the incremental scrape's high-water mark), or None"""
+        return self._conn.execute("SELECT MAX(posted_date) FROM jobs").fetchone()[0]
+
+    def touch(self, job_ids):
+        """Bump last_seen for jobs that showed up again without being re-scraped"""
+        if not job_ids:
+            return
+        now = datetime.now().isoformat(timespec='seconds')
+        with self._lock, self._conn:
+            self._conn.executemany("UPDATE jobs SET last_seen = ? WHERE job_id = ?", [(now, job_id) for job_id in job_ids])
+
+    def add_combinations(self, rows):
+        """Record the sort/filter combinations rows (job_id, sort_method, time_filter) showed up under,
+        for jobs already stored, without rewriting the jobs"""
+        rows = [row for row in rows if self.has_job(row["job_id"])]
+        if not rows:
+            return
+        with self._lock, self._conn:
+            self._add_combinations(rows)
+
+    def set_column(self, column, values):
+        """Set one column for many jobs from a {job_id: value} mapping, in one transaction"""
+        if column not in STORE_COLUMNS:
+            raise ValueError(f"Unknown job store column: {column}")
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"UPDATE jobs SET {column} = ? WHERE job_id = ?", [(value, job_id) for job_id, value in values.items()]
+            )
+
+    def combinations(self, job_id):
+        """Every (sort_method, time_filter) combination job_id was stored under, in first-seen order"""
+        return [tuple(row) for row in self._conn.execute(
+            "SELECT sort_method, time_filter FROM job_combinations WHERE job_id = ? ORDER BY rowid", (job_id,)
+        )]
+
+    def query(self, where=None, params=(), columns=None, order_by=None, limit=None):
+        """Rows as dicts, with filtering done by SQLite, e.g. query("company = ?", ("WSO2",))"""
+        sql = f"SELECT {', '.join(columns) if columns else '*'} FROM jobs"
+        if where:
+            sql += f" WHERE {where}"
+        if order_by:
+            sql += f" ORDER BY {order_by}"
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        return [dict(row) for row in self._conn.execute(sql, params)]
+
+    def to_dataframe(self, where=None, params=(), columns=None):
+        """Load (a filtered part of) the store as a DataFrame"""
+        import pandas as pd
+
+        return pd.DataFrame(self.query(where, params, columns), columns=columns)
+
+    def _create_schema(self):
+        column_defs = ", ".join(
+            f"{column} TEXT PRIMARY KEY" if column == "job_id" else f"{column} {COLUMN_TYPES.get(column, 'TEXT')}"
+            for column in STORE_COLUMNS
+        )
+        with self._conn:
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS jobs ({column_defs}, first_seen TEXT NOT NULL, last_seen TEXT NOT NULL)"
+            )
+            # Stores created before a column was added get it as an empty column
+            existing = {row[1] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+            for column in STORE_COLUMNS:
+                if column not in existing:
+                    self._conn.execute(f"ALTER TABLE jobs ADD COLUMN {column} {COLUMN_TYPES.get(column, 'TEXT')}")
+            for column in INDEXED_COLUMNS:
+                self._conn.execute(f"CREATE INDEX IF NOT EXISTS idx_jobs_{column} ON jobs ({column})")
+            has_combinations = self._conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'job_combinations'"
+            ).fetchone()
+            if not has_combinations:
+                self._conn.execute(
+                    "CREATE TABLE job_combinations (job_id TEXT NOT NULL, sort_method TEXT NOT NULL, "
+                    "time_filter TEXT NOT NULL, PRIMARY KEY (job_id, sort_method, time_filter))"
+                )
+                # Stores from before the table existed only know each job's stored combination
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO job_combinations SELECT job_id, sort_method, time_filter FROM jobs "
+                    "WHERE sort_method IS NOT NULL AND time_filter IS NOT NULL"
+                )
+
+    def _add_combinations(self, rows):
+        """Record the rows' sort/filter combinations and rebuild their combinations column"""
+        combinations = []
+        for row in rows:
+            pairs = [(row.get("sort_method"), row.get("time_filter"))] + parse_combinations(row.get("combinations"))
+            combinations += [(row["job_id"], sort_method, time_filter) for sort_method, time_filter in pairs
+                             if sort_method and time_filter]
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO job_combinations (job_id, sort_method, time_filter) VALUES (?, ?, ?)", combinations
+        )
+        self._conn.executemany(
+            "UPDATE jobs SET combinations = ("
+            f"SELECT group_concat(sort_method || '{SORT_FILTER_SEPARATOR}' || time_filter, '{COMBINATION_SEPARATOR}') "
+            "FROM (SELECT sort_method, time_filter FROM job_combinations WHERE job_id = jobs.job_id ORDER BY rowid)"
+            ") WHERE job_id = ?",
+            [(job_id,) for job_id in dict.fromkeys(row["job_id"] for row in rows)]
+        )
+
+
+def _to_text(value):
+    return None if value is None else str(value)
@@ -0,0 +1,126 @@
+from collections import deque, namedtuple
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; the pure-Python automaton gives the same results
+    ahocorasick = None
+
+# Keywords found in a text and the groups (categories) they belong to
+KeywordMatch = namedtuple('KeywordMatch', ['keywords', 'categories'])
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton that finds every keyword occurring as a substring of a text in one pass"""
+
+    def __init__(self, keyword_groups, use_native=True):
+        # keyword -> tuple of group names, in the order the groups were given
+        self.groups = {}
+        for group, keywords in keyword_groups.items():
+            for keyword in keywords:
+                keyword = keyword.lower()
+                if not keyword:
+                    continue
+                labels = self.groups.setdefault(keyword, ())
+                if group not in labels:
+                    self.groups[keyword] = labels + (group,)
+
+        if use_native and ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for keyword in self.groups:
+                self._automaton.add_word(keyword, keyword)
+            self._automaton.make_automaton()
+            self._iter = self._iter_native
+            self._iter_spans = self._iter_spans_native
+        else:
+            self._build_automaton()
+            self._iter = self._iter_python
+            self._iter_spans = self._iter_spans_python
+
+    def iter_keywords(self, text):
+        """Yield each keyword occurrence in text (text is expected to be lower-cased already)"""
+        return self._iter(text)
+
+    def iter_spans(self, text):
+        """Yield (start, end, keyword) for each keyword occurrence, with text[start:end] == keyword"""
+        return self._iter_spans(text)
+
+    def find(self, text):
+        """Set of distinct keywords found in text"""
+        return set(self._iter(text))
+
+    def match(self, text):
+        """Keywords found in text together with the groups they belong to"""
+        keywords = frozenset(self._iter(text))
+        categories = frozenset(group for keyword in keywords for group in self.groups[keyword])
+        return KeywordMatch(keywords, categories)
+
+    def contains_any(self, text):
+        """True as soon as any keyword is found"""
+        for _ in self._iter(text):
+            return True
+        return False
+
+    def _iter_native(self, text):
+        for _, keyword in self._automaton.iter(text):
+            yield keyword
+
+    def _iter_spans_native(self, text):
+        for last, keyword in self._automaton.iter(text):
+            yield last + 1 - len(keyword), last + 1, keyword
+
+    def _build_automaton(self):
+        """Build goto/fail/output tables for the pure-Python automaton"""
+        goto = [{}]
+        outputs = [()]
+        for keyword in self.groups:
+            state = 0
+            for char in keyword:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    outputs.append(())
+                state = next_state
+            outputs[state] = outputs[state] + (keyword,)
+
+        # Breadth-first pass: fail links point to the longest proper suffix that is also a trie prefix
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(char, 0)
+                outputs[next_state] = outputs[next_state] + outputs[fail[next_state]]
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = outputs
+
+    def _iter_python(self, text):
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if outputs[state]:
+                yield from outputs[state]
+
+    def _iter_spans_python(self, text):
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for keyword in outputs[state]:
+                yield index + 1 - len(keyword), index + 1, keyword
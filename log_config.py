@@ -0,0 +1,179 @@
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler, TimedRotatingFileHandler
+from pathlib import Path
+import atexit
+import json
+import logging
+import multiprocessing
+import queue
+import re
+import threading
+import time
+
+# JSON lines, one record per line; rotated so the log no longer grows forever
+DEFAULT_LOG_FILE = Path('logs') / 'linkedin_scraper.jsonl'
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 5
+
+CONSOLE_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+# Structured fields callers attach with extra={...}; copied into the JSON record when present
+CONTEXT_FIELDS = ('job_id', 'combination', 'page', 'endpoint', 'status', 'worker_id', 'suppressed')
+
+# Repeated warnings/errors: the first ERROR_SAMPLE_BURST of a kind per window are logged, the rest counted
+ERROR_SAMPLE_BURST = 5
+ERROR_SAMPLE_WINDOW = 60
+
+_listener = None
+# Queue that process-pool workers log into, drained by _worker_listener in the parent
+_worker_queue = None
+_worker_listener = None
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record, with the structured context fields as top-level keys"""
+
+    def format(self, record):
+        entry = {
+            "time": datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage()
+        }
+        for field in CONTEXT_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class ErrorSampler(logging.Filter):
+    """Rate-limit repeated warnings and errors, e.g. a storm of connection resets
+
+    Records of the same kind (logger, level, message template and exception types) beyond
+    `burst` per `window` seconds are dropped; the next one let through carries the number
+    dropped in its `suppressed` field.
+    """
+
+    def __init__(self, burst=ERROR_SAMPLE_BURST, window=ERROR_SAMPLE_WINDOW, level=logging.WARNING):
+        super().__init__()
+        self.burst = burst
+        self.window = window
+        self.level = level
+        self._lock = threading.Lock()
+        # kind -> [window start, records let through in the window, records dropped since last one let through]
+        self._kinds = {}
+
+    def filter(self, record):
+        if record.levelno < self.level:
+            return True
+        kind = self._kind(record)
+        now = time.monotonic()
+        with self._lock:
+            state = self._kinds.get(kind)
+            if state is None or now - state[0] >= self.window:
+                state = self._kinds[kind] = [now, 0, state[2] if state else 0]
+            if state[1] >= self.burst:
+                state[2] += 1
+                return False
+            state[1] += 1
+            if state[2]:
+                record.suppressed = state[2]
+                state[2] = 0
+        return True
+
+    @staticmethod
+    def _kind(record):
+        if record.args:
+            errors = tuple(type(arg).__name__ for arg in record.args if isinstance(arg, BaseException))
+            return record.name, record.levelno, str(record.msg), errors
+        # Pre-formatted messages: ignore the numbers (page, job id, port) that differ between repeats
+        return record.name, record.levelno, re.sub(r"\d+", "N", str(record.msg))[:200]
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """QueueHandler that leaves message formatting to the listener thread
+
+    The stock handler formats every record in the calling thread; the scraper's records only
+    carry strings, numbers and exceptions as arguments, so they are safe to format later.
+    """
+
+    def prepare(self, record):
+        return record
+
+
+def configure_worker_logging(log_queue, level=logging.INFO):
+    """Process-pool initializer: send the worker's records to the parent's listener through log_queue
+
+    Workers forked from a configured parent would otherwise keep the parent's in-process queue,
+    which nothing drains in the child. The stock QueueHandler formats records before they are
+    pickled onto the queue, so tracebacks and arbitrary arguments survive the trip.
+    """
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.addFilter(ErrorSampler())
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(level)
+
+
+def worker_logging():
+    """ProcessPoolExecutor keyword arguments that make its workers log through configure_logging's handlers
+
+    Empty when logging was not set up with configure_logging, leaving workers with what they inherit.
+    """
+    if _worker_queue is None:
+        return {}
+    return {"initializer": configure_worker_logging, "initargs": (_worker_queue, logging.getLogger().level)}
+
+
+def configure_logging(log_file=DEFAULT_LOG_FILE, level=logging.INFO, max_bytes=DEFAULT_MAX_BYTES,
+                      backup_count=DEFAULT_BACKUP_COUNT, rotate_when=None, console=True):
+    """Send all logging through a queue to a rotating JSON-lines file and the console
+
+    Rotation is by size unless rotate_when is given (e.g. 'midnight', see TimedRotatingFileHandler).
+    Process pools created with worker_logging() log to the same handlers through a second,
+    multiprocessing queue. Returns the QueueListener; both listeners are stopped (flushing their
+    queues) at interpreter exit.
+    """
+    global _listener, _worker_queue, _worker_listener
+    if _listener is not None:
+        return _listener
+
+    log_file = Path(log_file)
+    try:
+        file_handler = _file_handler(log_file, max_bytes, backup_count, rotate_when)
+    except PermissionError:
+        file_handler = _file_handler(Path.home() / log_file.name, max_bytes, backup_count, rotate_when)
+    file_handler.setFormatter(JsonFormatter())
+    handlers = [file_handler]
+    if console:
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(logging.Formatter(CONSOLE_FORMAT))
+        handlers.append(console_handler)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = _DeferredQueueHandler(log_queue)
+    queue_handler.addFilter(ErrorSampler())
+
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(level)
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    _worker_queue = multiprocessing.Queue()
+    _worker_listener = QueueListener(_worker_queue, *handlers, respect_handler_level=True)
+    _worker_listener.start()
+    atexit.register(_worker_listener.stop)
+    return _listener
+
+
+def _file_handler(log_file, max_bytes, backup_count, rotate_when):
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+    if rotate_when:
+        return TimedRotatingFileHandler(log_file, when=rotate_when, backupCount=backup_count, encoding='utf-8')
+    return RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8')
@@ -0,0 +1,186 @@
+from bisect import bisect_left
+from contextlib import contextmanager
+from datetime import datetime
+from functools import wraps
+from pathlib import Path
+import json
+import logging
+import random
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Latency bucket upper bounds in seconds (Prometheus histogram "le" labels)
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+# Samples kept per histogram for percentiles; beyond this a uniform reservoir sample is kept
+MAX_SAMPLES = 10000
+
+PERCENTILES = (50, 90, 99)
+
+DEFAULT_METRICS_DIR = Path('data') / 'metrics'
+
+PROMETHEUS_PREFIX = 'linkedin_scraper_'
+
+
+class Histogram:
+    """Bucketed observations with count, sum, min/max and sampled percentiles"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.bucket_counts = [0] * (len(buckets) + 1)  # Last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+        self._samples = []
+
+    def observe(self, value):
+        self.bucket_counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        if len(self._samples) < MAX_SAMPLES:
+            self._samples.append(value)
+        else:
+            slot = random.randrange(self.count)
+            if slot < MAX_SAMPLES:
+                self._samples[slot] = value
+
+    def percentiles(self, percentiles=PERCENTILES):
+        """{p: value} from the kept samples (exact up to MAX_SAMPLES observations)"""
+        ordered = sorted(self._samples)
+        if not ordered:
+            return {p: None for p in percentiles}
+        return {p: ordered[int(round(p / 100 * (len(ordered) - 1)))] for p in percentiles}
+
+    def summary(self):
+        summary = {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "min": self.min,
+            "max": self.max,
+            "mean": self.sum / self.count if self.count else None
+        }
+        for p, value in self.percentiles().items():
+            summary[f"p{p}"] = value
+        return summary
+
+
+class MetricsRegistry:
+    """Thread-safe counters and histograms keyed by name and labels"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters = {}
+        self.histograms = {}
+        self.started_at = datetime.now()
+
+    def inc(self, name, value=1, **labels):
+        key = (name, _label_key(labels))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name, value, **labels):
+        key = (name, _label_key(labels))
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram()
+            histogram.observe(value)
+
+    @contextmanager
+    def timer(self, name, **labels):
+        """Observe the time spent in a with block, in seconds"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def timed(self, name, **labels):
+        """Decorator form of timer()"""
+        def decorator(fn):
+            @wraps(fn)
+            def wrapper(*args, **kwargs):
+                with self.timer(name, **labels):
+                    return fn(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def report(self):
+        """All metrics as a JSON-serializable dict"""
+        with self._lock:
+            return {
+                "started_at": self.started_at.isoformat(timespec='seconds'),
+                "finished_at": datetime.now().isoformat(timespec='seconds'),
+                "counters": [
+                    {"name": name, "labels": dict(labels), "value": value}
+                    for (name, labels), value in sorted(self.counters.items())
+                ],
+                "histograms": [
+                    {"name": name, "labels": dict(labels), **histogram.summary()}
+                    for (name, labels), histogram in sorted(self.histograms.items())
+                ]
+            }
+
+    def to_prometheus(self):
+        """Metrics in the Prometheus text exposition format"""
+        lines = []
+        with self._lock:
+            for name in sorted({name for name, _ in self.counters}):
+                metric = f"{PROMETHEUS_PREFIX}{name}"
+                lines.append(f"# TYPE {metric} counter")
+                for (counter_name, labels), value in sorted(self.counters.items()):
+                    if counter_name == name:
+                        lines.append(f"{metric}{_format_labels(labels)} {value}")
+            for name in sorted({name for name, _ in self.histograms}):
+                metric = f"{PROMETHEUS_PREFIX}{name}"
+                lines.append(f"# TYPE {metric} histogram")
+                for (histogram_name, labels), histogram in sorted(self.histograms.items()):
+                    if histogram_name != name:
+                        continue
+                    cumulative = 0
+                    for bound, count in zip(histogram.buckets + ("+Inf",), histogram.bucket_counts):
+                        cumulative += count
+                        lines.append(f"{metric}_bucket{_format_labels(labels + (('le', str(bound)),))} {cumulative}")
+                    lines.append(f"{metric}_sum{_format_labels(labels)} {histogram.sum}")
+                    lines.append(f"{metric}_count{_format_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def write_report(self, path=None, prometheus_path=None):
+        """Write the JSON report (and optionally the Prometheus text file); returns the JSON path"""
+        if path is None:
+            path = DEFAULT_METRICS_DIR / f"run_{self.started_at.strftime('%Y%m%d_%H%M%S')}.json"
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=2)
+        logger.info("Run metrics written to %s", path)
+        if prometheus_path:
+            prometheus_path = Path(prometheus_path)
+            prometheus_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(prometheus_path, 'w', encoding='utf-8') as f:
+                f.write(self.to_prometheus())
+            logger.info("Prometheus metrics written to %s", prometheus_path)
+        return path
+
+
+def _label_key(labels):
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label(value)}"' for name, value in labels) + "}"
+
+
+def _escape_label(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# Process-wide registry the scraper modules record into
+METRICS = MetricsRegistry()
@@ -0,0 +1,222 @@
+import logging
+import os
+
+from bs4 import BeautifulSoup
+
+from metrics import METRICS
+
+try:
+    import lxml.html
+except ImportError:  # lxml is optional; BeautifulSoup's html.parser is always available
+    lxml = None
+
+logger = logging.getLogger(__name__)
+
+# Backend used when none is configured; override with the LINKEDIN_PARSER environment variable
+DEFAULT_PARSER = os.environ.get('LINKEDIN_PARSER', 'lxml')
+
+# Job criteria headers and the field each one fills
+CRITERIA_FIELDS = {
+    "Seniority level": "experience_level",
+    "Employment type": "employment_type",
+    "Job function": "job_function",
+    "Industries": "industries"
+}
+
+# Fields LinkedIn's guest pages don't expose, kept so every row has the same columns
+EMPTY_DETAIL_FIELDS = {
+    "salary": None,  # LinkedIn rarely shows salary
+    "required_skills": None,  # Skills are often in description
+    "company_size": None,
+    "company_industry": None,
+    "applicant_count": None
+}
+
+
+class SoupParser:
+    """Reference parser built on BeautifulSoup's pure-Python html.parser"""
+
+    name = 'bs4'
+
+    @METRICS.timed("parse_seconds", page="cards", parser="bs4")
+    def parse_cards(self, html, sort_method, time_filter):
+        """Extract the basic fields of every job card on a search page"""
+        soup = BeautifulSoup(html, 'html.parser')
+        cards_data = []
+        for card in soup.find_all("div", {"class": "base-card"}):
+            job_data = extract_card_data(card, sort_method, time_filter)
+            if job_data:
+                cards_data.append(job_data)
+        return cards_data
+
+    @METRICS.timed("parse_seconds", page="details", parser="bs4")
+    def parse_details(self, html):
+        """Extract description and job criteria from a job posting page"""
+        soup = BeautifulSoup(html, 'html.parser')
+
+        details = {}
+
+        # Extract description
+        desc_element = soup.find("div", {"class": "show-more-less-html__markup"})
+        if desc_element:
+            details["description"] = desc_element.get_text(strip=True)
+
+        # Extract job criteria
+        criteria_list = soup.find("ul", {"class": "description__job-criteria-list"})
+        if criteria_list:
+            for item in criteria_list.find_all("li"):
+                header = item.find("h3", {"class": "description__job-criteria-subheader"})
+                if header:
+                    value = item.find("span", {"class": "description__job-criteria-text"})
+                    if value:
+                        _set_criteria(details, header.text.strip(), value.text.strip())
+
+        details.update(EMPTY_DETAIL_FIELDS)
+        return details
+
+
+class LxmlParser:
+    """Fast parser using lxml's C HTML parser and XPath; produces the same fields as SoupParser"""
+
+    name = 'lxml'
+
+    @METRICS.timed("parse_seconds", page="cards", parser="lxml")
+    def parse_cards(self, html, sort_method, time_filter):
+        """Extract the basic fields of every job card on a search page"""
+        tree = _parse_tree(html)
+        cards_data = []
+        for card in tree.xpath(class_xpath("div", "base-card")):
+            try:
+                job_link = first_by_class(card, "a", "base-card__full-link")
+                if job_link is None:
+                    continue
+
+                job_url = job_link.get('href').split('?')[0]
+                title_elem = first_by_class(card, "h3", "base-search-card__title")
+                company_elem = first_by_class(card, "h4", "base-search-card__subtitle")
+                location_elem = first_by_class(card, "span", "job-search-card__location")
+                time_elems = card.xpath(".//time")
+                time_elem = time_elems[0] if time_elems else None
+
+                cards_data.append({
+                    "job_id": job_url.split('-')[-1],
+                    "title": title_elem.text_content().strip() if title_elem is not None else None,
+                    "company": company_elem.text_content().strip() if company_elem is not None else None,
+                    "location": location_elem.text_content().strip() if location_elem is not None else None,
+                    "posted_date": time_elem.get("datetime") if time_elem is not None else None,
+                    "job_url": job_url,
+                    "sort_method": sort_method,
+                    "time_filter": time_filter
+                })
+            except Exception as e:
+                logger.error("Error extracting job data: %s", e)
+        return cards_data
+
+    @METRICS.timed("parse_seconds", page="details", parser="lxml")
+    def parse_details(self, html):
+        """Extract description and job criteria from a job posting page"""
+        tree = _parse_tree(html)
+
+        details = {}
+
+        desc_element = first_by_class(tree, "div", "show-more-less-html__markup")
+        if desc_element is not None:
+            # Same as BeautifulSoup's get_text(strip=True): stripped text nodes, comments excluded
+            details["description"] = "".join(
+                text.strip() for text in desc_element.xpath(".//text()") if text.strip()
+            )
+
+        criteria_list = first_by_class(tree, "ul", "description__job-criteria-list")
+        if criteria_list is not None:
+            for item in criteria_list.xpath(".//li"):
+                header = first_by_class(item, "h3", "description__job-criteria-subheader")
+                if header is not None:
+                    value = first_by_class(item, "span", "description__job-criteria-text")
+                    if value is not None:
+                        _set_criteria(details, header.text_content().strip(), value.text_content().strip())
+
+        details.update(EMPTY_DETAIL_FIELDS)
+        return details
+
+
+PARSERS = {
+    SoupParser.name: SoupParser,
+    LxmlParser.name: LxmlParser
+}
+
+
+def get_parser(name=None):
+    """Return a parser backend by name, falling back to BeautifulSoup if lxml is unavailable"""
+    name = name or DEFAULT_PARSER
+    if name not in PARSERS:
+        raise ValueError(f"Unknown parser backend {name!r}, choose from {sorted(PARSERS)}")
+    if name == LxmlParser.name and lxml is None:
+        logger.warning("lxml is not installed, falling back to the BeautifulSoup parser")
+        name = SoupParser.name
+    return PARSERS[name]()
+
+
+def extract_card_data(card, sort_method, time_filter):
+    """Extract the basic fields shown on a BeautifulSoup job card"""
+    try:
+        job_data = {}
+
+        # Get job link and ID
+        job_link = card.find("a", {"class": "base-card__full-link"})
+        if not job_link:
+            return None
+
+        job_url = job_link.get('href').split('?')[0]
+        job_id = job_url.split('-')[-1]
+
+        # Extract basic info from card
+        title_elem = card.find("h3", {"class": "base-search-card__title"})
+        company_elem = card.find("h4", {"class": "base-search-card__subtitle"})
+        location_elem = card.find("span", {"class": "job-search-card__location"})
+        time_elem = card.find("time")
+
+        job_data.update({
+            "job_id": job_id,
+            "title": title_elem.text.strip() if title_elem else None,
+            "company": company_elem.text.strip() if company_elem else None,
+            "location": location_elem.text.strip() if location_elem else None,
+            "posted_date": time_elem.get("datetime") if time_elem else None,
+            "job_url": job_url,
+            "sort_method": sort_method,
+            "time_filter": time_filter
+        })
+
+        return job_data
+
+    except Exception as e:
+        logger.error("Error extracting job data: %s", e)
+        return None
+
+
+def _set_criteria(details, header_text, value_text):
+    for label, field in CRITERIA_FIELDS.items():
+        if label in header_text:
+            details[field] = value_text
+            return
+
+
+def class_xpath(tag, class_name):
+    """XPath matching tag elements whose class list contains class_name, like bs4's class filter
+
+    The context element itself is included: lxml returns a fragment's only element as the root,
+    e.g. a search page that is a single job card.
+    """
+    return f"descendant-or-self::{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+
+
+def _parse_tree(html):
+    """lxml tree for a page; an empty body (what LinkedIn sends past the last results page) gives an empty tree"""
+    try:
+        return lxml.html.fromstring(html)
+    except lxml.etree.ParserError:
+        return lxml.html.fromstring("<html></html>")
+
+
+def first_by_class(element, tag, class_name):
+    matches = element.xpath(class_xpath(tag, class_name))
+    return matches[0] if matches else None
@@ -0,0 +1,174 @@
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from itertools import chain
+import logging
+import os
+import queue
+import threading
+import time
+
+from detail_fetcher import DEFAULT_DETAIL_WORKERS
+from log_config import worker_logging
+from metrics import METRICS
+
+logger = logging.getLogger(__name__)
+
+# Processes parsing and classifying detail pages; one core is left for the fetch threads
+DEFAULT_PARSE_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+
+# Fetched pages waiting for the parse stage, and parse tasks in flight; bounds the HTML held in memory
+DEFAULT_QUEUE_SIZE = 10
+
+STAGES = ('fetch', 'parse', 'classify', 'write')
+
+
+class StageStats:
+    """Items handled and time spent by one pipeline stage"""
+
+    def __init__(self, name):
+        self.name = name
+        self.items = 0
+        self.seconds = 0.0
+        # Time the stage spent blocked because the next stage's queue was full
+        self.blocked_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, items, seconds, blocked_seconds=0.0):
+        METRICS.observe("pipeline_stage_seconds", seconds, stage=self.name)
+        with self._lock:
+            self.items += items
+            self.seconds += seconds
+            self.blocked_seconds += blocked_seconds
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "items": self.items,
+                "seconds": round(self.seconds, 3),
+                "blocked_seconds": round(self.blocked_seconds, 3),
+                "items_per_busy_second": round(self.items / self.seconds, 1) if self.seconds else None
+            }
+
+
+class DetailPipeline:
+    """fetch -> parse -> classify stages for a page of job cards, connected by bounded queues
+
+    Fetch threads download detail pages and hand the HTML to a queue of at most queue_size
+    entries; when the parse stage falls behind, the fetch threads block instead of piling up
+    pages. Parsing and classification run together in a process pool, so they use other cores
+    instead of competing with the fetch threads for the GIL. parse_fn and classify_fn must be
+    picklable (module-level functions or methods of module-level classes).
+    """
+
+    def __init__(self, fetch_fn, parse_fn, classify_fn, fetch_workers=DEFAULT_DETAIL_WORKERS,
+                 parse_workers=DEFAULT_PARSE_WORKERS, queue_size=DEFAULT_QUEUE_SIZE, job_index=None):
+        self.fetch_fn = fetch_fn
+        self.parse_fn = parse_fn
+        self.classify_fn = classify_fn
+        self.fetch_workers = fetch_workers
+        self.queue_size = queue_size
+        self.job_index = job_index
+        self.stages = {name: StageStats(name) for name in STAGES}
+        self._fetch_pool = ThreadPoolExecutor(max_workers=fetch_workers, thread_name_prefix="fetch")
+        self._parse_pool = ProcessPoolExecutor(max_workers=parse_workers, **worker_logging())
+
+    def process(self, cards_data):
+        """Fetch, parse and classify a page of cards; returns classify_fn's result per card, in card order"""
+        results = [None] * len(cards_data)
+        parse_queue = queue.Queue(maxsize=self.queue_size)
+
+        cached = []
+        fetches = 0
+        for index, job_data in enumerate(cards_data):
+            details = self.job_index.get_details(job_data["job_id"]) if self.job_index is not None else None
+            if details is not None:
+                # Fetched earlier in the run; only the classify stage is left
+                cached.append((index, job_data, None, details))
+            else:
+                self._fetch_pool.submit(self._fetch, parse_queue, index, job_data)
+                fetches += 1
+
+        in_flight = {}
+        for index, job_data, html, details in chain(cached, (parse_queue.get() for _ in range(fetches))):
+            future = self._parse_pool.submit(parse_and_classify, self.parse_fn, self.classify_fn, job_data, html, details)
+            in_flight[future] = (index, job_data, details is None)
+            if len(in_flight) >= self.queue_size:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                self._collect(done, in_flight, results)
+        self._collect(list(in_flight), in_flight, results)
+        return results
+
+    def timed_sink(self, sink):
+        """Wrap a sink so its writes are counted as the write stage"""
+        return TimedSink(sink, self.stages['write'])
+
+    def stats(self):
+        return {name: stage.snapshot() for name, stage in self.stages.items()}
+
+    def log_stats(self):
+        logger.info("Pipeline stages: %s", self.stats())
+
+    def close(self):
+        self._fetch_pool.shutdown()
+        self._parse_pool.shutdown()
+
+    def _fetch(self, parse_queue, index, job_data):
+        start = time.perf_counter()
+        try:
+            html = self.fetch_fn(job_data["job_id"])
+        except Exception as e:
+            logger.error("Error fetching details for job %s: %s", job_data["job_id"], e, extra={"job_id": job_data["job_id"]})
+            html = None
+        fetched = time.perf_counter()
+        parse_queue.put((index, job_data, html, None))  # Blocks while the parse stage is behind
+        self.stages['fetch'].record(1, fetched - start, time.perf_counter() - fetched)
+
+    def _collect(self, futures, in_flight, results):
+        for future in futures:
+            index, job_data, fetched = in_flight.pop(future)
+            try:
+                details, row, parse_seconds, classify_seconds = future.result()
+            except Exception as e:
+                logger.error("Error extracting job data: %s", e, extra={"job_id": job_data["job_id"]})
+                continue
+            if fetched:
+                self.stages['parse'].record(1, parse_seconds)
+                # Failed fetches are not cached so a later combination can try again
+                if details and self.job_index is not None:
+                    self.job_index.add(job_data["job_id"], details)
+            self.stages['classify'].record(1, classify_seconds)
+            results[index] = row
+
+
+class TimedSink:
+    """Sink wrapper that records write time and row counts in a StageStats"""
+
+    def __init__(self, sink, stats):
+        self.sink = sink
+        self.stats = stats
+
+    def write(self, rows):
+        start = time.perf_counter()
+        saved = self.sink.write(rows)
+        self.stats.record(len(rows) if saved else 0, time.perf_counter() - start)
+        return saved
+
+    @property
+    def on_durable(self):
+        return self.sink.on_durable
+
+    @on_durable.setter
+    def on_durable(self, callback):
+        self.sink.on_durable = callback
+
+    def close(self):
+        self.sink.close()
+
+
+def parse_and_classify(parse_fn, classify_fn, job_data, html, details=None):
+    """Worker-process task: parse a detail page (unless details are given) and classify the card"""
+    start = time.perf_counter()
+    if details is None:
+        details = parse_fn(html) if html else {}
+    parsed = time.perf_counter()
+    row = classify_fn(dict(job_data), dict(details))
+    return details, row, parsed - start, time.perf_counter() - parsed
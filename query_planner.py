@@ -0,0 +1,215 @@
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from itertools import product
+from pathlib import Path
+from urllib.parse import urlencode
+import json
+import logging
+import math
+import os
+import threading
+
+from it_keywords import IT_JOB_CATEGORIES
+
+logger = logging.getLogger(__name__)
+
+SEARCH_URL = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
+
+PAGE_SIZE = 25
+
+# LinkedIn's guest search stops serving results after about 40 pages per query
+MAX_PAGES_PER_QUERY = 40
+
+# Search pages fetched across all partitions of one run
+DEFAULT_REQUEST_BUDGET = 400
+
+# Partitions scraped at the same time; they share the rate limiter's search bucket
+DEFAULT_PARTITION_WORKERS = 3
+
+# Default keyword set: the first few search terms of every IT category
+DEFAULT_KEYWORDS_PER_CATEGORY = 2
+
+# New jobs per partition from earlier runs, used to order and size the next plan
+DEFAULT_PLAN_STATS_PATH = Path('data') / 'query_plan_stats.json'
+
+# One search query: location x keywords x sort x time filter
+Partition = namedtuple('Partition', ['location', 'keywords', 'sort_method', 'time_filter'])
+
+
+def build_search_url(location, keywords, sort_value, filter_value, start):
+    params = {"keywords": keywords, "location": location, "sortBy": sort_value, "f_TPR": filter_value, "start": start}
+    return f"{SEARCH_URL}?{urlencode(params)}"
+
+
+def partition_key(partition):
+    return "|".join(partition)
+
+
+def default_keywords(per_category=DEFAULT_KEYWORDS_PER_CATEGORY):
+    return [keyword for keywords in IT_JOB_CATEGORIES.values() for keyword in keywords[:per_category]]
+
+
+def load_plan_config(path):
+    """Read a JSON plan config: {"locations": [...], "keywords": [...], "sorts": [...], "time_filters": [...],
+    "request_budget": 400}; missing keys fall back to QueryPlanner's defaults"""
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+class QueryPlanner:
+    """Splits a search into location x keyword x sort x filter partitions and scrapes them under one budget
+
+    Partitions are ordered by the new jobs they produced in earlier runs (unseen partitions first,
+    since their yield is unknown), each is given pages in proportion to that estimate, and a
+    partition is pruned as soon as one of its pages has nothing new in it.
+    """
+
+    def __init__(self, sort_options, time_filters, locations=("Sri Lanka",), keywords=None, sorts=('recent',),
+                 filters=('any',), request_budget=DEFAULT_REQUEST_BUDGET, stats_path=DEFAULT_PLAN_STATS_PATH,
+                 known_ids=()):
+        self.sort_options = sort_options
+        self.time_filters = time_filters
+        keywords = default_keywords() if keywords is None else keywords
+        self.partitions = [Partition(*combination) for combination in product(locations, keywords, sorts, filters)]
+        self.request_budget = request_budget
+        self.stats_path = Path(stats_path) if stats_path else None
+        self.history = self._load_history()
+
+        self._lock = threading.Lock()
+        self._seen = set(known_ids)
+        self.requests_made = 0
+        # partition key -> {"pages", "cards", "new_jobs", "pruned"} for this run
+        self.results = {}
+
+    @classmethod
+    def from_config(cls, config, sort_options, time_filters, **kwargs):
+        """Planner for a dict loaded with load_plan_config()"""
+        options = {
+            "locations": config.get("locations"),
+            "keywords": config.get("keywords"),
+            "sorts": config.get("sorts"),
+            "filters": config.get("time_filters"),
+            "request_budget": config.get("request_budget")
+        }
+        options = {name: value for name, value in options.items() if value is not None}
+        return cls(sort_options, time_filters, **options, **kwargs)
+
+    def search_url(self, partition, start):
+        return build_search_url(
+            partition.location, partition.keywords, self.sort_options[partition.sort_method],
+            self.time_filters[partition.time_filter], start
+        )
+
+    def estimate_yield(self, partition):
+        """Expected new jobs: last run's count, or a full query's worth for a partition never run"""
+        previous = self.history.get(partition_key(partition))
+        if previous is None:
+            return MAX_PAGES_PER_QUERY * PAGE_SIZE
+        return previous["new_jobs"]
+
+    def page_allowance(self, partition):
+        """Pages a partition may use: enough for its estimate plus one, and always one probe page"""
+        pages = math.ceil(self.estimate_yield(partition) / PAGE_SIZE) + 1
+        return max(1, min(MAX_PAGES_PER_QUERY, pages))
+
+    def ordered_partitions(self):
+        return sorted(self.partitions, key=self.estimate_yield, reverse=True)
+
+    def run(self, fetch_cards, process_cards, max_workers=DEFAULT_PARTITION_WORKERS):
+        """Scrape every partition; returns the number of new jobs passed to process_cards
+
+        fetch_cards(partition, url) returns the cards of one search page (empty when the query
+        ran out of results) and process_cards(partition, cards) handles the cards no other
+        partition or earlier run has produced. Both are called from worker threads.
+        """
+        partitions = self.ordered_partitions()
+        logger.info(
+            "Query plan: %d partitions, budget %s search pages, %d workers",
+            len(partitions), self.request_budget, max_workers
+        )
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            new_jobs = sum(executor.map(
+                lambda partition: self._run_partition(partition, fetch_cards, process_cards), partitions
+            ))
+        self._save_history()
+        self.log_stats()
+        return new_jobs
+
+    def claim_new(self, cards_data):
+        """Cards whose job_id no partition has produced yet; claiming them makes them known"""
+        with self._lock:
+            fresh = []
+            for job_data in cards_data:
+                if job_data["job_id"] not in self._seen:
+                    self._seen.add(job_data["job_id"])
+                    fresh.append(job_data)
+            return fresh
+
+    def stats(self):
+        with self._lock:
+            pruned = sum(1 for result in self.results.values() if result["pruned"])
+            return {
+                "partitions": len(self.partitions),
+                "partitions_run": len(self.results),
+                "partitions_pruned": pruned,
+                "requests": self.requests_made,
+                "new_jobs": sum(result["new_jobs"] for result in self.results.values())
+            }
+
+    def log_stats(self):
+        logger.info("Query planner: %s", self.stats())
+
+    def _take_request(self):
+        with self._lock:
+            if self.requests_made >= self.request_budget:
+                return False
+            self.requests_made += 1
+            return True
+
+    def _run_partition(self, partition, fetch_cards, process_cards):
+        result = {"pages": 0, "cards": 0, "new_jobs": 0, "pruned": False}
+        try:
+            for page in range(self.page_allowance(partition)):
+                if not self._take_request():
+                    break
+                cards_data = fetch_cards(partition, self.search_url(partition, page * PAGE_SIZE))
+                result["pages"] += 1
+                if not cards_data:
+                    break
+                result["cards"] += len(cards_data)
+
+                new_cards = self.claim_new(cards_data)
+                if not new_cards:
+                    # Nothing new on this page; later pages of the same query overlap even more
+                    result["pruned"] = True
+                    break
+                process_cards(partition, new_cards)
+                result["new_jobs"] += len(new_cards)
+        except Exception as e:
+            logger.error("Error in partition %s: %s", partition_key(partition), e)
+        if result["pages"]:
+            # A partition the budget never reached keeps its old estimate
+            with self._lock:
+                self.results[partition_key(partition)] = result
+        return result["new_jobs"]
+
+    def _load_history(self):
+        if not self.stats_path or not self.stats_path.exists():
+            return {}
+        try:
+            with open(self.stats_path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error("Could not read query plan stats %s: %s", self.stats_path, e)
+            return {}
+
+    def _save_history(self):
+        if not self.stats_path:
+            return
+        history = dict(self.history)
+        history.update(self.results)
+        self.stats_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.stats_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(history, f, indent=2)
+        os.replace(tmp_path, self.stats_path)
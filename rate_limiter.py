@@ -0,0 +1,172 @@
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+import logging
+import random
+import threading
+import time
+
+from circuit_breaker import BREAKER_SETTINGS, CircuitBreaker
+from metrics import METRICS
+
+logger = logging.getLogger(__name__)
+
+# Status codes that mean "slow down" rather than "this request is broken"
+THROTTLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Per-endpoint defaults, in requests per second
+ENDPOINT_LIMITS = {
+    'search': {'rate': 0.3, 'min_rate': 0.02, 'max_rate': 1.0, 'burst': 1},
+    'detail': {'rate': 1.0, 'min_rate': 0.05, 'max_rate': 5.0, 'burst': 3}
+}
+
+DEFAULT_MAX_RETRIES = 4
+BASE_BACKOFF = 5        # seconds, doubled on each retry when there is no Retry-After
+MAX_BACKOFF = 90        # seconds
+
+# Seconds of unthrottled traffic in which a bucket climbs from min_rate back to its configured rate
+RATE_RECOVERY_SECONDS = 60
+
+
+class AdaptiveTokenBucket:
+    """Token bucket whose refill rate grows additively on success and shrinks multiplicatively on throttling
+
+    The rate is cut at most once per backoff window: the requests already in flight when the
+    first throttled response arrives come back throttled too, and must not halve it again.
+    Below the configured rate, successes also restore it over time (min_rate back to rate
+    within `recovery` seconds of unthrottled traffic), since at a throttled rate successes are
+    too far apart for the per-success increase alone.
+    """
+
+    def __init__(self, rate, min_rate, max_rate, burst=1, increase=0.01, decrease=0.5, jitter=0.2,
+                 recovery=RATE_RECOVERY_SECONDS):
+        self.rate = rate
+        self.base_rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.capacity = burst
+        self.increase = increase
+        self.decrease = decrease
+        self.jitter = jitter
+        self.recovery = recovery
+
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._blocked_until = 0.0
+        # When the rate last went up, for the time-based recovery
+        self._last_increase = self._last
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available; return the number of seconds waited"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self._blocked_until:
+                    wait = self._blocked_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                else:
+                    wait = (1 - self._tokens) / self.rate
+            # Randomise the wait a little so requests don't tick like a metronome
+            wait *= 1 + random.uniform(0, self.jitter)
+            time.sleep(wait)
+            waited += wait
+
+    def on_success(self):
+        """Additive increase after a successful request, plus time-based recovery below the configured rate"""
+        with self._lock:
+            now = time.monotonic()
+            # Time spent held back by a backoff, or idle beyond one token interval, is not unthrottled traffic
+            elapsed = min(1 / self.rate, max(0.0, now - max(self._last_increase, self._blocked_until)))
+            self._last_increase = now
+            rate = self.rate
+            if rate < self.base_rate:
+                rate = min(self.base_rate, rate + (self.base_rate - self.min_rate) * elapsed / self.recovery)
+            self.rate = min(self.max_rate, rate + self.increase)
+
+    def on_throttle(self, pause):
+        """Multiplicative decrease, unless already backing off, and hold all requests back for `pause` seconds"""
+        with self._lock:
+            now = time.monotonic()
+            if now >= self._blocked_until:
+                self.rate = max(self.min_rate, self.rate * self.decrease)
+            self._tokens = 0.0
+            self._blocked_until = max(self._blocked_until, now + pause)
+
+    def _refill(self, now):
+        self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+
+class RateLimiter:
+    """Central rate limiter with one adaptive token bucket and one circuit breaker per endpoint"""
+
+    def __init__(self, limits=None, max_retries=DEFAULT_MAX_RETRIES, breaker_settings=None):
+        limits = limits or ENDPOINT_LIMITS
+        breaker_settings = breaker_settings or BREAKER_SETTINGS
+        self.buckets = {endpoint: AdaptiveTokenBucket(**config) for endpoint, config in limits.items()}
+        self.breakers = {
+            endpoint: CircuitBreaker(endpoint, **breaker_settings.get(endpoint, {})) for endpoint in limits
+        }
+        self.max_retries = max_retries
+
+    def request(self, endpoint, send_fn, *args, **kwargs):
+        """Send a request under the endpoint's rate limit, retrying throttled responses
+
+        Raises CircuitOpenError without sending anything while the endpoint's circuit is open
+        (non-blocking breakers only; blocking ones wait for the probe). A request that raises, or
+        is still throttled after the last retry, counts as one failure towards opening the circuit.
+        """
+        bucket = self.buckets[endpoint]
+        breaker = self.breakers[endpoint]
+        breaker.before_request()
+        response = None
+        for attempt in range(self.max_retries + 1):
+            METRICS.observe("rate_limit_wait_seconds", bucket.acquire(), endpoint=endpoint)
+            try:
+                with METRICS.timer("http_request_seconds", endpoint=endpoint):
+                    response = send_fn(*args, **kwargs)
+            except Exception as e:
+                METRICS.inc("http_errors_total", endpoint=endpoint, error=type(e).__name__)
+                breaker.record_failure()
+                raise
+            METRICS.inc("http_responses_total", endpoint=endpoint, status=response.status_code)
+
+            if response.status_code not in THROTTLE_STATUS_CODES:
+                bucket.on_success()
+                breaker.record_success()
+                return response
+
+            pause = parse_retry_after(response.headers.get("Retry-After"))
+            if pause is None:
+                pause = min(MAX_BACKOFF, BASE_BACKOFF * 2 ** attempt) * random.uniform(1, 1.3)
+            bucket.on_throttle(pause)
+            METRICS.observe("rate_limit_backoff_seconds", pause, endpoint=endpoint)
+            logger.warning(
+                "%s: HTTP %s, backing off %.1fs (rate now %.2f/s, attempt %d/%d)",
+                endpoint, response.status_code, pause, bucket.rate, attempt + 1, self.max_retries + 1,
+                extra={"endpoint": endpoint, "status": response.status_code}
+            )
+
+        breaker.record_failure()
+        return response
+
+
+def parse_retry_after(value):
+    """Parse a Retry-After header (seconds or HTTP date) into seconds, or None"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
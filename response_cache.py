@@ -0,0 +1,150 @@
+from pathlib import Path
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = Path('data') / 'cache' / 'http_cache.sqlite'
+DEFAULT_TTL = 7 * 24 * 3600             # detail pages rarely change within a week
+DEFAULT_MAX_BYTES = 500 * 1024 * 1024   # compressed size on disk
+SEARCH_CACHE_TTL = 3600                 # search results go stale much faster
+
+
+class CachedResponse:
+    """Minimal stand-in for requests.Response served from the cache"""
+
+    def __init__(self, url, status_code, content, from_cache=True):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = {}
+        self.from_cache = from_cache
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8', errors='replace')
+
+
+class ResponseCache:
+    """SQLite-backed cache of compressed response bodies with TTL and LRU size eviction"""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl=DEFAULT_TTL, max_bytes=DEFAULT_MAX_BYTES, offline=False):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        # In offline mode nothing is fetched: misses come back as 504s and TTLs are ignored
+        self.offline = offline
+
+        self._conn = None
+        self._lock = threading.Lock()
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, ttl=None):
+        """Return the cached response for key, or None if missing or expired"""
+        ttl = self.ttl if ttl is None else ttl
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT body, status, stored_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or (not self.offline and ttl is not None and now - row[2] > ttl):
+                self.misses += 1
+                return None
+            conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+            conn.commit()
+            self.hits += 1
+        return CachedResponse(key, row[1], zlib.decompress(row[0]))
+
+    def put(self, key, response):
+        """Store a successful response body under key"""
+        if response.status_code != 200:
+            return
+        body = zlib.compress(response.content, 6)
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            old = conn.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, body, size, status, stored_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, body, len(body), response.status_code, now, now)
+            )
+            self._total_bytes += len(body) - (old[0] if old else 0)
+            if self._total_bytes > self.max_bytes:
+                self._evict(conn)
+            conn.commit()
+
+    def fetch(self, key, fetch_fn, *args, ttl=None, **kwargs):
+        """Serve key from the cache, otherwise call fetch_fn(*args, **kwargs) and cache its response"""
+        cached = self.get(key, ttl=ttl)
+        if cached is not None:
+            return cached
+        if self.offline:
+            return CachedResponse(key, 504, b'', from_cache=False)
+        response = fetch_fn(*args, **kwargs)
+        self.put(key, response)
+        return response
+
+    def items(self, prefix=''):
+        """Yield (key, body text) for every cached entry whose key starts with prefix"""
+        with self._lock:
+            keys = [row[0] for row in self._connect().execute(
+                "SELECT key FROM entries WHERE substr(key, 1, ?) = ? ORDER BY key",
+                (len(prefix), prefix)
+            )]
+        # Expired entries are still usable for rebuilding a dataset, so TTL is not applied here
+        for key in keys:
+            with self._lock:
+                row = self._conn.execute("SELECT body FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                yield key, zlib.decompress(row[0]).decode('utf-8', errors='replace')
+
+    def has_entries(self, prefix=''):
+        """True if any entry's key starts with prefix, expired or not"""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT 1 FROM entries WHERE substr(key, 1, ?) = ? LIMIT 1", (len(prefix), prefix)
+            ).fetchone()
+        return row is not None
+
+    def stats(self):
+        """Return hit/miss counters and the compressed size on disk"""
+        return {"hits": self.hits, "misses": self.misses, "bytes": self._total_bytes}
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connect(self):
+        """Open the database on first use so importing the scraper creates no files"""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, body BLOB, size INTEGER, status INTEGER, "
+                "stored_at REAL, accessed_at REAL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries (accessed_at)")
+            self._conn.commit()
+            self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        return self._conn
+
+    def _evict(self, conn):
+        """Drop least recently used entries until the cache fits in max_bytes"""
+        evicted = 0
+        for key, size in conn.execute("SELECT key, size FROM entries ORDER BY accessed_at").fetchall():
+            if self._total_bytes <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._total_bytes -= size
+            evicted += 1
+        logger.info("Evicted %s cached responses to stay under %s bytes", evicted, self.max_bytes)
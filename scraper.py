@@ -0,0 +1,716 @@
+from datetime import datetime
+from itertools import product
+from pathlib import Path
+import argparse
+import logging
+import math
+import os
+import random
+import socket
+import time
+
+from checkpoint import Checkpoint
+from circuit_breaker import CLOSED, MAX_RESET_TIMEOUT, CircuitOpenError, RetryQueue
+from detail_fetcher import DEFAULT_DETAIL_WORKERS, fetch_page_details
+from http_client import HttpClient
+from incremental import (
+    DEFAULT_MAX_PAGES, DEFAULT_SEEN_INDEX_PATH, INCREMENTAL_FILTER, INCREMENTAL_SORT, NewPostingsCursor
+)
+from job_filters import merge_details
+from job_index import JobIndex
+from job_prefilter import REJECT
+from job_store import DEFAULT_STORE_PATH, JobStore
+from metrics import METRICS
+from parsers import extract_card_data, get_parser
+from pipeline import DetailPipeline
+from query_planner import DEFAULT_PARTITION_WORKERS, QueryPlanner, build_search_url, load_plan_config
+from rate_limiter import THROTTLE_STATUS_CODES, RateLimiter
+from response_cache import SEARCH_CACHE_TTL, ResponseCache
+from sinks import OUTPUT_FORMATS, count_rows, merge_job_rows, open_sink
+from work_queue import DEFAULT_QUEUE_PATH, IDLE_POLL_INTERVAL, WorkQueue
+
+logger = logging.getLogger(__name__)
+
+# Multiple user agents to rotate
+USER_AGENTS = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Safari/605.1.15",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:122.0) Gecko/20100101 Firefox/122.0",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0"
+]
+
+# Sort options and time filters
+SORT_OPTIONS = {
+    'relevant': 'R',  # Most relevant
+    'recent': 'DD',   # Most recent
+    'applied': 'A'    # Most applied
+}
+
+TIME_FILTERS = {
+    '24h': '1',
+    'week': '1,2,3,4,5,6,7',
+    'month': '1,2,3,4',
+    'any': ''
+}
+
+SEARCH_URL = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
+DETAIL_URL = "https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/{}"
+
+def get_random_headers():
+    """Get random headers to avoid detection"""
+    return {
+        "User-Agent": random.choice(USER_AGENTS),
+        "Accept-Language": "en-US,en;q=0.9",
+        "Accept-Encoding": "gzip, deflate, br",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+        "Referer": "https://www.linkedin.com/",
+        "Connection": "keep-alive"
+    }
+
+
+class JobScraper:
+    """LinkedIn guest-API scraper: search pages -> job cards -> detail pages -> filtered rows -> sink
+
+    The pluggable parts:
+    - classify_fn(job_data, details) merges a card with its details and returns the row to save,
+      or None to drop the job (see job_filters); it must be a module-level function so the
+      pipeline's worker processes can run it
+    - prefilter_factory builds a title/company stage that skips detail fetches (TitlePrefilter)
+    - http_client sends the requests; anything with get(url, **kwargs) and log_stats()
+    - sink: scrape_jobs_with_filters writes to any object with write(rows), close() and an
+      on_durable attribute it calls with rows once they are safely stored (see sinks)
+    Nothing is sent or opened until a scrape method runs.
+    """
+
+    def __init__(self, classify_fn=merge_details, prefilter_factory=None, http_client=None, rate_limiter=None,
+                 response_cache=None, html_parser=None, job_label="jobs"):
+        self.classify_fn = classify_fn
+        self.prefilter_factory = prefilter_factory
+        self.job_label = job_label
+
+        # Shared keep-alive session for search and detail requests, headers rotated per request
+        self.http_session = http_client or HttpClient(headers_fn=get_random_headers)
+
+        # Adaptive per-endpoint pacing; replaces the fixed sleeps between requests
+        self.rate_limiter = rate_limiter or RateLimiter()
+
+        # Cards whose detail fetch failed transiently, fetched again once the detail circuit has closed
+        self.detail_retry_queue = RetryQueue()
+
+        # Local cache of detail (and optionally search) responses, checked before any request is paced
+        self.response_cache = response_cache or ResponseCache()
+
+        # HTML parser backend: lxml fast path, BeautifulSoup reference (set LINKEDIN_PARSER=bs4)
+        self.html_parser = html_parser or get_parser()
+
+    def new_prefilter(self, title_prefilter=True):
+        """A fresh title/company stage for one run, or None"""
+        if title_prefilter and self.prefilter_factory is not None:
+            return self.prefilter_factory()
+        return None
+
+    def extract_job_data(self, card, sort_method, time_filter):
+        """Extract data from a job card, with its details, through the classify function"""
+        try:
+            job_data = extract_card_data(card, sort_method, time_filter)
+            if job_data is None:
+                return None
+            return self.classify_fn(job_data, self.get_job_details(job_data["job_id"]))
+
+        except Exception as e:
+            logger.error("Error extracting job data: %s", e)
+            return None
+
+    def add_page_details(self, cards_data, detail_workers=DEFAULT_DETAIL_WORKERS, job_index=None, prefilter=None,
+                         pipeline=None):
+        """Add details to a page of card data, fetching them in parallel, and keep the rows classify_fn accepts"""
+        if job_index is not None:
+            # Skip jobs already saved by an earlier run
+            cards_data = [job_data for job_data in cards_data if not job_index.is_known(job_data["job_id"])]
+            for job_data in cards_data:
+                job_index.record_combination(job_data["job_id"], job_data["sort_method"], job_data["time_filter"])
+
+        # Title/company stage: cards it rejects never cost a detail request
+        decisions = [None] * len(cards_data)
+        if prefilter is not None:
+            decisions = [prefilter.decide(job_data["title"], job_data["company"]) for job_data in cards_data]
+            fetched = []
+            for job_data, decision in zip(cards_data, decisions):
+                if prefilter.should_fetch(decision):
+                    fetched.append((job_data, decision))
+                elif job_index is not None:
+                    job_index.mark_seen(job_data["job_id"])
+            cards_data = [job_data for job_data, _ in fetched]
+            decisions = [decision for _, decision in fetched]
+
+        if pipeline is not None:
+            # Parsing and classification run in the pipeline's worker processes
+            rows = pipeline.process(cards_data)
+        else:
+            details_list = fetch_page_details(
+                [job_data["job_id"] for job_data in cards_data],
+                self.get_job_details,
+                max_workers=detail_workers,
+                job_index=job_index
+            )
+            rows = []
+            for job_data, details in zip(cards_data, details_list):
+                try:
+                    rows.append(self.classify_fn(job_data, details))
+                except Exception as e:
+                    logger.error("Error extracting job data: %s", e, extra={"job_id": job_data.get("job_id")})
+                    rows.append(None)
+
+        page_data = []
+        for card, job_data, decision in zip(cards_data, rows, decisions):
+            if self.detail_retry_queue.park_if_failed(card):
+                continue  # Classified after a retry rather than without its description
+            if job_index is not None and not job_data:
+                job_index.mark_seen(card["job_id"])  # Not an IT job; later runs need not fetch it again
+            if prefilter is not None:
+                # A reject fetched for the audit is only kept if the audit finds it IT after all
+                is_it = prefilter.record_outcome(decision, job_data)
+                if decision == REJECT and not is_it:
+                    continue
+            if job_data:
+                if job_index is not None:
+                    # Every sort/filter combination the job has shown up under in this run so far
+                    job_data["combinations"] = job_index.combinations_text(job_data["job_id"])
+                page_data.append(job_data)
+
+        return page_data
+
+    def retry_parked_details(self, detail_workers=DEFAULT_DETAIL_WORKERS, job_index=None, prefilter=None,
+                             pipeline=None):
+        """Fetch details again for parked cards once the detail circuit has closed; returns their rows"""
+        if not self.detail_retry_queue or self.rate_limiter.breakers["detail"].state != CLOSED:
+            return []
+        parked = self.detail_retry_queue.drain()
+        logger.info("Retrying details for %d parked jobs", len(parked))
+        return self.add_page_details(parked, detail_workers, job_index, prefilter, pipeline)
+
+    def flush_parked_details(self, detail_workers=DEFAULT_DETAIL_WORKERS, job_index=None, prefilter=None,
+                             pipeline=None, max_wait=MAX_RESET_TIMEOUT):
+        """Retry parked cards until each has its details or is out of retries; returns their rows
+
+        An open detail circuit is waited out for at most max_wait seconds in total; cards still
+        parked after that are saved without details.
+        """
+        retry_queue = self.detail_retry_queue
+        breaker = self.rate_limiter.breakers["detail"]
+        deadline = time.monotonic() + max_wait
+        rows = []
+        while retry_queue:
+            wait = breaker.seconds_until_probe()
+            if time.monotonic() + wait > deadline:
+                retry_queue.give_up()
+            else:
+                time.sleep(wait)
+            parked = retry_queue.drain()
+            if breaker.state != CLOSED and retry_queue.retrying and len(parked) > 1:
+                # One card probes the endpoint; the rest wait until the circuit has closed
+                rows += self.add_page_details(parked[:1], detail_workers, job_index, prefilter, pipeline)
+                if breaker.state != CLOSED:
+                    retry_queue.requeue(parked[1:])
+                    continue
+                parked = parked[1:]
+            rows += self.add_page_details(parked, detail_workers, job_index, prefilter, pipeline)
+        logger.info("Detail retries: %s", retry_queue.stats())
+        return rows
+
+    @METRICS.timed("detail_fetch_seconds")
+    def get_job_html(self, job_id):
+        """Fetch a job posting page; returns its HTML, or None if the request failed"""
+        url = DETAIL_URL.format(job_id)
+        try:
+            response = self.response_cache.fetch(url, self.rate_limiter.request, "detail", self.http_session.get, url)
+
+            if response.status_code != 200:
+                if response.status_code in THROTTLE_STATUS_CODES and not self.response_cache.offline:
+                    # Still throttled after the rate limiter's retries; worth another try later
+                    self.detail_retry_queue.mark_failed(job_id)
+                return None
+
+            return response.text
+
+        except CircuitOpenError:
+            # Detail requests are paused; the card is retried once the circuit closes
+            self.detail_retry_queue.mark_failed(job_id, attempted=False)
+            return None
+        except Exception as e:
+            logger.error("Error fetching details for job %s: %s", job_id, e, extra={"job_id": job_id})
+            self.detail_retry_queue.mark_failed(job_id)
+            return None
+
+    @METRICS.timed("job_details_seconds")
+    def get_job_details(self, job_id):
+        """Get detailed job information"""
+        html = self.get_job_html(job_id)
+        return self.html_parser.parse_details(html) if html else {}
+
+    def search(self, url, cache=False):
+        """Fetch a search results page under the search rate limit, optionally served from the response cache
+
+        Fetched pages are stored in the cache either way, so an --offline run can replay the last online one.
+        """
+        if cache:
+            return self.response_cache.fetch(
+                url, self.rate_limiter.request, "search", self.http_session.get, url, ttl=SEARCH_CACHE_TTL
+            )
+        response = self.rate_limiter.request("search", self.http_session.get, url)
+        self.response_cache.put(url, response)
+        return response
+
+    def scrape_jobs_with_filters(self, location="Sri Lanka", jobs_per_combination=1000,
+                                 detail_workers=DEFAULT_DETAIL_WORKERS, seen_index_path=None, cache_search=False,
+                                 offline=False, checkpoint=None, title_prefilter=True, output_format='sqlite',
+                                 parse_workers=0, sink=None):
+        """Scrape jobs using different sort options and time filters, resuming from checkpoint if given
+
+        Rows go to sink if one is given, otherwise to an output file in output_format; returns
+        the output file.
+        """
+        from tqdm import tqdm
+
+        # Offline runs replay cached search and detail pages without touching the network
+        self.response_cache.offline = offline
+        cache_search = cache_search or offline
+
+        if checkpoint is not None:
+            # Continue the interrupted run with its own output file and parameters
+            output_file = Path(checkpoint.output_file)
+            location = checkpoint.params.get("location", location)
+            jobs_per_combination = checkpoint.params.get("jobs_per_combination", jobs_per_combination)
+        else:
+            # Create single output file name at start
+            data_dir = Path('data')
+            data_dir.mkdir(exist_ok=True)
+            if output_format == 'sqlite':
+                # Every run upserts into the same store, so daily scrapes accumulate in one place
+                output_file = DEFAULT_STORE_PATH
+            else:
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                output_file = data_dir / f"linkedin_jobs_{timestamp}{OUTPUT_FORMATS[output_format]}"
+            checkpoint = Checkpoint(
+                output_file=output_file,
+                params={"location": location, "jobs_per_combination": jobs_per_combination}
+            )
+
+        # Jobs repeat across sort/filter combinations; fetch each one's details only once
+        job_index = JobIndex(seen_index_path)
+
+        # Skip detail fetches for cards whose title/company is clearly out of scope
+        prefilter = self.new_prefilter(title_prefilter)
+
+        jobs_batch = []  # Buffer for batch saving
+        batch_size = 50  # Save every 50 jobs
+
+        # Rows stream into the sink; closing it writes the Parquet footer even if the run is interrupted
+        merge_rows = sink is None and Path(output_file).suffix != OUTPUT_FORMATS['sqlite']
+        if sink is None:
+            sink = open_sink(output_file)
+        # Rows (and the pages they came from) are checkpointed only once the sink has them on disk;
+        # a Parquet file is only readable, and its rows committed, once close() writes its footer
+        sink.on_durable = checkpoint.commit
+        # Saved up front so a run killed before anything is durable still resumes into the same output file
+        checkpoint.commit()
+
+        # With parse workers, detail pages go through fetch -> parse -> classify stages in a process pool
+        pipeline = None
+        if parse_workers:
+            pipeline = DetailPipeline(
+                self.get_job_html, self.html_parser.parse_details, self.classify_fn,
+                fetch_workers=detail_workers, parse_workers=parse_workers, job_index=job_index
+            )
+            sink = pipeline.timed_sink(sink)
+        try:
+            for sort_name, sort_value in SORT_OPTIONS.items():
+                for filter_name, filter_value in TIME_FILTERS.items():
+                    combination = f"{sort_name}/{filter_name}"
+                    logger.info("Scraping with sort: %s, filter: %s", sort_name, filter_name,
+                                extra={"combination": combination})
+
+                    base_url = f"{SEARCH_URL}?location={location}&sortBy={sort_value}&f_TPR={filter_value}&start={{}}"
+
+                    pages = math.ceil(jobs_per_combination / 25)
+
+                    with tqdm(total=jobs_per_combination,
+                              desc=f"Sort: {sort_name}, Filter: {filter_name}") as pbar:
+
+                        for page in range(pages):
+                            if checkpoint.is_page_done(sort_name, filter_name, page * 25):
+                                continue
+                            try:
+                                response = self.search(base_url.format(page * 25), cache=cache_search)
+
+                                if response.status_code != 200:
+                                    logger.warning("Skipping page %s: HTTP %s after retries", page, response.status_code,
+                                                   extra={"combination": combination, "page": page,
+                                                          "status": response.status_code})
+                                    continue
+
+                                cards_data = self.html_parser.parse_cards(response.text, sort_name, filter_name)
+
+                                if not cards_data:
+                                    break
+
+                                page_data = self.add_page_details(cards_data, detail_workers, job_index, prefilter,
+                                                                  pipeline)
+                                page_data += self.retry_parked_details(detail_workers, job_index, prefilter, pipeline)
+                                for job_data in page_data:
+                                    # Rows written before an interruption are already in the output file
+                                    if checkpoint.is_written(job_data["job_id"], job_data["sort_method"],
+                                                             job_data["time_filter"]):
+                                        continue
+                                    jobs_batch.append(job_data)
+                                    pbar.update(1)
+
+                                    # Save batch when it reaches the batch size
+                                    if len(jobs_batch) >= batch_size:
+                                        sink.write(jobs_batch)
+                                        jobs_batch = []  # Clear batch after saving
+
+                                checkpoint.page_done(sort_name, filter_name, page * 25)
+
+                            except Exception as e:
+                                logger.error("Error on page %s: %s", page, e,
+                                             extra={"combination": combination, "page": page})
+                                # Save any remaining jobs in batch if there's an error
+                                if jobs_batch:
+                                    sink.write(jobs_batch)
+                                    jobs_batch = []
+                                continue
+
+                    # Save any remaining jobs in batch after each filter combination
+                    if jobs_batch:
+                        sink.write(jobs_batch)
+                        jobs_batch = []
+
+            # Cards still waiting for a detail retry, e.g. parked on the last pages
+            jobs_batch = [
+                job_data for job_data in self.flush_parked_details(detail_workers, job_index, prefilter, pipeline)
+                if not checkpoint.is_written(job_data["job_id"], job_data["sort_method"], job_data["time_filter"])
+            ]
+            if jobs_batch:
+                sink.write(jobs_batch)
+        finally:
+            sink.close()
+            if pipeline is not None:
+                pipeline.close()
+
+        if merge_rows and Path(output_file).exists():
+            # The file has a row per (job, combination) seen; keep one per job listing all its combinations
+            merge_job_rows(output_file)
+        checkpoint.finish()
+        if pipeline is not None:
+            pipeline.log_stats()
+        logger.info("Fetched details for %s unique jobs, %s repeat fetches avoided", len(job_index), job_index.hits)
+        if prefilter is not None:
+            prefilter.log_stats()
+        self.http_session.log_stats()
+        logger.info("Response cache: %s", self.response_cache.stats())
+        return output_file
+
+    def scrape_new_jobs(self, location="Sri Lanka", max_pages=DEFAULT_MAX_PAGES, detail_workers=DEFAULT_DETAIL_WORKERS,
+                        store_path=DEFAULT_STORE_PATH, seen_index_path=DEFAULT_SEEN_INDEX_PATH, title_prefilter=True):
+        """Add postings not yet in the store, walking the most recent 24h results until they are all known"""
+        from tqdm import tqdm
+
+        store = JobStore(store_path)
+        job_index = JobIndex(seen_index_path)
+        cursor = NewPostingsCursor.from_store(store, job_index)
+        prefilter = self.new_prefilter(title_prefilter)
+
+        base_url = (
+            f"{SEARCH_URL}?location={location}&sortBy={SORT_OPTIONS[INCREMENTAL_SORT]}"
+            f"&f_TPR={TIME_FILTERS[INCREMENTAL_FILTER]}&start={{}}"
+        )
+
+        new_jobs = 0
+        try:
+            for page in tqdm(range(max_pages), desc="New postings"):
+                try:
+                    response = self.search(base_url.format(page * 25))
+                    if response.status_code != 200:
+                        logger.warning("Skipping page %s: HTTP %s after retries", page, response.status_code)
+                        continue
+
+                    cards_data = self.html_parser.parse_cards(response.text, INCREMENTAL_SORT, INCREMENTAL_FILTER)
+                    if not cards_data:
+                        break
+
+                    # Only cards never seen before get a detail fetch
+                    new_cards = cursor.new_cards(cards_data)
+                    store.touch(cursor.seen_again)
+                    page_data = self.add_page_details(new_cards, detail_workers, job_index, prefilter)
+                    page_data += self.retry_parked_details(detail_workers, job_index, prefilter)
+                    if store.write(page_data):
+                        new_jobs += len(page_data)
+
+                    if cursor.stop_reason:
+                        logger.info("Stopping after page %s: %s", page, cursor.stop_reason)
+                        break
+
+                except Exception as e:
+                    logger.error("Error on page %s: %s", page, e)
+                    continue
+
+            page_data = self.flush_parked_details(detail_workers, job_index, prefilter)
+            if store.write(page_data):
+                new_jobs += len(page_data)
+        finally:
+            store.close()
+
+        logger.info("Incremental scrape added %s new jobs to %s", new_jobs, store_path)
+        if prefilter is not None:
+            prefilter.log_stats()
+        self.http_session.log_stats()
+        return new_jobs
+
+    def scrape_planned(self, plan_config=None, detail_workers=DEFAULT_DETAIL_WORKERS,
+                       partition_workers=DEFAULT_PARTITION_WORKERS, store_path=DEFAULT_STORE_PATH,
+                       seen_index_path=DEFAULT_SEEN_INDEX_PATH, title_prefilter=True):
+        """Scrape the location x keyword x filter partitions of a query plan into the job store"""
+        store = JobStore(store_path)
+        job_index = JobIndex(seen_index_path)
+        prefilter = self.new_prefilter(title_prefilter)
+        planner = QueryPlanner.from_config(
+            plan_config or {}, SORT_OPTIONS, TIME_FILTERS, known_ids=store.known_job_ids() | job_index.known_ids()
+        )
+
+        def fetch_cards(partition, url):
+            response = self.search(url)
+            if response.status_code != 200:
+                logger.warning("Skipping %s: HTTP %s after retries", url, response.status_code)
+                return []
+            return self.html_parser.parse_cards(response.text, partition.sort_method, partition.time_filter)
+
+        def process_cards(partition, cards_data):
+            page_data = self.add_page_details(cards_data, detail_workers, job_index, prefilter)
+            store.write(page_data + self.retry_parked_details(detail_workers, job_index, prefilter))
+
+        try:
+            new_jobs = planner.run(fetch_cards, process_cards, max_workers=partition_workers)
+            store.write(self.flush_parked_details(detail_workers, job_index, prefilter))
+        finally:
+            store.close()
+
+        logger.info("Planned scrape found %s new postings, %s saved to %s", new_jobs, store.rows_written, store_path)
+        if prefilter is not None:
+            prefilter.log_stats()
+        self.http_session.log_stats()
+        return store.rows_written
+
+    def enqueue_search_pages(self, locations=("Sri Lanka",), jobs_per_combination=1000, queue_path=DEFAULT_QUEUE_PATH):
+        """Coordinator: queue one work item per (location, sort, filter, page) for distributed workers"""
+        pages = math.ceil(jobs_per_combination / 25)
+        queue = WorkQueue(queue_path)
+        try:
+            return queue.enqueue(
+                (location, "", sort_name, filter_name, page * 25)
+                for location, sort_name, filter_name, page in product(locations, SORT_OPTIONS, TIME_FILTERS, range(pages))
+            )
+        finally:
+            queue.close()
+
+    def run_worker(self, queue_path=DEFAULT_QUEUE_PATH, store_path=DEFAULT_STORE_PATH, worker_id=None,
+                   detail_workers=DEFAULT_DETAIL_WORKERS, title_prefilter=True):
+        """Worker: lease search pages from the work queue until it is drained, saving rows to the shared job store"""
+        worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        queue = WorkQueue(queue_path)
+        store = JobStore(store_path)
+        job_index = JobIndex()
+        prefilter = self.new_prefilter(title_prefilter)
+        pages_done = 0
+
+        try:
+            while True:
+                item = queue.lease(worker_id)
+                if item is None:
+                    if not queue.has_active_leases():
+                        break
+                    # Another worker holds the remaining items; wait in case it dies and they come back
+                    time.sleep(IDLE_POLL_INTERVAL)
+                    continue
+
+                try:
+                    with queue.heartbeat(item, worker_id):
+                        page_data = self._scrape_work_item(item, queue, worker_id, store, job_index, prefilter,
+                                                           detail_workers)
+                    if page_data is None:
+                        continue
+                    if page_data and not store.write(page_data):
+                        queue.fail(item, worker_id, "could not save rows")
+                        continue
+                    if queue.complete(item, worker_id):
+                        pages_done += 1
+
+                except Exception as e:
+                    queue.fail(item, worker_id, str(e))
+
+            store.write(self.flush_parked_details(detail_workers, job_index, prefilter))
+        finally:
+            logger.info("Worker %s finished %d pages, saved %d rows; queue: %s",
+                        worker_id, pages_done, store.rows_written, queue.stats())
+            store.close()
+            queue.close()
+        if prefilter is not None:
+            prefilter.log_stats()
+        self.http_session.log_stats()
+        return store.rows_written
+
+    def _scrape_work_item(self, item, queue, worker_id, store, job_index, prefilter, detail_workers):
+        """Rows of one leased search page; None once the item has been failed or completed here"""
+        url = build_search_url(
+            item.location, item.keywords, SORT_OPTIONS[item.sort_method], TIME_FILTERS[item.time_filter], item.start
+        )
+        response = self.search(url)
+        if response.status_code != 200:
+            queue.fail(item, worker_id, f"HTTP {response.status_code}")
+            return None
+
+        cards_data = self.html_parser.parse_cards(response.text, item.sort_method, item.time_filter)
+        if not cards_data:
+            queue.skip_rest(item)
+            queue.complete(item, worker_id)
+            return None
+
+        # Jobs another worker already saved need no detail fetch, only this page's combination
+        stored = [job_data for job_data in cards_data if store.has_job(job_data["job_id"])]
+        store.add_combinations(stored)
+        stored_ids = {job_data["job_id"] for job_data in stored}
+        cards_data = [job_data for job_data in cards_data if job_data["job_id"] not in stored_ids]
+        page_data = self.add_page_details(cards_data, detail_workers, job_index, prefilter)
+        return page_data + self.retry_parked_details(detail_workers, job_index, prefilter)
+
+
+def run_post_scrape_steps(args, output_file):
+    """Analysis steps requested on the command line, run on the scrape output"""
+    if not (args.sentiment or args.cubes or args.skill_index):
+        return
+    if Path(output_file).suffix != OUTPUT_FORMATS['sqlite']:
+        print(f"Post-scrape steps need the SQLite job store; run them on {DEFAULT_STORE_PATH} instead")
+        return
+    if args.sentiment:
+        from sentiment import score_store
+
+        updated = score_store(output_file)
+        print(f"Updated {updated} sentiment scores in {output_file}")
+    if args.cubes:
+        from job_cubes import DEFAULT_CUBES_PATH, refresh_cubes
+
+        changed = refresh_cubes(output_file)
+        print(f"Counted {changed} new or changed jobs into {DEFAULT_CUBES_PATH}")
+    if args.skill_index:
+        from skill_index import DEFAULT_SKILL_INDEX_PATH, refresh_skill_index
+
+        indexed = refresh_skill_index(output_file)
+        print(f"Indexed {indexed} new or changed postings into {DEFAULT_SKILL_INDEX_PATH}")
+
+
+def run_cli(scraper, argv=None):
+    """Command line entry point shared by the scraper scripts"""
+    parser = argparse.ArgumentParser(description=f"Scrape LinkedIn {scraper.job_label} postings")
+    parser.add_argument("--resume", action="store_true", help="continue the last interrupted run")
+    parser.add_argument("--format", choices=sorted(OUTPUT_FORMATS), default='sqlite', help="output file format")
+    parser.add_argument("--incremental", action="store_true",
+                        help="only add postings that are not in the job store yet")
+    parser.add_argument("--plan", nargs="?", const="", metavar="CONFIG",
+                        help="scrape location x keyword partitions, optionally from a JSON plan config")
+    parser.add_argument("--enqueue", action="store_true",
+                        help="coordinator: queue the search pages for distributed workers and exit")
+    parser.add_argument("--worker", action="store_true", help="scrape search pages leased from the work queue")
+    parser.add_argument("--queue", default=str(DEFAULT_QUEUE_PATH), help="work queue shared by coordinator and workers")
+    parser.add_argument("--offline", action="store_true",
+                        help="replay the search and detail pages earlier runs left in the response cache, "
+                             "without network requests")
+    parser.add_argument("--cache-search", action="store_true",
+                        help=f"serve search pages fetched in the last {SEARCH_CACHE_TTL // 60} minutes from the "
+                             "response cache instead of requesting them again")
+    parser.add_argument("--parse-workers", type=int, default=0,
+                        help="parse and classify detail pages in this many processes (0 parses in the fetch threads)")
+    parser.add_argument("--metrics", help="run metrics JSON file (default data/metrics/run_<timestamp>.json)")
+    parser.add_argument("--prometheus", help="also write the run metrics in Prometheus text format to this file")
+    parser.add_argument("--sentiment", action="store_true",
+                        help="after scraping, score description sentiment in the SQLite job store")
+    parser.add_argument("--cubes", action="store_true",
+                        help="after scraping, update the precomputed job count cubes from the SQLite job store")
+    parser.add_argument("--skill-index", action="store_true",
+                        help="after scraping, update the skill index from the SQLite job store")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.incremental:
+            new_jobs = scraper.scrape_new_jobs()
+            print(f"\nAdded {new_jobs} new jobs to {DEFAULT_STORE_PATH}")
+            run_post_scrape_steps(args, DEFAULT_STORE_PATH)
+            return
+
+        if args.plan is not None:
+            saved_jobs = scraper.scrape_planned(load_plan_config(args.plan) if args.plan else None)
+            print(f"\nSaved {saved_jobs} jobs to {DEFAULT_STORE_PATH}")
+            run_post_scrape_steps(args, DEFAULT_STORE_PATH)
+            return
+
+        if args.worker:
+            saved_jobs = scraper.run_worker(queue_path=args.queue)
+            print(f"\nSaved {saved_jobs} jobs to {DEFAULT_STORE_PATH}")
+            run_post_scrape_steps(args, DEFAULT_STORE_PATH)
+            return
+
+        checkpoint = Checkpoint.load() if args.resume else None
+        if args.resume and checkpoint is None:
+            print("No unfinished run to resume, starting a new one")
+
+        if checkpoint is not None:
+            jobs_per_combination = checkpoint.params.get("jobs_per_combination", 400)
+        else:
+            while True:
+                try:
+                    jobs_per_combination = input("Enter number of jobs to scrape per combination (default 400): ").strip()
+                    jobs_per_combination = int(jobs_per_combination) if jobs_per_combination else 400 # LinkedIn only load 40 pages and one page include around 10 Job cards
+                    if jobs_per_combination > 0:
+                        break
+                    print("Please enter a positive number")
+                except ValueError:
+                    print("Please enter a valid number")
+
+        if args.enqueue:
+            added = scraper.enqueue_search_pages(jobs_per_combination=jobs_per_combination, queue_path=args.queue)
+            print(f"\nQueued {added} search pages in {args.queue}; start workers with --worker")
+            return
+
+        if args.offline and not scraper.response_cache.has_entries(SEARCH_URL):
+            print(f"\nNo search pages in {scraper.response_cache.path} to replay; run once online before using --offline")
+            return
+
+        logger.info("Starting comprehensive LinkedIn job scraping for %s", scraper.job_label)
+
+        output_file = scraper.scrape_jobs_with_filters(
+            jobs_per_combination=jobs_per_combination, checkpoint=checkpoint, output_format=args.format,
+            parse_workers=args.parse_workers, cache_search=args.cache_search, offline=args.offline
+        )
+
+        if not Path(output_file).exists():
+            # CSV and Parquet files are only created with their first row
+            print(f"\nNo {scraper.job_label} were saved" +
+                  (": the response cache has none of this run's pages" if args.offline else ""))
+            return
+
+        # Count total jobs in file
+        try:
+            total_jobs = count_rows(output_file)
+            print(f"\nSuccessfully scraped {total_jobs} {scraper.job_label}")
+            print(f"Data saved to {output_file}")
+        except Exception as e:
+            logger.error("Error reading final file: %s", e)
+            print("Error reading final file. Check the log for details.")
+        run_post_scrape_steps(args, output_file)
+
+    except KeyboardInterrupt:
+        print("\nScraping interrupted by user. Run again with --resume to continue")
+    except Exception as e:
+        logger.error("Unexpected error: %s", e)
+    finally:
+        METRICS.write_report(args.metrics, args.prometheus)
@@ -0,0 +1,181 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+import argparse
+import logging
+import os
+import sqlite3
+
+from job_store import DEFAULT_STORE_PATH, JobStore
+from log_config import worker_logging
+from text_analytics import content_hash
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SENTIMENT_CACHE_PATH = Path('data') / 'cache' / 'description_sentiment.sqlite'
+
+# Processes scoring descriptions; one core is left for the main process
+DEFAULT_SENTIMENT_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+
+# Descriptions sent to a worker per task; large enough that pickling overhead stays small
+DEFAULT_CHUNK_SIZE = 200
+
+# Score given to missing descriptions, as the notebook's get_vader_sentiment does
+MISSING_SCORE = 0.0
+
+SENTIMENT_COLUMN = "description_sentiment"
+
+
+@lru_cache(maxsize=1)
+def load_analyzer():
+    """(name, VADER analyzer): NLTK's, as used in the notebook, or the vaderSentiment package's"""
+    try:
+        from nltk.sentiment.vader import SentimentIntensityAnalyzer
+        return 'nltk-vader', SentimentIntensityAnalyzer()
+    except (ImportError, LookupError):
+        pass
+    try:
+        from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+        return 'vaderSentiment', SentimentIntensityAnalyzer()
+    except ImportError:
+        raise ImportError(
+            "Sentiment scoring needs VADER: pip install vaderSentiment (or nltk with the vader_lexicon data)"
+        ) from None
+
+
+def score_texts(texts):
+    """VADER compound scores of a chunk of descriptions; runs in the worker processes"""
+    _, analyzer = load_analyzer()
+    return [analyzer.polarity_scores(text)['compound'] for text in texts]
+
+
+class SentimentCache:
+    """SQLite cache of compound scores keyed by analyzer and description hash"""
+
+    def __init__(self, path=DEFAULT_SENTIMENT_CACHE_PATH):
+        self.path = Path(path)
+        self._conn = None
+        self.hits = 0
+        self.misses = 0
+
+    def get_many(self, model, digests):
+        """{content hash: score} for the cached digests"""
+        conn = self._connect()
+        found = {}
+        # Stay below SQLite's bound parameter limit
+        for start in range(0, len(digests), 500):
+            chunk = digests[start:start + 500]
+            rows = conn.execute(
+                f"SELECT content_hash, score FROM scores WHERE model = ? AND content_hash IN ({','.join('?' * len(chunk))})",
+                [model] + chunk
+            )
+            found.update(rows)
+        return found
+
+    def put_many(self, model, scores):
+        """Store a {content hash: score} mapping"""
+        conn = self._connect()
+        conn.executemany(
+            "INSERT OR REPLACE INTO scores (model, content_hash, score) VALUES (?, ?, ?)",
+            [(model, digest, score) for digest, score in scores.items()]
+        )
+        conn.commit()
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses}
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _connect(self):
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path))
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS scores "
+                "(model TEXT NOT NULL, content_hash TEXT NOT NULL, score REAL NOT NULL, PRIMARY KEY (model, content_hash))"
+            )
+        return self._conn
+
+
+def score_descriptions(descriptions, cache=None, workers=DEFAULT_SENTIMENT_WORKERS, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Compound sentiment score for each description, in input order
+
+    Each distinct text is scored once; scores already in the cache are reused, and the rest are
+    split into chunks of chunk_size across a pool of workers processes (0 scores in this process).
+    Non-string descriptions get MISSING_SCORE.
+    """
+    descriptions = list(descriptions)
+    model, _ = load_analyzer()
+    digests = [content_hash(text) if isinstance(text, str) else None for text in descriptions]
+    texts = {digest: text for digest, text in zip(digests, descriptions) if digest is not None}
+
+    scores = cache.get_many(model, list(texts)) if cache is not None else {}
+    pending = [digest for digest in texts if digest not in scores]
+    if cache is not None:
+        cache.hits += len(texts) - len(pending)
+        cache.misses += len(pending)
+
+    if pending:
+        chunks = [pending[start:start + chunk_size] for start in range(0, len(pending), chunk_size)]
+        text_chunks = [[texts[digest] for digest in chunk] for chunk in chunks]
+        if workers and len(chunks) > 1:
+            with ProcessPoolExecutor(max_workers=min(workers, len(chunks)), **worker_logging()) as pool:
+                results = list(pool.map(score_texts, text_chunks))
+        else:
+            results = [score_texts(chunk) for chunk in text_chunks]
+        new_scores = {digest: score for chunk, chunk_scores in zip(chunks, results)
+                      for digest, score in zip(chunk, chunk_scores)}
+        if cache is not None:
+            cache.put_many(model, new_scores)
+        scores.update(new_scores)
+
+    logger.info("Scored %s of %s distinct descriptions (%s)", len(pending), len(texts), model)
+    return [scores[digest] if digest is not None else MISSING_SCORE for digest in digests]
+
+
+def add_sentiment_column(df, cache=None, workers=DEFAULT_SENTIMENT_WORKERS, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Fill df's description_sentiment column in place and return df"""
+    df[SENTIMENT_COLUMN] = score_descriptions(df['description'], cache, workers, chunk_size)
+    return df
+
+
+def score_store(store_path=DEFAULT_STORE_PATH, cache_path=DEFAULT_SENTIMENT_CACHE_PATH,
+                workers=DEFAULT_SENTIMENT_WORKERS, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Post-scrape step: write description_sentiment for every job in the store; returns the jobs updated
+
+    Every description is looked up, so postings whose text changed since the last run are
+    re-scored, while unchanged text comes from the cache.
+    """
+    store = JobStore(store_path)
+    cache = SentimentCache(cache_path)
+    try:
+        rows = store.query(columns=["job_id", "description", SENTIMENT_COLUMN])
+        scores = score_descriptions([row["description"] for row in rows], cache, workers, chunk_size)
+        changed = {row["job_id"]: score for row, score in zip(rows, scores) if row[SENTIMENT_COLUMN] != score}
+        store.set_column(SENTIMENT_COLUMN, changed)
+        logger.info("Updated %d of %d sentiment scores in %s; cache: %s",
+                    len(changed), len(rows), store_path, cache.stats())
+        return len(changed)
+    finally:
+        cache.close()
+        store.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score job description sentiment in the job store")
+    parser.add_argument("--store", default=str(DEFAULT_STORE_PATH), help="SQLite job store to update")
+    parser.add_argument("--cache", default=str(DEFAULT_SENTIMENT_CACHE_PATH), help="sentiment score cache")
+    parser.add_argument("--workers", type=int, default=DEFAULT_SENTIMENT_WORKERS,
+                        help="scoring processes (0 scores in this process)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    updated = score_store(args.store, args.cache, args.workers)
+    print(f"Updated {updated} sentiment scores in {args.store}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,317 @@
+from pathlib import Path
+import csv
+import logging
+import os
+
+# pyarrow is only needed for Parquet output and is slow to import; see _load_pyarrow()
+pa = pq = None
+
+from job_index import format_combinations, parse_combinations
+from metrics import METRICS
+
+logger = logging.getLogger(__name__)
+
+# Output columns, in file order
+JOB_COLUMNS = [
+    "job_id", "title", "company", "location", "experience_level",
+    "employment_type", "posted_date", "job_function", "industries",
+    "salary", "required_skills", "description", "company_size",
+    "company_industry", "applicant_count", "job_url", "sort_method",
+    "time_filter", "combinations", "category"
+]
+
+# Low-cardinality columns stored dictionary-encoded (read back by pandas as categoricals)
+DICTIONARY_COLUMNS = {
+    "company", "location", "experience_level", "employment_type", "job_function",
+    "industries", "sort_method", "time_filter", "category"
+}
+
+DEFAULT_ROW_GROUP_SIZE = 1000
+
+OUTPUT_FORMATS = {'csv': '.csv', 'parquet': '.parquet', 'sqlite': '.sqlite'}
+
+
+class CsvSink:
+    """Appends rows to a CSV file through one open csv.DictWriter instead of a DataFrame per batch"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.rows_written = 0
+        # Called with each batch of rows once it is on disk
+        self.on_durable = None
+        self._file = None
+        self._writer = None
+
+    @METRICS.timed("sink_write_seconds", sink="csv")
+    def write(self, rows):
+        """Append rows; returns True once they are flushed to disk"""
+        if not rows:
+            return False
+        try:
+            if self._writer is None:
+                self._open()
+            self._writer.writerows(rows)
+            self._file.flush()
+            self.rows_written += len(rows)
+            METRICS.inc("rows_written_total", len(rows), sink="csv")
+            logger.info("Data saved/appended to %s", self.path)
+        except Exception as e:
+            logger.error("Error saving data: %s", e)
+            return False
+        if self.on_durable is not None:
+            self.on_durable(rows)
+        return True
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = self._writer = None
+
+    def _open(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        is_new = not self.path.exists()
+        # Same layout as DataFrame.to_csv: minimal quoting, platform line endings, empty cells for None
+        self._file = open(self.path, 'a', encoding='utf-8', newline='')
+        self._writer = csv.DictWriter(
+            self._file, fieldnames=JOB_COLUMNS, extrasaction='ignore', lineterminator=os.linesep
+        )
+        if is_new:
+            self._writer.writeheader()
+
+
+class ParquetSink:
+    """Streams rows into one Parquet file, a row group per row_group_size rows
+
+    One ParquetWriter stays open for the run: each full buffer is written as a row group, and
+    close() writes the footer with the file's running row_count in its metadata. Nothing in the
+    file is readable before the footer, so rows only become durable (on_durable is called) in
+    close(); a run killed before that leaves an unreadable file whose rows are scraped again on
+    resume. A resumed run never appends to an earlier session's file: it writes the next part
+    (name.part1.parquet, ...), or reuses one left unreadable. read_jobs() and count_rows()
+    combine all parts.
+    """
+
+    def __init__(self, path, row_group_size=DEFAULT_ROW_GROUP_SIZE):
+        _load_pyarrow()
+        self.path = Path(path)
+        self.row_group_size = row_group_size
+        self.rows_written = 0
+        # Called with the rows' (job_id, sort_method, time_filter) once close() has written the footer
+        self.on_durable = None
+        self.schema = pa.schema([
+            (column, pa.dictionary(pa.int32(), pa.string()) if column in DICTIONARY_COLUMNS else pa.string())
+            for column in JOB_COLUMNS
+        ])
+        self._pending = []
+        self._written_keys = []
+        self._writer = None
+        self._file_path = None
+
+    @METRICS.timed("sink_write_seconds", sink="parquet")
+    def write(self, rows):
+        """Buffer rows and write a row group whenever row_group_size rows are waiting"""
+        if not rows:
+            return False
+        try:
+            self._pending.extend(rows)
+            if len(self._pending) >= self.row_group_size:
+                self._write_row_group()
+            return True
+        except Exception as e:
+            logger.error("Error saving data: %s", e)
+            return False
+
+    def close(self):
+        """Write any buffered rows and the footer, then report every row in the file as durable"""
+        try:
+            self._write_row_group()
+        finally:
+            self._close_file()
+
+    def _close_file(self):
+        if self._writer is None:
+            return
+        self._writer.add_key_value_metadata({"row_count": str(self.rows_written)})
+        self._writer.close()
+        self._writer = None
+        logger.info("Wrote %s rows to %s", self.rows_written, self._file_path)
+        if self.on_durable is not None:
+            self.on_durable(self._written_keys)
+        self._written_keys = []
+
+    def _write_row_group(self):
+        if not self._pending:
+            return
+        rows, self._pending = self._pending, []
+        columns = {
+            column: [_to_text(row.get(column)) for row in rows]
+            for column in JOB_COLUMNS
+        }
+        table = pa.Table.from_pydict(columns, schema=self.schema)
+        if self._writer is None:
+            self._file_path = _free_part_path(self.path)
+            self._file_path.parent.mkdir(parents=True, exist_ok=True)
+            self._writer = pq.ParquetWriter(str(self._file_path), self.schema, compression='zstd')
+        self._writer.write_table(table, row_group_size=self.row_group_size)
+        self._written_keys.extend(
+            {"job_id": row["job_id"], "sort_method": row.get("sort_method"), "time_filter": row.get("time_filter")}
+            for row in rows
+        )
+        self.rows_written += len(rows)
+        METRICS.inc("rows_written_total", len(rows), sink="parquet")
+        logger.info("Wrote a row group of %s rows to %s", len(rows), self._file_path)
+
+
+def open_sink(path):
+    """Pick a sink from the output file's extension"""
+    suffix = Path(path).suffix
+    if suffix == OUTPUT_FORMATS['parquet']:
+        return ParquetSink(path)
+    if suffix == OUTPUT_FORMATS['sqlite']:
+        from job_store import JobStore
+        return JobStore(path)
+    return CsvSink(path)
+
+
+def read_jobs(path, columns=None):
+    """Load a scrape output (CSV, SQLite store, or Parquet including resumed part files) as a DataFrame"""
+    import pandas as pd
+
+    path = Path(path)
+    if path.suffix == OUTPUT_FORMATS['sqlite']:
+        return _read_store(path, lambda store: store.to_dataframe(columns=columns))
+    if path.suffix != OUTPUT_FORMATS['parquet']:
+        return pd.read_csv(path, usecols=columns)
+    _load_pyarrow()
+    tables = []
+    for part in _part_paths(path):
+        try:
+            tables.append(pq.read_table(str(part), columns=columns))
+        except Exception as e:
+            # A part from a run killed before close() has no footer and cannot be read
+            logger.warning("Skipping unreadable Parquet file %s: %s", part, e)
+    return pa.concat_tables(tables, promote_options='permissive').to_pandas() if tables else pd.DataFrame(columns=columns)
+
+
+def count_rows(path):
+    """Number of rows in a scrape output; Parquet counts come from the file footers"""
+    path = Path(path)
+    if path.suffix == OUTPUT_FORMATS['sqlite']:
+        return _read_store(path, lambda store: store.count())
+    if path.suffix != OUTPUT_FORMATS['parquet']:
+        return len(read_jobs(path, columns=["job_id"]))
+    _load_pyarrow()
+    total = 0
+    for part in _part_paths(path):
+        try:
+            total += pq.ParquetFile(str(part)).metadata.num_rows
+        except Exception as e:
+            logger.warning("Skipping unreadable Parquet file %s: %s", part, e)
+    return total
+
+
+def merge_job_rows(path):
+    """Rewrite a CSV or Parquet output with one row per job_id; returns the rows kept
+
+    The scraper writes a row each time a job shows up under another sort/filter combination,
+    and each row's combinations only lists the ones seen up to then. The first row of each
+    job is kept, with combinations set to every combination any of its rows recorded.
+    Resumed Parquet parts are folded into the single file.
+    """
+    path = Path(path)
+    jobs = {}
+    combinations = {}
+    for row in _iter_rows(path):
+        job_id = row["job_id"]
+        jobs.setdefault(job_id, row)
+        seen = combinations.setdefault(job_id, [])
+        for combination in [(row.get("sort_method"), row.get("time_filter"))] + \
+                parse_combinations(row.get("combinations")):
+            if all(combination) and combination not in seen:
+                seen.append(combination)
+    for job_id, row in jobs.items():
+        row["combinations"] = format_combinations(combinations[job_id])
+
+    # Written beside the output and moved over it, so an interrupted rewrite leaves the original intact
+    merged_path = path.with_name(f"{path.stem}.merging{path.suffix}")
+    merged_path.unlink(missing_ok=True)
+    sink = ParquetSink(merged_path) if path.suffix == OUTPUT_FORMATS['parquet'] else CsvSink(merged_path)
+    try:
+        sink.write(list(jobs.values()))
+    finally:
+        sink.close()
+    parts = _part_paths(path) if path.suffix == OUTPUT_FORMATS['parquet'] else []
+    os.replace(merged_path, path)
+    for part in parts:
+        if part != path:
+            part.unlink()
+    logger.info("Merged %s to %s rows, one per job", path, len(jobs))
+    return len(jobs)
+
+
+def _iter_rows(path):
+    """Rows of a CSV or Parquet output as dicts, in file order"""
+    if path.suffix != OUTPUT_FORMATS['parquet']:
+        with open(path, encoding='utf-8', newline='') as f:
+            yield from csv.DictReader(f)
+        return
+    _load_pyarrow()
+    for part in _part_paths(path):
+        try:
+            table = pq.read_table(str(part))
+        except Exception as e:
+            logger.warning("Skipping unreadable Parquet file %s: %s", part, e)
+            continue
+        yield from table.to_pylist()
+
+
+def _load_pyarrow():
+    """Import pyarrow on first Parquet use"""
+    global pa, pq
+    if pa is None:
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError("Parquet output needs pyarrow: pip install pyarrow") from None
+        pa, pq = pyarrow, pyarrow.parquet
+
+
+def _to_text(value):
+    return None if value is None else str(value)
+
+
+def _read_store(path, read_fn):
+    from job_store import JobStore
+
+    store = JobStore(path)
+    try:
+        return read_fn(store)
+    finally:
+        store.close()
+
+
+def _part_paths(path):
+    """The file itself plus any resumed parts (name.part1.parquet, name.part2.parquet, ...)"""
+    parts = [path] if path.exists() else []
+    return parts + sorted(path.parent.glob(f"{path.stem}.part*{path.suffix}"))
+
+
+def _free_part_path(path):
+    """Return path, or the next part name a previous session has not completed a file at
+
+    A file without a footer (its session was killed before close) holds no durable rows and is overwritten.
+    """
+    candidate, n = path, 0
+    while candidate.exists() and _is_readable(candidate):
+        n += 1
+        candidate = path.with_name(f"{path.stem}.part{n}{path.suffix}")
+    return candidate
+
+
+def _is_readable(path):
+    try:
+        pq.ParquetFile(str(path))
+        return True
+    except Exception:
+        return False
@@ -0,0 +1,297 @@
+from collections import Counter
+from pathlib import Path
+import argparse
+import logging
+import sqlite3
+import zlib
+
+from it_keywords import TECH_KEYWORDS
+from job_store import DEFAULT_STORE_PATH, JobStore
+from keyword_matcher import KeywordMatcher
+from text_analytics import content_hash
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SKILL_INDEX_PATH = Path('data') / 'skill_index.sqlite'
+
+# Requirement keywords from the IT industry analysis notebook (requirement_keywords_categories)
+REQUIREMENT_KEYWORD_CATEGORIES = {
+    'Educational Requirements': [
+        'degree', 'bachelor', 'master', 'phd', 'diploma', 'certification', 'graduate', 'undergraduate',
+        'qualifications'
+    ],
+    'Technical Skills': [
+        'python', 'java', 'sql', 'cloud', 'aws', 'azure', 'gcp', 'javascript', 'react', 'angular', 'node.js',
+        '.net', 'c#', 'c++', 'data analysis', 'machine learning', 'cybersecurity', 'networking'
+    ],
+    'Soft Skills': [
+        'communication skills', 'leadership skills', 'problem-solving', 'teamwork', 'collaboration',
+        'time management', 'customer service', 'interpersonal skills', 'presentation skills', 'negotiation skills'
+    ],
+    'Experience Level Required': [
+        'years of experience', 'relevant experience', 'minimum experience', 'proven experience', 'experience in',
+        'prior experience'
+    ]
+}
+
+# Indexed skill terms by group; a term may belong to several groups
+SKILL_GROUPS = {'Tech Keywords': TECH_KEYWORDS, **REQUIREMENT_KEYWORD_CATEGORIES}
+
+# Posting fields indexed by exact value, to narrow skill queries to a company, industry, ...
+FACETS = ('company', 'industries', 'job_function', 'experience_level', 'employment_type')
+
+# Store columns read to (re)index a posting
+STORE_SOURCE_COLUMNS = ['job_id', 'title', 'description', *FACETS, 'last_seen']
+
+
+class SkillIndex:
+    """Inverted index from skill terms and facet values to the postings that have them
+
+    Each posting gets a dense document number, and each term's postings are a bitmap held as a
+    Python int (bit n set = document n mentions the term), so AND/OR/AND NOT queries and counts
+    run as big-integer operations instead of rescans of the descriptions. Bitmaps are stored
+    zlib-compressed in SQLite at path; save() only rewrites the bitmaps that changed.
+
+    Skills are matched in the lower-cased title and description as whole words, so 'java' does
+    not match inside 'javascript'.
+    """
+
+    def __init__(self, path=DEFAULT_SKILL_INDEX_PATH, skill_groups=SKILL_GROUPS):
+        self.path = Path(path)
+        self.matcher = KeywordMatcher(skill_groups)
+        # (kind, term) -> bitmap; kind is 'skill' or a facet name
+        self.bitmaps = {}
+        self.docs = {}
+        self.job_ids = []
+        self._hashes = {}
+        # Newest last_seen read from the job store, where the next update_from_store() starts
+        self.updated_at = None
+
+        self._conn = None
+        # Postings and bitmaps changed since the last save
+        self._dirty_docs = set()
+        self._dirty = set()
+        if self.path.exists():
+            self._load()
+
+    def skills_in(self, text):
+        """Distinct skill terms mentioned in a lower-cased text"""
+        return {keyword for start, end, keyword in self.matcher.iter_spans(text) if _is_whole_word(text, start, end)}
+
+    def update(self, df):
+        """Index new postings and re-index changed ones; returns the number of postings (re)indexed
+
+        df needs job_id, title and description; FACETS columns it lacks are left unindexed. A job_id
+        listed more than once (e.g. a CSV with a row per sort/filter combination) is indexed by its last row.
+        """
+        df = df.drop_duplicates('job_id', keep='last')
+        facets = [facet for facet in FACETS if facet in df.columns]
+        columns = [df['job_id'], df['title'], df['description']] + [df[facet] for facet in facets]
+        to_set = {}
+        changed = []
+        indexed = 0
+        for job_id, title, description, *values in zip(*columns):
+            job_id = str(job_id)
+            text = f"{_text(title)} {_text(description)}".lower()
+            digest = content_hash("\x1f".join([text] + [_text(value) for value in values]))
+            if self._hashes.get(job_id) == digest:
+                continue
+            doc = self.docs.get(job_id)
+            if doc is None:
+                doc = self.docs[job_id] = len(self.job_ids)
+                self.job_ids.append(job_id)
+            else:
+                changed.append(doc)
+            self._hashes[job_id] = digest
+            self._dirty_docs.add(job_id)
+            indexed += 1
+            for skill in self.skills_in(text):
+                to_set.setdefault(('skill', skill), []).append(doc)
+            for facet, value in zip(facets, values):
+                if _text(value):
+                    to_set.setdefault((facet, str(value)), []).append(doc)
+
+        if changed:
+            # A re-indexed posting first leaves every bitmap, then joins the ones it matches now
+            mask = _bitmap(changed)
+            for key, bitmap in self.bitmaps.items():
+                if bitmap & mask:
+                    self.bitmaps[key] = bitmap & ~mask
+                    self._dirty.add(key)
+        for key, docs in to_set.items():
+            self.bitmaps[key] = self.bitmaps.get(key, 0) | _bitmap(docs)
+            self._dirty.add(key)
+        return indexed
+
+    def update_from_store(self, store_path=DEFAULT_STORE_PATH):
+        """Index postings the store saved or saw again since the last update; returns the postings (re)indexed"""
+        store = JobStore(store_path)
+        try:
+            if self.updated_at:
+                df = store.to_dataframe("last_seen >= ?", (self.updated_at,), columns=STORE_SOURCE_COLUMNS)
+            else:
+                df = store.to_dataframe(columns=STORE_SOURCE_COLUMNS)
+        finally:
+            store.close()
+        if df.empty:
+            return 0
+        indexed = self.update(df)
+        self.updated_at = df['last_seen'].max()
+        logger.info("Skill index updated from %s: %s of %s postings (re)indexed", store_path, indexed, len(df))
+        return indexed
+
+    def query(self, all_of=(), any_of=(), none_of=(), **facets):
+        """Bitmap of the postings with every all_of skill, at least one any_of skill, no none_of skill
+        and the given facet values, e.g. query(all_of=['kubernetes', 'python'], company='WSO2')"""
+        result = (1 << len(self.job_ids)) - 1
+        for facet, value in facets.items():
+            if facet not in FACETS:
+                raise ValueError(f"Unknown facet: {facet}")
+            result &= self.bitmaps.get((facet, str(value)), 0)
+        for skill in all_of:
+            result &= self.bitmaps.get(('skill', skill.lower()), 0)
+        if any_of:
+            matches = 0
+            for skill in any_of:
+                matches |= self.bitmaps.get(('skill', skill.lower()), 0)
+            result &= matches
+        for skill in none_of:
+            result &= ~self.bitmaps.get(('skill', skill.lower()), 0)
+        return result
+
+    def find(self, all_of=(), any_of=(), none_of=(), **facets):
+        """job_ids of the postings matching query()"""
+        return [self.job_ids[doc] for doc in _doc_numbers(self.query(all_of, any_of, none_of, **facets))]
+
+    def count(self, all_of=(), any_of=(), none_of=(), **facets):
+        """Number of postings matching query()"""
+        return self.query(all_of, any_of, none_of, **facets).bit_count()
+
+    def skill_counts(self, group=None, **facets):
+        """Counter of postings per skill, optionally within one skill group and facet values"""
+        scope = self.query(**facets) if facets else None
+        counts = Counter()
+        for (kind, term), bitmap in self.bitmaps.items():
+            if kind != 'skill' or (group is not None and group not in self.matcher.groups.get(term, ())):
+                continue
+            count = (bitmap & scope if scope is not None else bitmap).bit_count()
+            if count:
+                counts[term] = count
+        return counts
+
+    def top_skills(self, n=10, group=None, **facets):
+        """The n skills mentioned by most postings, e.g. top_skills(industries='IT Services and IT Consulting')"""
+        return self.skill_counts(group, **facets).most_common(n)
+
+    def save(self):
+        """Write the postings and bitmaps changed since the last save in one transaction"""
+        conn = self._connect()
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('updated_at', ?)", (self.updated_at,))
+            conn.executemany(
+                "INSERT OR REPLACE INTO docs (job_id, doc, content_hash) VALUES (?, ?, ?)",
+                [(job_id, self.docs[job_id], self._hashes[job_id]) for job_id in self._dirty_docs]
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO bitmaps (kind, term, bitmap) VALUES (?, ?, ?)",
+                [(kind, term, _compress(self.bitmaps[(kind, term)])) for kind, term in self._dirty]
+            )
+        logger.info("Saved %s postings and %s changed bitmaps to %s", len(self._dirty_docs), len(self._dirty), self.path)
+        self._dirty_docs.clear()
+        self._dirty.clear()
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _load(self):
+        conn = self._connect()
+        row = conn.execute("SELECT value FROM meta WHERE key = 'updated_at'").fetchone()
+        self.updated_at = row[0] if row else None
+        for job_id, doc, digest in conn.execute("SELECT job_id, doc, content_hash FROM docs ORDER BY doc"):
+            self.docs[job_id] = doc
+            self.job_ids.append(job_id)
+            self._hashes[job_id] = digest
+        for kind, term, blob in conn.execute("SELECT kind, term, bitmap FROM bitmaps"):
+            self.bitmaps[(kind, term)] = int.from_bytes(zlib.decompress(blob), 'little')
+
+    def _connect(self):
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path))
+            with self._conn:
+                self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS docs (job_id TEXT PRIMARY KEY, doc INTEGER NOT NULL, content_hash TEXT)"
+                )
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS bitmaps "
+                    "(kind TEXT NOT NULL, term TEXT NOT NULL, bitmap BLOB NOT NULL, PRIMARY KEY (kind, term))"
+                )
+        return self._conn
+
+
+def refresh_skill_index(store_path=DEFAULT_STORE_PATH, index_path=DEFAULT_SKILL_INDEX_PATH):
+    """Post-scrape step: bring the saved skill index up to date with the job store; returns the postings (re)indexed"""
+    index = SkillIndex(index_path)
+    try:
+        indexed = index.update_from_store(store_path)
+        index.save()
+        return indexed
+    finally:
+        index.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Update the skill index from the job store")
+    parser.add_argument("--store", default=str(DEFAULT_STORE_PATH), help="SQLite job store to read")
+    parser.add_argument("--index", default=str(DEFAULT_SKILL_INDEX_PATH), help="skill index file to update")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    indexed = refresh_skill_index(args.store, args.index)
+    print(f"Indexed {indexed} new or changed postings into {args.index}")
+
+
+def _text(value):
+    # Missing values read back from CSV or pandas are NaN floats rather than None
+    return value if isinstance(value, str) else ""
+
+
+def _is_whole_word(text, start, end):
+    """True unless the match continues a word on either side (edges that are not word characters always count)"""
+    before = text[start - 1] if start else " "
+    after = text[end] if end < len(text) else " "
+    return not (_is_word_char(before) and _is_word_char(text[start])) and \
+        not (_is_word_char(after) and _is_word_char(text[end - 1]))
+
+
+def _is_word_char(char):
+    return char.isalnum() or char == "_"
+
+
+def _bitmap(docs):
+    """Bitmap with the bits of the given document numbers set"""
+    bits = bytearray(max(docs) // 8 + 1)
+    for doc in docs:
+        bits[doc >> 3] |= 1 << (doc & 7)
+    return int.from_bytes(bits, 'little')
+
+
+def _doc_numbers(bitmap):
+    """Document numbers whose bits are set, in order"""
+    data = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, 'little')
+    for offset, byte in enumerate(data):
+        if byte:
+            for bit in range(8):
+                if byte >> bit & 1:
+                    yield offset * 8 + bit
+
+
+def _compress(bitmap):
+    return zlib.compress(bitmap.to_bytes((bitmap.bit_length() + 7) // 8, 'little'))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+import job_categories
+from job_categories import JOB_CATEGORY_KEYWORDS, OTHER_CATEGORY, JobCategorizer, categorize_job, categorize_jobs
+
+ROWS = [
+    ("Senior Software Engineer", "Engineering and Information Technology"),
+    ("Data Scientist", None),
+    ("DevOps Engineer - AWS", "Information Technology"),
+    ("SOC Analyst", "Information Technology"),
+    ("Network Administrator", None),
+    ("QA Automation Engineer", "Quality Assurance"),
+    ("IT Support Executive", "Other"),
+    ("Scrum Master", "Project Management"),
+    ("UI/UX Designer", "Design"),
+    ("Technical Writer", "Writing/Editing"),
+    ("Blockchain Developer", "Engineering"),
+    ("Accountant", "Accounting/Auditing"),
+    ("Head Chef", "Hospitality"),
+    ("ML Engineer and Full Stack Developer", "Engineering"),
+    ("Sales Executive", "Data Analytics"),
+    ("İnsan Kaynakları Uzmanı", "HUMAN RESOURCES"),
+    ("", ""),
+]
+
+
+@pytest.fixture
+def jobs():
+    return pd.DataFrame(ROWS, columns=['title', 'job_function'], dtype=object)
+
+
+def expected(df):
+    return df.apply(categorize_job, axis=1).tolist()
+
+
+def test_dataframe_matches_categorize_job(jobs):
+    assert JobCategorizer().categorize(jobs).tolist() == expected(jobs)
+
+
+def test_arrow_table_matches_categorize_job(jobs):
+    table = pa.Table.from_pandas(jobs, preserve_index=False)
+    assert JobCategorizer().categorize(table).to_pylist() == expected(jobs)
+
+
+def test_automaton_fallback_matches_categorize_job(jobs, monkeypatch):
+    monkeypatch.setattr(job_categories, 'pa', None)
+    assert JobCategorizer().categorize(jobs).tolist() == expected(jobs)
+
+
+def test_every_keyword_gets_its_first_category():
+    titles = [keyword for keywords in JOB_CATEGORY_KEYWORDS.values() for keyword in keywords]
+    jobs = pd.DataFrame({'title': titles, 'job_function': [None] * len(titles)}, dtype=object)
+    categorizer = JobCategorizer()
+    assert categorizer.categorize(jobs).tolist() == expected(jobs)
+    assert [categorizer.categorize_text(f"{title} none") for title in titles] == expected(jobs)
+
+
+def test_categorize_jobs_adds_column(jobs):
+    df = categorize_jobs(jobs.copy())
+    assert df['job_category'].tolist() == expected(jobs)
+    assert OTHER_CATEGORY in df['job_category'].tolist()
+
+    table = categorize_jobs(categorize_jobs(pa.Table.from_pandas(jobs, preserve_index=False)))
+    assert table.column_names.count('job_category') == 1
+    assert table.column('job_category').to_pylist() == expected(jobs)
@@ -0,0 +1,191 @@
+from collections import Counter, namedtuple
+from functools import lru_cache
+from pathlib import Path
+import hashlib
+import logging
+import re
+import sqlite3
+import zlib
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOKEN_CACHE_PATH = Path('data') / 'cache' / 'description_tokens.sqlite'
+
+# The notebook's unigram tokenizer, now used for bigrams and trigrams as well
+TOKEN_PATTERN = re.compile(r'\b\w+\b')
+
+# Notebook filters: unigrams longer than 2 characters; joined bigrams/trigrams longer than 4/6
+MIN_UNIGRAM_LENGTH = 3
+MIN_NGRAM_LENGTH = {2: 5, 3: 7}
+
+# Descriptions looked up in / written to the token cache per query
+DEFAULT_BATCH_SIZE = 500
+
+# NLTK's English stopword list, used when nltk or its stopwords corpus is not installed
+ENGLISH_STOPWORDS = frozenset("""
+i me my myself we our ours ourselves you you're you've you'll you'd your yours yourself yourselves he him his
+himself she she's her hers herself it it's its itself they them their theirs themselves what which who whom this
+that that'll these those am is are was were be been being have has had having do does did doing a an the and but
+if or because as until while of at by for with about against between into through during before after above below
+to from up down in out on off over under again further then once here there when where why how all any both each
+few more most other some such no nor not only own same so than too very s t can will just don don't should
+should've now d ll m o re ve y ain aren aren't couldn couldn't didn didn't doesn doesn't hadn hadn't hasn hasn't
+haven haven't isn isn't ma mightn mightn't mustn mustn't needn needn't shan shan't shouldn shouldn't wasn wasn't
+weren weren't won won't wouldn wouldn't
+""".split())
+
+# Unigram, bigram and trigram Counters; n-gram keys are tuples as in the notebook
+NgramCounts = namedtuple('NgramCounts', ['unigrams', 'bigrams', 'trigrams'])
+
+
+@lru_cache(maxsize=1)
+def load_stopwords():
+    """English stopwords, loaded once per process (NLTK's corpus if available)"""
+    try:
+        from nltk.corpus import stopwords
+        return frozenset(stopwords.words('english'))
+    except (ImportError, LookupError):
+        return ENGLISH_STOPWORDS
+
+
+def tokenize(text):
+    """Lower-cased word tokens of a description"""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def content_hash(text):
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+class TokenCache:
+    """SQLite cache of tokenized descriptions keyed by job_id, valid while the description's hash matches"""
+
+    def __init__(self, path=DEFAULT_TOKEN_CACHE_PATH):
+        self.path = Path(path)
+        self._conn = None
+        self.hits = 0
+        self.misses = 0
+
+    def get_many(self, keys):
+        """{job_id: (content hash, tokens)} for the cached keys"""
+        conn = self._connect()
+        found = {}
+        for start in range(0, len(keys), DEFAULT_BATCH_SIZE):
+            chunk = keys[start:start + DEFAULT_BATCH_SIZE]
+            rows = conn.execute(
+                f"SELECT job_id, content_hash, tokens FROM tokens WHERE job_id IN ({','.join('?' * len(chunk))})",
+                chunk
+            )
+            for job_id, digest, blob in rows:
+                found[job_id] = (digest, zlib.decompress(blob).decode('utf-8').split(' ') if blob else [])
+        return found
+
+    def put_many(self, entries):
+        """Store (job_id, content hash, tokens) entries"""
+        conn = self._connect()
+        conn.executemany(
+            "INSERT OR REPLACE INTO tokens (job_id, content_hash, tokens) VALUES (?, ?, ?)",
+            [(job_id, digest, zlib.compress(' '.join(tokens).encode('utf-8'))) for job_id, digest, tokens in entries]
+        )
+        conn.commit()
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses}
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _connect(self):
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path))
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS tokens (job_id TEXT PRIMARY KEY, content_hash TEXT NOT NULL, tokens BLOB)"
+            )
+        return self._conn
+
+
+def iter_descriptions(data):
+    """(job_id, description) pairs from a DataFrame (keyed by job_id, else by content) or an iterable of pairs"""
+    if hasattr(data, 'columns'):
+        keys = data['job_id'] if 'job_id' in data.columns else [None] * len(data)
+        return zip(keys, data['description'])
+    return data
+
+
+def iter_token_streams(descriptions, cache=None, batch_size=DEFAULT_BATCH_SIZE):
+    """Yield the token list of each non-empty description, tokenizing only those the cache does not have
+
+    Descriptions are handled in batches of batch_size, so only one batch of text is held at a time.
+    """
+    batch = []
+    for job_id, description in descriptions:
+        if not isinstance(description, str):
+            continue
+        batch.append((job_id, description))
+        if len(batch) >= batch_size:
+            yield from _tokenize_batch(batch, cache)
+            batch = []
+    if batch:
+        yield from _tokenize_batch(batch, cache)
+
+
+def _tokenize_batch(batch, cache):
+    if cache is None:
+        return [tokenize(description) for _, description in batch]
+    digests = [content_hash(description) for _, description in batch]
+    # Postings without a job_id are cached under their content hash
+    keys = [str(job_id) if job_id is not None else digest for (job_id, _), digest in zip(batch, digests)]
+    cached = cache.get_many(list(dict.fromkeys(keys)))
+    streams = []
+    new_entries = []
+    for key, digest, (_, description) in zip(keys, digests, batch):
+        hit = cached.get(key)
+        if hit is not None and hit[0] == digest:
+            cache.hits += 1
+            streams.append(hit[1])
+        else:
+            cache.misses += 1
+            tokens = tokenize(description)
+            cached[key] = (digest, tokens)
+            new_entries.append((key, digest, tokens))
+            streams.append(tokens)
+    if new_entries:
+        cache.put_many(new_entries)
+    return streams
+
+
+def count_ngrams(data, cache=None, stopwords=None, batch_size=DEFAULT_BATCH_SIZE, max_terms=None):
+    """Unigram, bigram and trigram counts over all descriptions in one pass
+
+    data is a DataFrame with a description column (and job_id, for caching) or an iterable of
+    (job_id, description) pairs. Filters follow the notebook: unigrams are non-stopwords longer
+    than 2 characters; bigrams and trigrams are built from the alphabetic non-stopwords of each
+    description (they do not run across descriptions). With max_terms, each counter is pruned to
+    its max_terms most common entries whenever it grows past twice that, bounding memory at the
+    cost of approximate counts in the tail.
+    """
+    stopwords = load_stopwords() if stopwords is None else stopwords
+    unigrams, bigrams, trigrams = Counter(), Counter(), Counter()
+    for tokens in iter_token_streams(iter_descriptions(data), cache, batch_size):
+        unigrams.update(word for word in tokens if len(word) >= MIN_UNIGRAM_LENGTH and word not in stopwords)
+        words = [word for word in tokens if word not in stopwords and word.isalpha()]
+        bigrams.update(gram for gram in zip(words, words[1:]) if len(' '.join(gram)) >= MIN_NGRAM_LENGTH[2])
+        trigrams.update(
+            gram for gram in zip(words, words[1:], words[2:]) if len(' '.join(gram)) >= MIN_NGRAM_LENGTH[3]
+        )
+        if max_terms:
+            for counter in (unigrams, bigrams, trigrams):
+                if len(counter) > 2 * max_terms:
+                    _prune(counter, max_terms)
+    if cache is not None:
+        logger.info("Token cache: %s", cache.stats())
+    return NgramCounts(unigrams, bigrams, trigrams)
+
+
+def _prune(counter, keep):
+    kept = counter.most_common(keep)
+    counter.clear()
+    counter.update(dict(kept))
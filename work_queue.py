@@ -0,0 +1,194 @@
+from collections import namedtuple
+from pathlib import Path
+import logging
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUEUE_PATH = Path('data') / 'work_queue.sqlite'
+
+# A leased item whose worker has not finished it within this many seconds is handed out again
+DEFAULT_LEASE_TIMEOUT = 300
+
+# Attempts (leases) per item before it is marked failed
+DEFAULT_MAX_ATTEMPTS = 3
+
+# How long an idle worker waits before checking again for abandoned leases
+IDLE_POLL_INTERVAL = 10
+
+PENDING = 'pending'
+LEASED = 'leased'
+DONE = 'done'
+FAILED = 'failed'
+
+# One search page to scrape; keywords is '' for the plain location search
+WorkItem = namedtuple('WorkItem', ['id', 'location', 'keywords', 'sort_method', 'time_filter', 'start', 'attempts'])
+
+
+class WorkQueue:
+    """Queue of search pages in a SQLite file shared by a coordinator and any number of worker processes
+
+    Workers lease one item at a time and renew the lease while they work on it (heartbeat()). A
+    lease that is not completed or renewed within lease_timeout (the worker crashed or was killed)
+    expires and the item goes to the next worker that asks, up to max_attempts leases per item.
+    """
+
+    def __init__(self, path=DEFAULT_QUEUE_PATH, lease_timeout=DEFAULT_LEASE_TIMEOUT, max_attempts=DEFAULT_MAX_ATTEMPTS):
+        self.path = Path(path)
+        self.lease_timeout = lease_timeout
+        self.max_attempts = max_attempts
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit mode; lease() takes the write lock explicitly so two workers never get the same item
+        self._conn = sqlite3.connect(str(self.path), timeout=30, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS items ("
+            "id INTEGER PRIMARY KEY, location TEXT NOT NULL, keywords TEXT NOT NULL, sort_method TEXT NOT NULL, "
+            "time_filter TEXT NOT NULL, start INTEGER NOT NULL, status TEXT NOT NULL, attempts INTEGER NOT NULL, "
+            "lease_owner TEXT, lease_expires REAL, error TEXT, "
+            "UNIQUE (location, keywords, sort_method, time_filter, start))"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_items_status ON items (status)")
+
+    def enqueue(self, pages):
+        """Add (location, keywords, sort_method, time_filter, start) pages; returns how many were new"""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO items (location, keywords, sort_method, time_filter, start, status, attempts) "
+                "VALUES (?, ?, ?, ?, ?, ?, 0)",
+                [tuple(page) + (PENDING,) for page in pages]
+            )
+            added = self._conn.total_changes - before
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        logger.info("Queued %s search pages in %s", added, self.path)
+        return added
+
+    def lease(self, worker_id):
+        """Lease the next pending (or abandoned) item to worker_id; returns a WorkItem or None"""
+        now = time.time()
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Abandoned items that used up their attempts will not be retried
+            self._conn.execute(
+                "UPDATE items SET status = ?, error = 'lease expired' "
+                "WHERE status = ? AND lease_expires < ? AND attempts >= ?",
+                (FAILED, LEASED, now, self.max_attempts)
+            )
+            row = self._conn.execute(
+                "SELECT id, location, keywords, sort_method, time_filter, start, attempts FROM items "
+                "WHERE status = ? OR (status = ? AND lease_expires < ?) ORDER BY id LIMIT 1",
+                (PENDING, LEASED, now)
+            ).fetchone()
+            if row is None:
+                self._conn.execute("COMMIT")
+                return None
+            if row[-1]:
+                logger.info("Retrying work item %s (attempt %s)", row[0], row[-1] + 1)
+            self._conn.execute(
+                "UPDATE items SET status = ?, attempts = attempts + 1, lease_owner = ?, lease_expires = ? WHERE id = ?",
+                (LEASED, worker_id, now + self.lease_timeout, row[0])
+            )
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        return WorkItem(*row[:-1], row[-1] + 1)
+
+    def renew(self, item, worker_id):
+        """Push back the expiry of a lease worker_id still holds; False if it was lost"""
+        return _renew(self._conn, item, worker_id, self.lease_timeout)
+
+    def heartbeat(self, item, worker_id):
+        """Context manager that keeps item's lease alive from a background thread while it is processed"""
+        return LeaseHeartbeat(self.path, item, worker_id, self.lease_timeout)
+
+    def complete(self, item, worker_id):
+        """Mark a leased item done; False if the lease expired and was taken over by another worker"""
+        cursor = self._conn.execute(
+            "UPDATE items SET status = ?, lease_expires = NULL, error = NULL WHERE id = ? AND lease_owner = ? AND status = ?",
+            (DONE, item.id, worker_id, LEASED)
+        )
+        return cursor.rowcount == 1
+
+    def fail(self, item, worker_id, error):
+        """Give a leased item back for retry, or mark it failed once it has used all its attempts"""
+        status = FAILED if item.attempts >= self.max_attempts else PENDING
+        self._conn.execute(
+            "UPDATE items SET status = ?, lease_expires = NULL, error = ? WHERE id = ? AND lease_owner = ? AND status = ?",
+            (status, str(error), item.id, worker_id, LEASED)
+        )
+        logger.warning("Work item %s failed on attempt %s: %s", item.id, item.attempts, error)
+
+    def skip_rest(self, item):
+        """Drop the pending pages after item's page of the same query, once that query ran out of results"""
+        self._conn.execute(
+            "UPDATE items SET status = ?, error = 'query exhausted' WHERE status = ? AND location = ? "
+            "AND keywords = ? AND sort_method = ? AND time_filter = ? AND start > ?",
+            (DONE, PENDING, item.location, item.keywords, item.sort_method, item.time_filter, item.start)
+        )
+
+    def has_active_leases(self):
+        """True while any item is leased; an expired lease comes back for retry"""
+        row = self._conn.execute(
+            "SELECT 1 FROM items WHERE status = ? LIMIT 1", (LEASED,)
+        ).fetchone()
+        return row is not None
+
+    def stats(self):
+        """Item counts by status"""
+        return dict(self._conn.execute("SELECT status, COUNT(*) FROM items GROUP BY status").fetchall())
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class LeaseHeartbeat:
+    """Renews a lease every third of lease_timeout until the with block exits
+
+    A page's detail fetches can outlast the lease while the rate limiter backs off or a circuit
+    is open; without renewal the item would expire and a second worker scrape it again. The
+    thread uses its own connection, as SQLite connections belong to the thread that made them.
+    """
+
+    def __init__(self, path, item, worker_id, lease_timeout):
+        self.path = path
+        self.item = item
+        self.worker_id = worker_id
+        self.lease_timeout = lease_timeout
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"lease-{item.id}", daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        conn = sqlite3.connect(str(self.path), timeout=30, isolation_level=None)
+        try:
+            while not self._stop.wait(self.lease_timeout / 3):
+                if not _renew(conn, self.item, self.worker_id, self.lease_timeout):
+                    logger.warning("Lost the lease on work item %s", self.item.id)
+                    return
+        finally:
+            conn.close()
+
+
+def _renew(conn, item, worker_id, lease_timeout):
+    cursor = conn.execute(
+        "UPDATE items SET lease_expires = ? WHERE id = ? AND lease_owner = ? AND status = ?",
+        (time.time() + lease_timeout, item.id, worker_id, LEASED)
+    )
+    return cursor.rowcount == 1